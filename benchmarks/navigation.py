@@ -0,0 +1,197 @@
+"""Headless navigation latency benchmarks for the Linux TUI Tutorial
+
+Drives LinuxTutorialApp through Textual's test pilot, replaying scripted
+key sequences and recording per-action latency percentiles, widget counts
+and peak memory.
+
+    python -m benchmarks.navigation run --output baseline.json
+    python -m benchmarks.navigation compare baseline.json current.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import platform
+import resource
+import sys
+import time
+import tracemalloc
+from typing import Dict, List
+
+
+SCENARIOS: Dict[str, List[str]] = {
+    "tier-switch": ["1", "2", "3", "escape"],
+    "open-basic-topics": ["1", "down", "down", "enter", "down", "enter", "down", "enter", "escape"],
+    "open-advanced-topics": ["3", "down", "down", "enter", "down", "enter", "down", "enter", "escape"],
+    "scroll-topic": ["3", "down", "down", "down", "down", "down", "down", "down", "down", "enter",
+                     "tab", "pagedown", "pagedown", "pagedown", "pageup", "end", "home", "escape"],
+    "help-and-back": ["h", "escape", "h", "escape"],
+    "search": ["slash", "s", "t", "r", "a", "c", "e", "enter", "escape"],
+}
+
+PERCENTILES = (50, 95, 99)
+
+# An unbound key; its latency is the pilot's own per-press overhead, which
+# is subtracted from every action to report net latencies.
+CALIBRATION_KEY = "f19"
+
+
+def percentile(samples: List[float], percent: int) -> float:
+    """Nearest-rank percentile of a list of samples"""
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, math.ceil(percent / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def summarize(samples: List[float], overhead_ms: float = 0.0) -> Dict[str, float]:
+    """Summarize latency samples in milliseconds, with net values after overhead"""
+    summary = {f"p{percent}": percentile(samples, percent) * 1000 for percent in PERCENTILES}
+    for percent in PERCENTILES:
+        summary[f"net_p{percent}"] = max(0.0, summary[f"p{percent}"] - overhead_ms)
+    summary["mean"] = sum(samples) / len(samples) * 1000
+    summary["count"] = len(samples)
+    return summary
+
+
+async def replay(keys: List[str], iterations: int, size, latencies: Dict[str, List[float]]) -> Dict[str, Dict[str, int]]:
+    """Replay a key sequence against a fresh app and return widget and intent counts"""
+    from main import LinuxTutorialApp
+
+    app = LinuxTutorialApp()
+    max_widgets = 0
+    async with app.run_test(size=size) as pilot:
+        await pilot.pause()
+        for _ in range(iterations):
+            started = time.perf_counter()
+            await pilot.press(CALIBRATION_KEY)
+            await pilot.pause()
+            latencies.setdefault(CALIBRATION_KEY, []).append(time.perf_counter() - started)
+        for _ in range(iterations):
+            for key in keys:
+                started = time.perf_counter()
+                await pilot.press(key)
+                await pilot.pause()
+                latencies.setdefault(key, []).append(time.perf_counter() - started)
+            max_widgets = max(max_widgets, len(list(app.screen.walk_children())))
+        final_widgets = len(list(app.screen.walk_children()))
+        intents = {"submitted": app.intents.submitted, "skipped": app.intents.skipped}
+    return {"widgets": {"max": max_widgets, "final": final_widgets}, "intents": intents}
+
+
+def run_scenario(keys: List[str], iterations: int, size) -> Dict:
+    """Measure one scenario: latency first, then peak memory in a separate pass
+
+    tracemalloc slows the interpreter down considerably, so memory is
+    measured on a single untimed iteration.
+    """
+    latencies: Dict[str, List[float]] = {}
+    counts = asyncio.run(replay(keys, iterations, size, latencies))
+
+    tracemalloc.start()
+    asyncio.run(replay(keys, 1, size, {}))
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    calibration = summarize(latencies.pop(CALIBRATION_KEY))
+    overhead = calibration["p50"]
+    all_samples = [sample for samples in latencies.values() for sample in samples]
+    return {
+        "calibration": calibration,
+        "actions": {key: summarize(samples, overhead) for key, samples in latencies.items()},
+        "overall": summarize(all_samples, overhead),
+        "widgets": counts["widgets"],
+        "intents": counts["intents"],
+        "peak_traced_memory_kb": peak_memory // 1024,
+    }
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the selected scenarios and save the results as JSON"""
+    names = args.scenario or list(SCENARIOS)
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "iterations": args.iterations,
+            "size": list(args.size),
+        },
+        "scenarios": {},
+    }
+    for name in names:
+        result = run_scenario(SCENARIOS[name], args.iterations, tuple(args.size))
+        results["scenarios"][name] = result
+        overall = result["overall"]
+        print(
+            f"{name:22} net p50 {overall['net_p50']:7.2f} ms  p95 {overall['net_p95']:7.2f} ms  "
+            f"p99 {overall['net_p99']:7.2f} ms  widgets {result['widgets']['max']:3}  "
+            f"(pilot overhead {result['calibration']['p50']:.2f} ms)"
+        )
+    results["meta"]["peak_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    with open(args.output, "w") as output:
+        json.dump(results, output, indent=2, sort_keys=True)
+    print(f"Saved results to {args.output}")
+    return 0
+
+
+def compare(args: argparse.Namespace) -> int:
+    """Compare two result files and flag regressions"""
+    with open(args.baseline) as baseline_file:
+        baseline = json.load(baseline_file)["scenarios"]
+    with open(args.current) as current_file:
+        current = json.load(current_file)["scenarios"]
+
+    regressions = []
+    for name, result in current.items():
+        if name not in baseline:
+            continue
+        for action, stats in result["actions"].items():
+            before = baseline[name]["actions"].get(action)
+            if before is None:
+                continue
+            for metric in ("net_p50", "net_p95"):
+                old, new = before[metric], stats[metric]
+                if new - old > args.min_ms and new > old * (1 + args.threshold):
+                    regressions.append(f"{name} [{action}] {metric}: {old:.2f} ms -> {new:.2f} ms")
+        old_widgets, new_widgets = baseline[name]["widgets"]["max"], result["widgets"]["max"]
+        if new_widgets > old_widgets:
+            regressions.append(f"{name} widgets: {old_widgets} -> {new_widgets}")
+        old_memory, new_memory = baseline[name]["peak_traced_memory_kb"], result["peak_traced_memory_kb"]
+        if new_memory > old_memory * (1 + args.threshold):
+            regressions.append(f"{name} peak memory: {old_memory} KB -> {new_memory} KB")
+
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if not regressions:
+        print("No regressions")
+    return 1 if regressions else 0
+
+
+def main(argv=None) -> int:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Navigation latency benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run scenarios and save results")
+    run_parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS))
+    run_parser.add_argument("--iterations", type=int, default=10)
+    run_parser.add_argument("--size", type=int, nargs=2, default=(120, 40), metavar=("COLS", "ROWS"))
+    run_parser.add_argument("--output", default="bench_results.json")
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = commands.add_parser("compare", help="flag regressions against a baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.2,
+                                help="relative slowdown that counts as a regression")
+    compare_parser.add_argument("--min-ms", type=float, default=1.0,
+                                help="ignore latency changes smaller than this")
+    compare_parser.set_defaults(handler=compare)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+"""Permission audit panel for the Linux TUI Tutorial"""
+
+import grp
+import pwd
+from typing import Callable, Dict, List, Optional
+
+from rich.text import Text
+from textual import work
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.content import Content
+from textual.worker import get_current_worker
+from textual.widgets import DataTable, Input, Static
+
+from components.live_panel import LivePanel
+from system.permission_audit import ORPHANED, SGID, SUID, WORLD_WRITABLE, AuditStats, Finding, PermissionAudit
+
+
+COLUMNS = ("Issue", "Mode", "Owner", "Group", "Path")
+# Issues from most to least severe, the order of a sort by issue
+SEVERITY = {issue: rank for rank, issue in enumerate((SUID, SGID, WORLD_WRITABLE, ORPHANED))}
+
+
+class AuditPanel(LivePanel):
+    """Table of risky permissions under chosen roots, like a set of find -perm checks
+
+    An audit starts only when asked for (Enter in the roots box, or F5),
+    runs in a worker thread and is cancelled if the panel is hidden.
+    Findings are added to the table as they are found. Selecting a column
+    header (or pressing s) sorts by that column; selecting it again reverses
+    the order. All findings are kept in a list, sorted once an audit ends,
+    and the table shows the first ROWS of them, since a DataTable's repaint
+    cost grows with its row count and orphaned files can number in the tens
+    of thousands.
+    """
+
+    TITLE = "Audit"
+    ROWS = 500
+    BACKGROUND_GROUPS = ("audit",)
+
+    BINDINGS = [
+        Binding("f5", "audit", "Re-audit"),
+        Binding("s", "next_sort", "Sort"),
+    ]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sort_column: Optional[str] = None
+        self.sort_reverse = False
+        self.findings: List[Finding] = []
+        # Findings in the table, when it is sorted
+        self._shown: List[Finding] = []
+        self._users: Dict[int, str] = {}
+        self._groups: Dict[int, str] = {}
+
+    def compose(self) -> ComposeResult:
+        yield Input("/", placeholder="Roots to audit, separated by spaces", id="audit-roots")
+        yield Static("Press Enter or F5 to audit these roots", id="audit-status")
+        yield DataTable(id="audit-table", cursor_type="row", zebra_stripes=True)
+
+    def on_mount(self) -> None:
+        self.styles.padding = (0, 1)
+        table = self.query_one("#audit-table", DataTable)
+        for column in COLUMNS:
+            table.add_column(column, key=column)
+
+    def refresh_data(self) -> None:
+        """Nothing to poll: audits only run when asked for"""
+
+    def action_audit(self) -> None:
+        """Audit the roots in the input box, replacing the previous findings"""
+        roots = self.query_one("#audit-roots", Input).value.split() or ["/"]
+        self.findings = []
+        self._shown = []
+        self.query_one("#audit-table", DataTable).clear()
+        self.query_one("#audit-status", Static).update(Content(f"Auditing {' '.join(roots)}…"))
+        self._audit(roots)
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        event.stop()
+        self.action_audit()
+
+    @work(thread=True, exclusive=True, group="audit", exit_on_error=False)
+    def _audit(self, roots: List[str]) -> None:
+        """Run the audit off the main thread; a newer audit cancels this one"""
+        worker = get_current_worker()
+
+        def add(findings: List[Finding]) -> None:
+            if not worker.is_cancelled:
+                self.app.call_from_thread(self._add_findings, findings)
+
+        try:
+            stats = PermissionAudit(roots).run(add, lambda: worker.is_cancelled)
+        except OSError as error:
+            stats = AuditStats(errors=1)
+            self.app.call_from_thread(self.notify, f"Audit failed: {error}", severity="error")
+        if not worker.is_cancelled:
+            self.app.call_from_thread(self._audit_finished, stats)
+
+    def _add_findings(self, findings: List[Finding]) -> None:
+        """Add a batch of findings, appending them to the table or placing them in its sort order"""
+        self.findings.extend(findings)
+        if self.sort_column is not None:
+            # Only the shown rows are kept in order while auditing; every
+            # finding is sorted once when the audit ends
+            shown = sorted(self._shown + findings, key=self._sort_key(), reverse=self.sort_reverse)[:self.ROWS]
+            if shown != self._shown:
+                self._show_rows(shown)
+        else:
+            table = self.query_one("#audit-table", DataTable)
+            table.add_rows(self._row(finding) for finding in findings[:max(self.ROWS - table.row_count, 0)])
+        self.query_one("#audit-status", Static).update(f"Auditing… {len(self.findings):,} findings so far")
+
+    def _audit_finished(self, stats: AuditStats) -> None:
+        if self.sort_column is not None:
+            self._sort()
+        shown = f", first {self.ROWS:,} shown" if len(self.findings) > self.ROWS else ""
+        errors = f", {stats.errors:,} unreadable directories" if stats.errors else ""
+        self.query_one("#audit-status", Static).update(
+            f"{stats.findings:,} findings in {stats.files:,} files, {stats.elapsed:.1f}s{shown}{errors}"
+        )
+
+    def on_data_table_header_selected(self, event: DataTable.HeaderSelected) -> None:
+        event.stop()
+        column = str(event.column_key.value)
+        self.sort_reverse = not self.sort_reverse if column == self.sort_column else False
+        self.sort_column = column
+        self._sort()
+
+    def action_next_sort(self) -> None:
+        """Sort by the next column"""
+        index = COLUMNS.index(self.sort_column) + 1 if self.sort_column in COLUMNS else 0
+        self.sort_column = COLUMNS[index % len(COLUMNS)]
+        self.sort_reverse = False
+        self._sort()
+
+    def background_work_cancelled(self) -> None:
+        if self.sort_column is not None:
+            self._sort()
+        self.query_one("#audit-status", Static).update(
+            f"Audit stopped, {len(self.findings):,} findings so far (Enter or F5 audits again)"
+        )
+
+    def _sort_key(self) -> Callable[[Finding], object]:
+        keys: Dict[str, Callable[[Finding], object]] = {
+            "Issue": lambda finding: (SEVERITY[finding.issue], finding.path),
+            "Mode": lambda finding: finding.mode,
+            "Owner": lambda finding: self._user(finding.uid),
+            "Group": lambda finding: self._group(finding.gid),
+            "Path": lambda finding: finding.path,
+        }
+        return keys[self.sort_column]
+
+    def _sort(self) -> None:
+        """Sort the findings by the sort column and show the first ROWS"""
+        self.findings.sort(key=self._sort_key(), reverse=self.sort_reverse)
+        self._show_rows(self.findings[:self.ROWS])
+
+    def _show_rows(self, findings: List[Finding]) -> None:
+        self._shown = findings
+        table = self.query_one("#audit-table", DataTable)
+        table.clear()
+        table.add_rows(self._row(finding) for finding in findings)
+
+    def _row(self, finding: Finding) -> tuple:
+        # Text cells, since file names may contain markup such as "[/x]"
+        return (
+            finding.issue, finding.mode, Text(self._user(finding.uid)), Text(self._group(finding.gid)),
+            Text(finding.path),
+        )
+
+    def _user(self, uid: int) -> str:
+        """User name, or the bare uid for orphaned files"""
+        name = self._users.get(uid)
+        if name is None:
+            try:
+                name = pwd.getpwuid(uid).pw_name
+            except KeyError:
+                name = str(uid)
+            self._users[uid] = name
+        return name
+
+    def _group(self, gid: int) -> str:
+        """Group name, or the bare gid for orphaned files"""
+        name = self._groups.get(gid)
+        if name is None:
+            try:
+                name = grp.getgrgid(gid).gr_name
+            except KeyError:
+                name = str(gid)
+            self._groups[gid] = name
+        return name
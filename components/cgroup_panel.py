@@ -0,0 +1,158 @@
+"""cgroup explorer panel for the Linux TUI Tutorial"""
+
+from typing import List, Optional, Set
+
+from rich.text import Text
+from textual import work
+from textual.app import ComposeResult
+from textual.widgets import Static, Tree
+from textual.widgets.tree import TreeNode
+
+from components.live_panel import LivePanel
+from components.monitor_panel import format_kb
+from system.cgroups import CgroupNode, CgroupStats, CgroupTree, find_cgroup2_root
+
+
+HEADER = f"{'CPU%':>6} {'Memory':>10} {'Read/s':>12} {'Write/s':>12} {'Pids':>5}  cgroup"
+
+
+class CgroupPanel(LivePanel):
+    """Collapsible tree of cgroups with their CPU, memory, I/O and task figures
+
+    Only what is on screen is read: a cgroup's children are listed when it
+    is expanded, and each refresh reads the controller files of the visible
+    cgroups in a worker thread, so hosts with thousands of cgroups cost no
+    more than the handful being looked at. Readings are cached for the
+    refresh interval, which + and - change as in other live panels.
+    """
+
+    TITLE = "cgroups"
+    INTERVAL = 2.0
+    # Children listed under each cgroup, by name
+    CHILDREN = 200
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cgroups: Optional[CgroupTree] = None
+        self.stats = CgroupStats()
+        self._refreshing = False
+        # Refresh again once the running refresh is done, to read newly listed cgroups
+        self._pending = False
+        self._expanded: Set[str] = set()
+
+    def compose(self) -> ComposeResult:
+        yield Static("Looking for the cgroup v2 hierarchy…", id="cgroup-status")
+        yield Tree("", id="cgroup-tree")
+
+    def on_mount(self) -> None:
+        self.styles.padding = (0, 1)
+        root = find_cgroup2_root()
+        if root is None:
+            self.query_one("#cgroup-status", Static).update("No cgroup v2 hierarchy is mounted")
+            return
+        self.cgroups = CgroupTree(root, self.interval)
+        self._expanded = {root}
+        tree = self.query_one("#cgroup-tree", Tree)
+        tree.show_root = True
+        tree.root.data = self.cgroups.root
+        tree.root.expand()
+
+    def action_change_interval(self, factor: float) -> None:
+        super().action_change_interval(factor)
+        if self.cgroups is not None:
+            self.cgroups.interval = self.interval
+
+    def refresh_data(self) -> None:
+        """Read the visible cgroups unless the previous refresh is still running"""
+        if self.cgroups is None or self._refreshing:
+            return
+        visible: List[CgroupNode] = []
+        expanded: List[CgroupNode] = []
+        self._collect(self.query_one("#cgroup-tree", Tree).root, visible, expanded)
+        self._refreshing = True
+        self._refresh_cgroups(self.cgroups, visible, expanded)
+
+    def _collect(self, node: TreeNode, visible: List[CgroupNode], expanded: List[CgroupNode]) -> None:
+        """Gather the cgroups shown under a tree node, and the expanded ones"""
+        if node.data is None:
+            return
+        visible.append(node.data)
+        if node.is_expanded:
+            expanded.append(node.data)
+            for child in node.children:
+                self._collect(child, visible, expanded)
+
+    @work(thread=True, group="cgroups", exit_on_error=False)
+    def _refresh_cgroups(self, cgroups: CgroupTree, visible: List[CgroupNode], expanded: List[CgroupNode]) -> None:
+        """Read controller files off the main thread"""
+        try:
+            stats = cgroups.refresh(visible, expanded)
+        finally:
+            self._refreshing = False
+        self.app.call_from_thread(self._refreshed, stats)
+
+    def _refreshed(self, stats: CgroupStats) -> None:
+        self.stats = stats
+        self._sync(self.query_one("#cgroup-tree", Tree).root)
+        if self._pending:
+            self._pending = False
+            self.refresh_data()
+        self.query_one("#cgroup-status", Static).update(
+            f"{stats.read + stats.cached:,} cgroups shown, {stats.read:,} read in {stats.elapsed * 1000:.0f} ms\n{HEADER}"
+        )
+
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
+        event.stop()
+        if event.node.data is None or self.cgroups is None:
+            return
+        self._expanded.add(event.node.data.path)
+        # The worker lists the children; a second refresh reads their figures
+        self._pending = True
+        self.refresh_data()
+
+    def on_tree_node_collapsed(self, event: Tree.NodeCollapsed) -> None:
+        event.stop()
+        if event.node.data is not None:
+            self._expanded.discard(event.node.data.path)
+
+    def _sync(self, node: TreeNode) -> None:
+        """Bring a tree node's label and, if expanded, its children up to date"""
+        cgroup: Optional[CgroupNode] = node.data
+        if cgroup is None:
+            return
+        # Read once: the refresh thread replaces the dict when it re-lists
+        listed = cgroup.children
+        names = sorted(listed) if listed is not None else []
+        node.set_label(self._label(cgroup, node.parent is None, len(names)))
+        node.allow_expand = listed is None or bool(listed)
+        if not node.is_expanded or listed is None:
+            return
+        children = [listed[name] for name in names[:self.CHILDREN]]
+        if [child.data for child in node.children] != children:
+            node.remove_children()
+            for child in children:
+                node.add("", child, expand=child.path in self._expanded)
+        for child_node in node.children:
+            self._sync(child_node)
+
+    def _label(self, cgroup: CgroupNode, is_root: bool, children: int) -> Text:
+        usage = cgroup.usage
+        cpu = f"{usage.cpu_percent:.1f}" if usage.cpu_percent is not None else "-"
+        memory = format_kb(usage.memory_bytes // 1024) if usage.memory_bytes is not None else "-"
+        pids = str(usage.pids) if usage.pids is not None else "-"
+        name = cgroup.name if is_root else cgroup.name + "/"
+        if cgroup.error:
+            name += f" ({cgroup.error})"
+        elif children > self.CHILDREN:
+            name += f" (first {self.CHILDREN} of {children:,})"
+        # Text, since cgroup names may contain markup such as "[b]"
+        return Text(
+            f"{cpu:>6} {memory:>10} {self._rate(usage.io_read_rate):>12} "
+            f"{self._rate(usage.io_write_rate):>12} {pids:>5}  {name}"
+        )
+
+    @staticmethod
+    def _rate(rate: Optional[float]) -> str:
+        if rate is None:
+            return "-"
+        return format_kb(int(rate) // 1024) + "/s"
@@ -0,0 +1,135 @@
+"""Live command runner panel for the Linux TUI Tutorial"""
+
+from typing import List, Optional
+
+from textual import work
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Vertical
+from textual.content import Content
+from textual.widgets import Log, OptionList, Static
+from textual.widgets.option_list import Option
+
+from data.command_index import CommandRecord, get_command_index
+from system.runner import ALLOWED_COMMANDS, CommandRunner, RunResult, runnable_command
+
+
+class CommandRunnerPanel(Vertical):
+    """Lists the runnable commands of a topic and streams their output
+
+    Only allowlisted, read-only commands can be run (see system.runner).
+    Output is appended to a Log as it arrives, which only renders the
+    visible lines, and the Log keeps at most MAX_LINES lines.
+    """
+
+    MAX_LINES = 10_000
+    TIMEOUT = 30.0
+
+    BINDINGS = [
+        Binding("escape", "close", "Close Runner"),
+        Binding("ctrl+c", "stop", "Stop"),
+    ]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._commands: List[str] = []
+        self._runs = 0
+        self._running = False
+        self._set_open(False)
+
+    def compose(self) -> ComposeResult:
+        yield Static(id="runner-status")
+        yield OptionList(id="runner-commands")
+        yield Log(max_lines=self.MAX_LINES, id="runner-output")
+
+    def on_mount(self) -> None:
+        """Configure the panel layout"""
+        self.styles.height = "45%"
+        self.styles.border_top = ("solid", "white")
+        commands = self.query_one("#runner-commands", OptionList)
+        commands.styles.height = "auto"
+        commands.styles.max_height = 6
+        output = self.query_one("#runner-output", Log)
+        output.styles.height = "1fr"
+
+    def _set_open(self, is_open: bool) -> None:
+        """Show or hide the panel, keeping it out of the focus chain while hidden"""
+        self.display = is_open
+        self.disabled = not is_open
+
+    def open(self, tier: Optional[str] = None, topic_id: Optional[str] = None) -> None:
+        """Show the panel with the runnable commands of a topic
+
+        Without a topic, or for a topic with nothing runnable, every
+        allowlisted command is offered.
+        """
+        records: List[CommandRecord] = []
+        if tier is not None and topic_id is not None:
+            records = get_command_index().for_topic(tier, topic_id)
+        # Commands that report until interrupted are offered in their bounded form
+        runnable = (runnable_command(record.command) for record in records)
+        commands = list(dict.fromkeys(command for command in runnable if command is not None))
+        self._commands = commands or sorted(ALLOWED_COMMANDS)
+        options = self.query_one("#runner-commands", OptionList)
+        options.clear_options()
+        options.add_options(Option(Content(f"$ {command}")) for command in self._commands)
+        self._set_open(True)
+        options.focus()
+        options.highlighted = 0
+        if not self._running:
+            self._set_status("Pick a command to run (read-only commands only)")
+
+    def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
+        """Run the chosen command"""
+        event.stop()
+        self.run_command(self._commands[event.option_index])
+
+    def run_command(self, command: str) -> None:
+        """Run a command, replacing any command still running"""
+        self._set_open(True)
+        output = self.query_one("#runner-output", Log)
+        output.clear()
+        self._set_status(f"$ {command}  running…")
+        self._runs += 1
+        self._running = True
+        self._run(command, self._runs)
+
+    @work(exclusive=True, group="run", exit_on_error=False)
+    async def _run(self, command: str, run: int) -> None:
+        """Stream a command's output into the log"""
+        output = self.query_one("#runner-output", Log)
+
+        def write(text: str) -> None:
+            # A newer run owns the log once it has started
+            if run == self._runs:
+                output.write(text)
+
+        runner = CommandRunner(command, write, timeout=self.TIMEOUT)
+        result: Optional[RunResult] = None
+        try:
+            result = await runner.run()
+        finally:
+            # Stopped or superseded runs have already had their process killed
+            if run == self._runs:
+                self._running = False
+                if result is None:
+                    self._set_status(f"$ {command}  cancelled")
+        self._show_result(result)
+
+    def _show_result(self, result: RunResult) -> None:
+        """Report how a run ended"""
+        size = result.output_bytes / 1024
+        self._set_status(f"$ {result.command}  {result.status}  ({size:.0f} KiB in {result.elapsed:.1f}s)")
+
+    def _set_status(self, text: str) -> None:
+        self.query_one("#runner-status", Static).update(Content(text))
+
+    def action_stop(self) -> None:
+        """Stop the running command"""
+        self.workers.cancel_group(self, "run")
+
+    def action_close(self) -> None:
+        """Stop any running command, hide the panel and return focus to the content"""
+        self.action_stop()
+        self._set_open(False)
+        self.app.query_one("#main-content").viewer.focus()
@@ -0,0 +1,140 @@
+"""Virtualized, line-based content viewer for the Linux TUI Tutorial"""
+
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple, Union
+
+from rich.style import Style
+from textual.content import Content
+from textual.geometry import Size
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+
+
+class LineLayout:
+    """Content split into lines and folded to a fixed width
+
+    Each source line occupies ceil(cell length / width) rows. Row offsets
+    are kept as a prefix sum so any row maps back to its source line with
+    a bisect, and a line is only rendered to a strip when one of its rows
+    is first displayed.
+    """
+
+    def __init__(self, lines: List[Content], width: int):
+        self.lines = lines
+        self.width = max(width, 1)
+        self.row_starts: List[int] = []
+        row = 0
+        for line in lines:
+            self.row_starts.append(row)
+            row += max(1, -(-line.cell_length // self.width))
+        self.height = row
+        self.max_width = min(self.width, max((line.cell_length for line in lines), default=0))
+        self._strips: Dict[Tuple[int, Style], Strip] = {}
+
+    @classmethod
+    def from_content(cls, content: Content, width: int) -> "LineLayout":
+        """Split parsed content into lines and lay them out for a width"""
+        return cls(content.split("\n", allow_blank=True), width)
+
+    def relayout(self, width: int) -> "LineLayout":
+        """Get a layout of the same lines for another width"""
+        return type(self)(self.lines, width)
+
+    def line_strip(self, line_no: int, style: Style) -> Strip:
+        """Render a whole source line to an uncropped strip"""
+        key = (line_no, style)
+        strip = self._strips.get(key)
+        if strip is None:
+            line = self.lines[line_no]
+            strip = Strip(line.render_segments(), line.cell_length).apply_style(style)
+            self._strips[key] = strip
+        return strip
+
+    def row_strip(self, row: int, style: Style) -> Strip:
+        """Render one folded row"""
+        if not 0 <= row < self.height:
+            return Strip.blank(self.width, style)
+        line_no = bisect_right(self.row_starts, row) - 1
+        offset = (row - self.row_starts[line_no]) * self.width
+        return self.line_strip(line_no, style).crop_extend(offset, offset + self.width, style)
+
+    def line_row(self, line_no: int) -> int:
+        """Get the first row of a source line"""
+        if not self.row_starts:
+            return 0
+        return self.row_starts[min(max(line_no, 0), len(self.row_starts) - 1)]
+
+    def warm(self, first_row: int, last_row: int, style: Style) -> None:
+        """Render the source lines covering a range of rows ahead of time"""
+        if not self.row_starts:
+            return
+        first_line = bisect_right(self.row_starts, max(first_row, 0)) - 1
+        last_line = bisect_right(self.row_starts, min(last_row, self.height - 1)) - 1
+        for line_no in range(first_line, last_line + 1):
+            self.line_strip(line_no, style)
+
+
+class ContentViewer(ScrollView, can_focus=True):
+    """Scrollable viewer that renders only the visible rows of its content"""
+
+    OVERSCAN = 8
+
+    def __init__(self, content: Union[Content, LineLayout], *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if not isinstance(content, LineLayout):
+            content = LineLayout.from_content(content, 1)
+        self._layout = content
+        self.virtual_size = Size(content.max_width, content.height)
+        self._pending_line: Optional[int] = None
+
+    @property
+    def layout(self) -> LineLayout:
+        """The layout being displayed"""
+        return self._layout
+
+    @property
+    def top_line(self) -> int:
+        """The source line at the top of the viewer"""
+        return max(bisect_right(self._layout.row_starts, self.scroll_offset.y) - 1, 0)
+
+    @property
+    def layout_width(self) -> int:
+        """Width available for content rows"""
+        return self.scrollable_content_region.width
+
+    def show_layout(self, layout: LineLayout) -> None:
+        """Display a layout and reset the scroll position to the top"""
+        if layout.width != self.layout_width and self.layout_width:
+            layout = layout.relayout(self.layout_width)
+        self._layout = layout
+        self.virtual_size = Size(layout.max_width, layout.height)
+        self.scroll_to(0, 0, animate=False, immediate=True)
+        self.refresh()
+
+    def scroll_to_line(self, line_no: int) -> None:
+        """Scroll so that a source line is at the top of the viewer"""
+        if not self.layout_width:
+            # Not laid out yet; scroll once the viewer has a size
+            self._pending_line = line_no
+            return
+        self.scroll_to(y=self._layout.line_row(line_no), animate=False)
+
+    def on_resize(self) -> None:
+        """Fold the content again when the available width changes"""
+        width = self.layout_width
+        if width and width != self._layout.width:
+            top_line = self.top_line
+            self._layout = self._layout.relayout(width)
+            self.virtual_size = Size(self._layout.max_width, self._layout.height)
+            self.scroll_to(y=self._layout.line_row(top_line), animate=False, immediate=True)
+        if width and self._pending_line is not None:
+            line_no, self._pending_line = self._pending_line, None
+            self.call_after_refresh(self.scroll_to_line, line_no)
+
+    def render_line(self, y: int) -> Strip:
+        """Render one visible row"""
+        row = self.scroll_offset.y + y
+        style = self.rich_style
+        if y == self.size.height - 1:
+            self._layout.warm(row + 1, row + self.OVERSCAN, style)
+        return self._layout.row_strip(row, style).apply_offsets(0, row)
@@ -0,0 +1,149 @@
+"""Disk usage explorer panel for the Linux TUI Tutorial"""
+
+import os
+from typing import Optional, Set
+
+from rich.text import Text
+from textual import work
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.content import Content
+from textual.worker import get_current_worker
+from textual.widgets import Input, Static, Tree
+from textual.widgets.tree import TreeNode
+
+from components.live_panel import LivePanel
+from components.monitor_panel import format_kb
+from system.disk_usage import DirUsage, DiskUsageScanner, DiskUsageStats
+
+
+class DiskUsagePanel(LivePanel):
+    """Collapsible tree of directory sizes, like an interactive du
+
+    A scan starts only when asked for (Enter in the path box, or F5). It
+    runs in a worker thread, which is cancelled if the panel is hidden, and
+    fills in a DirUsage tree; while it runs, the panel's timer re-reads the
+    totals of the expanded directories, so sizes grow and re-sort as results
+    stream in.
+    """
+
+    TITLE = "Disk Usage"
+    INTERVAL = 0.5
+    # Largest subdirectories listed under each directory
+    CHILDREN = 100
+    BACKGROUND_GROUPS = ("disk-usage",)
+
+    BINDINGS = [
+        Binding("f5", "rescan", "Rescan"),
+    ]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.scanner = DiskUsageScanner()
+        self.root: Optional[DirUsage] = None
+        self._scanning = False
+        self._expanded: Set[str] = set()
+
+    def compose(self) -> ComposeResult:
+        yield Input(os.path.expanduser("~"), placeholder="Directory to scan", id="du-path")
+        yield Static("Press Enter or F5 to scan this directory", id="du-status")
+        yield Tree("", id="du-tree")
+
+    def on_mount(self) -> None:
+        self.styles.padding = (0, 1)
+        self.query_one("#du-tree", Tree).show_root = True
+
+    def refresh_data(self) -> None:
+        """Redraw the expanded directories while scanning"""
+        if self._scanning:
+            self._sync(self.query_one("#du-tree", Tree).root)
+
+    def action_rescan(self) -> None:
+        """Scan the directory in the path box; unchanged directories come from the cache"""
+        # Resolved, so a root that links to another filesystem is scanned there
+        path = os.path.realpath(os.path.expanduser(self.query_one("#du-path", Input).value.strip() or "/"))
+        if not os.path.isdir(path):
+            self.query_one("#du-status", Static).update(Content(f"Not a directory: {path}"))
+            return
+        if self.root is None or self.root.name != path:
+            self._expanded = {path}
+        self.root = DirUsage(path)
+        self._scanning = True
+        tree = self.query_one("#du-tree", Tree)
+        tree.clear()
+        tree.root.data = self.root
+        tree.root.expand()
+        self.query_one("#du-status", Static).update(Content(f"Scanning {path}…"))
+        self._scan(self.root)
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        event.stop()
+        self.action_rescan()
+
+    @work(thread=True, exclusive=True, group="disk-usage", exit_on_error=False)
+    def _scan(self, root: DirUsage) -> None:
+        """Walk the tree off the main thread; a newer scan cancels this one"""
+        worker = get_current_worker()
+        try:
+            stats = self.scanner.scan(root, lambda: worker.is_cancelled)
+        except OSError as error:
+            stats = DiskUsageStats(errors=1)
+            root.error = error.strerror or str(error)
+        if not worker.is_cancelled:
+            self.app.call_from_thread(self._scan_finished, root, stats)
+
+    def background_work_cancelled(self) -> None:
+        if not self._scanning:
+            return
+        self._scanning = False
+        self._sync(self.query_one("#du-tree", Tree).root)
+        self.query_one("#du-status", Static).update("Scan stopped; sizes are partial (Enter or F5 scans again)")
+
+    def _scan_finished(self, root: DirUsage, stats: DiskUsageStats) -> None:
+        if root is not self.root:
+            return
+        self._scanning = False
+        self._sync(self.query_one("#du-tree", Tree).root)
+        errors = f", {stats.errors:,} unreadable" if stats.errors else ""
+        self.query_one("#du-status", Static).update(
+            f"{root.files:,} files in {root.dirs + 1:,} directories, {stats.elapsed:.1f}s "
+            f"({stats.cached:,} directories unchanged{errors})"
+        )
+
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
+        event.stop()
+        if event.node.data is not None:
+            self._expanded.add(event.node.data.path)
+            self._sync(event.node)
+
+    def on_tree_node_collapsed(self, event: Tree.NodeCollapsed) -> None:
+        event.stop()
+        if event.node.data is not None:
+            self._expanded.discard(event.node.data.path)
+
+    def _sync(self, node: TreeNode) -> None:
+        """Bring a tree node's label and, if expanded, its children up to date"""
+        usage: Optional[DirUsage] = node.data
+        if usage is None:
+            return
+        node.set_label(self._label(usage, node.parent is None))
+        node.allow_expand = bool(usage.children)
+        if not node.is_expanded:
+            return
+        # sorted() snapshots the values at once; the scan thread may be adding children
+        children = sorted(usage.children.values(), key=lambda child: child.size, reverse=True)[:self.CHILDREN]
+        if [child.data for child in node.children] != children:
+            node.remove_children()
+            for child in children:
+                node.add("", child, expand=child.path in self._expanded)
+        for child_node in node.children:
+            self._sync(child_node)
+
+    @staticmethod
+    def _label(usage: DirUsage, is_root: bool) -> Text:
+        name = usage.name if is_root else usage.name + "/"
+        state = "" if usage.complete else " …"
+        if usage.error:
+            state = f" ({usage.error})"
+        # Text, since directory names may contain markup such as "[b]"
+        return Text(f"{format_kb(usage.size // 1024):>10}  {name}{state}")
@@ -0,0 +1,153 @@
+"""Filename finder panel for the Linux TUI Tutorial"""
+
+import struct
+import time
+from typing import List, Optional
+
+from textual import work
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.content import Content
+from textual.worker import get_current_worker
+from textual.widgets import Input, OptionList, Static
+
+from components.live_panel import LivePanel
+from system.file_index import FileIndex, FileIndexError, IndexStats, build_index, default_index_path
+
+
+class FileFinderPanel(LivePanel):
+    """Finds files by name from a background-built index, like locate
+
+    The index is kept on disk between sessions and is only built or
+    refreshed when asked for (F5), in a worker thread that is cancelled if
+    the panel is hidden; refreshes only re-list directories whose mtime
+    changed. An index older than REFRESH_AGE is flagged in the status line.
+    """
+
+    TITLE = "Find Files"
+    ROOT = "/"
+    REFRESH_AGE = 15 * 60
+    RESULTS = 200
+    BACKGROUND_GROUPS = ("file-index",)
+
+    BINDINGS = [
+        Binding("f5", "rebuild", "Reindex"),
+    ]
+
+    def __init__(self, *args, index_path: Optional[str] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.index_path = index_path or default_index_path()
+        self.index: Optional[FileIndex] = None
+        self._building = False
+
+    def compose(self) -> ComposeResult:
+        yield Input(placeholder="Name or glob (e.g. sshd_config, *.conf)", id="finder-query")
+        yield Static("", id="finder-status")
+        yield OptionList(id="finder-results")
+
+    def on_mount(self) -> None:
+        """Open the index left by a previous session, if any"""
+        self.styles.padding = (0, 1)
+        try:
+            index = FileIndex(self.index_path)
+        except (OSError, FileIndexError):
+            index = None
+        if index is not None and index.root == self.ROOT:
+            self.index = index
+        self._show_status()
+
+    def refresh_data(self) -> None:
+        """Nothing to poll: the index is only updated when asked for"""
+
+    def action_rebuild(self) -> None:
+        """Update the index now"""
+        if self._building:
+            return
+        self._building = True
+        self._show_status()
+        self._build(self.index)
+
+    @work(thread=True, exclusive=True, group="file-index", exit_on_error=False)
+    def _build(self, previous: Optional[FileIndex]) -> None:
+        worker = get_current_worker()
+        try:
+            stats = build_index(self.ROOT, self.index_path, previous, cancelled=lambda: worker.is_cancelled)
+            if not stats.cancelled:
+                self.app.call_from_thread(self._index_built, stats)
+        except (OSError, struct.error, ValueError, FileIndexError) as error:
+            self.app.call_from_thread(self._index_failed, error)
+        finally:
+            self._building = False
+
+    def background_work_cancelled(self) -> None:
+        self._building = False
+        self._show_status("update stopped")
+
+    def _index_built(self, stats: IndexStats) -> None:
+        self._building = False
+        try:
+            # Views of the previous index are left to be unmapped when unreferenced,
+            # since a search may still be running on one
+            self.index = FileIndex(self.index_path)
+        except (OSError, FileIndexError) as error:
+            self._index_failed(error)
+            return
+        self._show_status(
+            f"{stats.elapsed:.1f}s, {stats.directories - stats.reused:,} of {stats.directories:,} directories re-listed"
+        )
+        self._search(self.query_one("#finder-query", Input).value)
+
+    def _index_failed(self, error: Exception) -> None:
+        self._building = False
+        self.query_one("#finder-status", Static).update(Content(f"Indexing failed: {error}"))
+
+    def _show_status(self, detail: str = "") -> None:
+        if self.index is None:
+            status = f"Indexing {self.ROOT}…" if self._building else f"No index of {self.ROOT}; press F5 to build one"
+        else:
+            status = f"{self.index.count:,} paths indexed"
+            age = time.time() - self.index.built
+            if self._building:
+                status += ", refreshing…"
+            elif detail:
+                status += f" ({detail})"
+            elif age > self.REFRESH_AGE:
+                status += f" ({age / 3600:.1f} hours old; F5 refreshes)"
+        self.query_one("#finder-status", Static).update(status)
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        event.stop()
+        self._search(event.value)
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        """Move to the results"""
+        event.stop()
+        results = self.query_one("#finder-results", OptionList)
+        if results.option_count:
+            results.highlighted = 0
+            results.focus()
+
+    @work(thread=True, exclusive=True, group="find", exit_on_error=False)
+    def _search(self, query: str) -> None:
+        """Query the index off the main thread; a newer query cancels this one"""
+        index = self.index
+        query = query.strip()
+        if index is None or not query:
+            results: List[str] = []
+            elapsed = 0.0
+        else:
+            started = time.perf_counter()
+            results = index.search(query, self.RESULTS)
+            elapsed = time.perf_counter() - started
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._show_results, query, results, elapsed)
+
+    def _show_results(self, query: str, results: List[str], elapsed: float) -> None:
+        option_list = self.query_one("#finder-results", OptionList)
+        option_list.clear_options()
+        # Content, since file names may contain markup such as "[/x]"
+        option_list.add_options(Content(result) for result in results)
+        if query and self.index is not None:
+            more = "+" if len(results) == self.RESULTS else ""
+            self._show_status(f"{len(results)}{more} matches in {elapsed * 1000:.0f} ms")
+
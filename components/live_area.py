@@ -0,0 +1,103 @@
+"""Live panel area shown next to topics in the Linux TUI Tutorial"""
+
+import importlib
+from typing import Dict, List, Optional, Tuple
+
+from textual.containers import Container
+from textual.widget import Widget
+from textual.widgets import TabbedContent, TabPane
+
+from components.live_panel import LivePanel
+
+
+# Live panels of each topic as (module, class) pairs, imported on first use
+LIVE_PANELS: Dict[Tuple[str, str], List[Tuple[str, str]]] = {
+    ("basic", "nav"): [
+        ("components.disk_usage_panel", "DiskUsagePanel"),
+        ("components.file_finder_panel", "FileFinderPanel"),
+    ],
+    ("basic", "perms"): [("components.audit_panel", "AuditPanel")],
+    ("intermediate", "process"): [("components.process_panel", "ProcessPanel")],
+    ("intermediate", "monitor"): [("components.monitor_panel", "MonitorPanel")],
+    ("intermediate", "storage"): [("components.disk_usage_panel", "DiskUsagePanel")],
+    ("intermediate", "network"): [("components.socket_panel", "SocketPanel")],
+    ("advanced", "network"): [("components.socket_panel", "SocketPanel")],
+    ("advanced", "security"): [("components.audit_panel", "AuditPanel")],
+    ("advanced", "virtual"): [("components.cgroup_panel", "CgroupPanel")],
+    ("advanced", "performance"): [("components.monitor_panel", "MonitorPanel")],
+}
+
+
+def get_panel_class(module: str, name: str) -> type:
+    """Import a live panel class"""
+    return getattr(importlib.import_module(module), name)
+
+
+class LiveArea(Container):
+    """Area beside the content that shows the live panels of the current topic
+
+    Each topic's panels are created the first time the topic is shown and
+    then kept, so switching topics only toggles which set is displayed. In
+    a topic with tabs, a panel is only created when its tab is first
+    selected. Hidden panels stop refreshing (see LivePanel).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.enabled = True
+        self._topic: Optional[Tuple[str, str]] = None
+        self._groups: Dict[Tuple[str, str], Widget] = {}
+        # Tabs whose panel has not been created yet, with its class
+        self._unopened: Dict[TabPane, type] = {}
+        self._unsubscribe = lambda: None
+
+    def on_mount(self) -> None:
+        """Follow the displayed topic"""
+        self.styles.width = "45%"
+        self.styles.height = "100%"
+        self.styles.border_left = ("solid", "white")
+        self.display = False
+        navigation = self.app.navigation
+        self._unsubscribe = navigation.subscribe("topic", self.show_topic)
+        self.show_topic(navigation.topic)
+
+    def on_unmount(self) -> None:
+        self._unsubscribe()
+
+    def toggle(self) -> bool:
+        """Turn live panels on or off; returns whether they are now enabled"""
+        self.enabled = not self.enabled
+        self.show_topic(self._topic)
+        return self.enabled
+
+    def show_topic(self, topic: Optional[Tuple[str, str]]) -> None:
+        """Display the live panels of a topic, or hide the area if it has none"""
+        self._topic = topic
+        specs = LIVE_PANELS.get(topic) if topic is not None else None
+        visible = self.enabled and bool(specs)
+        if visible and topic not in self._groups:
+            self._groups[topic] = self._build_group(specs)
+            self.mount(self._groups[topic])
+        for group_topic, group in self._groups.items():
+            group.display = visible and group_topic == topic
+        self.display = visible
+
+    def _build_group(self, specs: List[Tuple[str, str]]) -> Widget:
+        """Create a topic's first panel, and tabs for the rest when there is more than one"""
+        panel_classes = [get_panel_class(module, name) for module, name in specs]
+        first: LivePanel = panel_classes[0]()
+        if len(panel_classes) == 1:
+            return first
+        tabs = TabbedContent()
+        tabs.compose_add_child(TabPane(first.TITLE, first))
+        for panel_class in panel_classes[1:]:
+            pane = TabPane(panel_class.TITLE)
+            self._unopened[pane] = panel_class
+            tabs.compose_add_child(pane)
+        return tabs
+
+    def on_tabbed_content_tab_activated(self, event: TabbedContent.TabActivated) -> None:
+        """Create a tab's panel when it is first selected"""
+        panel_class = self._unopened.pop(event.pane, None)
+        if panel_class is not None:
+            event.pane.mount(panel_class())
@@ -0,0 +1,79 @@
+"""Base class for live system panels in the Linux TUI Tutorial"""
+
+from typing import Optional, Tuple
+
+from textual.binding import Binding
+from textual.containers import Vertical
+from textual.timer import Timer
+
+
+class LivePanel(Vertical, can_focus=True):
+    """Panel that refreshes live data on an interval while it is displayed
+
+    Subclasses implement refresh_data(). The refresh timer only runs while
+    the panel is shown, so hidden panels cost nothing. The interval can
+    be changed with + and - while the panel has focus. Workers in the
+    BACKGROUND_GROUPS worker groups (long scans and builds) are cancelled
+    when the panel is hidden or removed.
+    """
+
+    TITLE = "Live"
+    INTERVAL = 1.0
+    MIN_INTERVAL = 0.25
+    MAX_INTERVAL = 10.0
+    # Worker groups of long-running work, cancelled when the panel is hidden
+    BACKGROUND_GROUPS: Tuple[str, ...] = ()
+
+    BINDINGS = [
+        Binding("plus", "change_interval(0.5)", "Slower"),
+        Binding("minus", "change_interval(2.0)", "Faster"),
+    ]
+
+    def __init__(self, *args, interval: Optional[float] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.interval = interval or self.INTERVAL
+        self._timer: Optional[Timer] = None
+
+    def on_show(self) -> None:
+        """Refresh immediately and keep refreshing while displayed"""
+        self.refresh_data()
+        if self._timer is None:
+            self._timer = self.set_interval(self.interval, self.refresh_data)
+        else:
+            self._timer.resume()
+
+    def on_hide(self) -> None:
+        """Stop refreshing and background work while hidden"""
+        if self._timer is not None:
+            self._timer.pause()
+        self.cancel_background_work()
+
+    def on_unmount(self) -> None:
+        self.cancel_background_work()
+
+    def cancel_background_work(self) -> None:
+        """Cancel workers in BACKGROUND_GROUPS, then let the subclass reset its state"""
+        cancelled = [
+            worker for group in self.BACKGROUND_GROUPS for worker in self.workers.cancel_group(self, group)
+        ]
+        if cancelled:
+            self.background_work_cancelled()
+
+    def background_work_cancelled(self) -> None:
+        """Reset in-progress state after background work was cancelled"""
+        # A thread worker cancelled before it started never runs, so its
+        # finally blocks cannot be relied on to clear such state
+
+    def action_change_interval(self, factor: float) -> None:
+        """Change the refresh interval: + halves the rate, - doubles it"""
+        interval = min(max(self.interval / factor, self.MIN_INTERVAL), self.MAX_INTERVAL)
+        if interval == self.interval:
+            return
+        self.interval = interval
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = self.set_interval(self.interval, self.refresh_data)
+        self.notify(f"{self.TITLE}: refreshing every {self.interval:g}s")
+
+    def refresh_data(self) -> None:
+        """Read new data and update the display; panels that poll override this"""
@@ -1,89 +1,308 @@
 """Main content display component for the Linux TUI Tutorial"""
 
-from textual.app import ComposeResult
-from textual.containers import VerticalScroll
-from textual.widgets import Static
-from textual.reactive import reactive
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
 
-from content.welcome import WelcomeContent
-from content.basic_topics import BasicTopicsContent
-from content.intermediate_topics import IntermediateTopicsContent
-from content.advanced_topics import AdvancedTopicsContent
+from rich.style import Style
+from textual import work
+from textual.app import ComposeResult
+from textual.containers import Container
+from textual.content import Content
+from textual.widgets import ContentSwitcher
+from textual.worker import get_current_worker
 
+from components.content_viewer import ContentViewer, LineLayout
+from components.render_cache import RenderCache, RenderKey
+from content import library
+from data.navigation import MenuStructure
+from data.navigation_store import HistoryEntry
 
-class MainContent(VerticalScroll):
-    """Main content area that displays tutorial content with scrolling"""
 
-    current_view = reactive("welcome")
+class MainContent(Container):
+    """Main content area that displays tutorial content in a virtualized viewer
     
-    def compose(self) -> ComposeResult:
-        """Compose the main content area with a scrollable static widget"""
-        yield Static(WelcomeContent.get_welcome_message(), id="content-text", classes="content")
+    Every view (welcome, help, tier menus and topics) gets its own retained
+    viewer inside a content switcher, so returning to a view is a switch
+    that keeps its scroll position. The least recently shown viewers are
+    dropped once more than MAX_RETAINED_VIEWS are alive.
+    
+    Leaving a view records its top line and layout in the navigation
+    history, so going back restores it where it was left.
     
-    def update_content(self, content: str):
-        """Update the main content area with scrollable content"""
-        content_widget = self.query_one("#content-text", Static)
-        content_widget.update(content)
-        # Reset scroll position to top when updating content
-        self.scroll_to(y=0, animate=False)
+    Content that is neither retained nor cached is generated in a worker
+    thread, and only the latest navigation request is ever displayed.
     
+    While a tier's submenu is open, its topics are rendered into the render
+    cache by a background worker, so opening one is usually a cache hit.
+    
+    If generating a view's content fails, the view shows the error instead;
+    it is not cached, and opening the view again retries it.
+    """
+
+    MAX_RETAINED_VIEWS = 8
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.render_cache = RenderCache()
+        self._views: "OrderedDict[str, ContentViewer]" = OrderedDict()
+        self._requested_view = "welcome"
+        # How to regenerate each view shown so far, and the topic it shows
+        self._view_sources: Dict[str, Tuple[Callable[[], str], Optional[Tuple[str, str]]]] = {
+            "welcome": (library.get_welcome_message, None),
+        }
+        self._pending_scroll: Optional[Tuple[str, int]] = None
+        # Views showing an error in place of their content
+        self._failed_views: Set[str] = set()
+        self.dropped_loads = 0
+
+    def compose(self) -> ComposeResult:
+        """Compose the main content area with the welcome view"""
+        welcome = Content.from_markup(library.get_welcome_message())
+        viewer = self._create_viewer("welcome", LineLayout.from_content(welcome, 1))
+        with ContentSwitcher(id="content-views", initial=viewer.id):
+            yield viewer
+
+    @property
+    def current_view(self) -> str:
+        """The id of the view being displayed"""
+        return self.app.navigation.view
+
+    @property
+    def viewer(self) -> ContentViewer:
+        """The viewer displaying the current content"""
+        return self._views[self.current_view]
+
+    def _create_viewer(self, view_id: str, layout: LineLayout) -> ContentViewer:
+        """Create and register the retained viewer for a view"""
+        viewer = ContentViewer(layout, id=f"view-{view_id}", classes="content")
+        viewer.styles.width = "100%"
+        viewer.styles.height = "100%"
+        viewer.styles.padding = (1, 1)
+        viewer.styles.margin = 0
+        # Always reserve the scrollbar gutter so the folding width does not
+        # change when a scrollbar appears
+        viewer.styles.scrollbar_gutter = "stable"
+        self._views[view_id] = viewer
+        return viewer
+
+    def _evict_views(self) -> None:
+        """Remove the least recently shown viewers beyond the budget"""
+        while len(self._views) > self.MAX_RETAINED_VIEWS:
+            view_id, viewer = next(iter(self._views.items()))
+            if view_id == self.current_view:
+                self._views.move_to_end(view_id)
+                continue
+            del self._views[view_id]
+            self._failed_views.discard(view_id)
+            viewer.remove()
+
+    def update_content(self, content: Union[str, Content, LineLayout]):
+        """Replace the content of the current view and scroll to the top"""
+        viewer = self.viewer
+        if not isinstance(content, LineLayout):
+            if isinstance(content, str):
+                content = Content.from_markup(content)
+            content = LineLayout.from_content(content, viewer.layout_width)
+        viewer.show_layout(content)
+
+    def scroll_to_line(self, line_no: int):
+        """Scroll so that a line of the requested content is at the top"""
+        if self._requested_view != self.current_view:
+            # Still loading; scroll once the view is shown
+            self._pending_scroll = (self._requested_view, line_no)
+            return
+        # Wait for the new content to be laid out before scrolling
+        self.call_after_refresh(self.viewer.scroll_to_line, line_no)
+
+    def show_view(self, view_id: str, get_text: Callable[[], str], topic: Optional[Tuple[str, str]] = None):
+        """Switch to a view, loading its content in a worker if it is not ready
+        
+        Retained and cached views are shown immediately. Otherwise the text
+        is generated and laid out off the event loop; a newer request
+        supersedes the load and its result is cached but never shown.
+        """
+        self.remember_position()
+        self._view_sources[view_id] = (get_text, topic)
+        self._open_view(view_id)
+
+    def remember_position(self) -> None:
+        """Save the current view's position and content in the history"""
+        viewer = self.viewer
+        self.app.navigation.remember(viewer.top_line, viewer.layout)
+
+    def go_history(self, steps: int) -> Optional[HistoryEntry]:
+        """Go back (negative) or forward through the history
+        
+        The view is restored at the line it was left at, from its retained
+        viewer or its saved layout when available, else regenerated.
+        Returns the entry shown, or None at either end of the history.
+        """
+        self.remember_position()
+        entry = self.app.navigation.move_history(steps)
+        if entry is None:
+            return None
+        self._pending_scroll = (entry.view, entry.line)
+        self._open_view(entry.view, entry.rendered)
+        return entry
+
+    def _open_view(self, view_id: str, rendered: Optional[LineLayout] = None) -> None:
+        """Display a view from a retained viewer, a layout, the cache or its source"""
+        self._requested_view = view_id
+        self._cancel_load()
+        viewer = self._views.get(view_id)
+        if viewer is not None and view_id not in self._failed_views:
+            self._views.move_to_end(view_id)
+            self._switch_to(view_id, viewer)
+            return
+        width, theme = self.viewer.layout_width, self.app.theme
+        layout = rendered or self.render_cache.get(view_id, width, theme)
+        if layout is not None:
+            self._switch_to(view_id, self._mount_viewer(view_id, layout))
+        else:
+            get_text, _ = self._view_sources[view_id]
+            self._load_view(view_id, get_text, width, theme)
+
+    @work(thread=True, exclusive=True, group="load", exit_on_error=False)
+    def _load_view(self, view_id: str, get_text: Callable[[], str], width: int, theme: str) -> None:
+        """Generate and lay out a view's content in a worker thread"""
+        worker = get_current_worker()
+        key: Optional[RenderKey] = (view_id, width, theme)
+        try:
+            layout = self.render_cache.render(get_text(), width)
+        except Exception as error:
+            # Show what went wrong rather than never showing the view
+            key = None
+            layout = LineLayout.from_content(
+                Content.assemble(("Could not load this page", "bold"), "\n\n", f"{type(error).__name__}: {error}"),
+                width,
+            )
+        if not worker.is_cancelled:
+            self.app.call_from_thread(self._view_loaded, view_id, key, layout)
+
+    def _view_loaded(self, view_id: str, key: Optional[RenderKey], layout: LineLayout) -> None:
+        """Show a loaded view unless a newer navigation superseded it
+
+        A key of None means the layout is an error message, which is shown
+        but not cached.
+        """
+        if key is not None:
+            self.render_cache.put(key, layout)
+        if view_id != self._requested_view:
+            self.dropped_loads += 1
+            return
+        viewer = self._views.get(view_id)
+        if viewer is None:
+            viewer = self._mount_viewer(view_id, layout)
+        elif view_id in self._failed_views:
+            viewer.show_layout(layout)
+        if key is None:
+            self._failed_views.add(view_id)
+        else:
+            self._failed_views.discard(view_id)
+        self._switch_to(view_id, viewer)
+
+    def _cancel_load(self) -> None:
+        """Cancel the view being loaded, if any"""
+        self.workers.cancel_group(self, "load")
+
+    def _mount_viewer(self, view_id: str, layout: LineLayout) -> ContentViewer:
+        """Create a retained viewer for a layout and mount it in the switcher"""
+        viewer = self._create_viewer(view_id, layout)
+        self.query_one("#content-views", ContentSwitcher).mount(viewer)
+        return viewer
+
+    def _switch_to(self, view_id: str, viewer: ContentViewer) -> None:
+        """Display a retained viewer, keeping keyboard focus in the content"""
+        refocus = self.viewer.has_focus and viewer is not self.viewer
+        self.app.navigation.set_view(view_id, self._view_sources[view_id][1])
+        self.query_one("#content-views", ContentSwitcher).current = viewer.id
+        if refocus:
+            viewer.focus()
+        if self._pending_scroll is not None:
+            pending_view, line_no = self._pending_scroll
+            if pending_view == view_id:
+                self._pending_scroll = None
+                self.call_after_refresh(viewer.scroll_to_line, line_no)
+        self._evict_views()
+
     def show_welcome(self):
         """Show the welcome screen"""
-        self.current_view = "welcome"
-        self.update_content(WelcomeContent.get_welcome_message())
-    
+        self.show_view("welcome", library.get_welcome_message)
+
     def show_basic_menu(self):
         """Show basic topics menu with scrolling"""
-        self.current_view = "basic_menu"
-        content = BasicTopicsContent.get_menu_content()
-        self.update_content(content)
-    
+        self.show_view("basic_menu", lambda: library.get_menu_content("basic"))
+
     def show_intermediate_menu(self):
         """Show intermediate topics menu with scrolling"""
-        self.current_view = "intermediate_menu"
-        content = IntermediateTopicsContent.get_menu_content()
-        self.update_content(content)
-    
+        self.show_view("intermediate_menu", lambda: library.get_menu_content("intermediate"))
+
     def show_advanced_menu(self):
         """Show advanced topics menu with scrolling"""
-        self.current_view = "advanced_menu"
-        content = AdvancedTopicsContent.get_menu_content()
-        self.update_content(content)
-    
+        self.show_view("advanced_menu", lambda: library.get_menu_content("advanced"))
+
     def show_help(self):
         """Show help information"""
-        self.current_view = "help"
-        content = WelcomeContent.get_help_content()
-        self.update_content(content)
-    
+        self.show_view("help", library.get_help_content)
+
+    @staticmethod
+    def topic_view_id(topic_level: str, topic_id: str) -> str:
+        """Get the view id of a topic"""
+        return f"{topic_level}_{topic_id}"
+
     def show_topic_content(self, topic_level: str, topic_id: str):
         """Show specific topic content"""
-        self.current_view = f"{topic_level}_{topic_id}"
-        if topic_level == "basic":
-            content = BasicTopicsContent.get_topic_content(topic_id)
-        elif topic_level == "intermediate":
-            content = IntermediateTopicsContent.get_topic_content(topic_id)
-        elif topic_level == "advanced":
-            content = AdvancedTopicsContent.get_topic_content(topic_id)
-        else:
-            content = f"Content for {topic_id} coming soon!"
-        
-        self.update_content(content)
-    
+        self.show_view(
+            self.topic_view_id(topic_level, topic_id),
+            lambda: library.get_topic_content(topic_level, topic_id),
+            (topic_level, topic_id),
+        )
+
+    def prefetch_tier(self, tier: str) -> None:
+        """Render a tier's menu topics in the background, replacing any prefetch"""
+        self.cancel_prefetch()
+        viewer = self.viewer
+        width = viewer.layout_width
+        if not width:
+            return
+        theme = self.app.theme
+        pending = []
+        for route in MenuStructure.get_tier_routes(tier):
+            view_id = self.topic_view_id(tier, route.topic_id)
+            if view_id not in self._views and (view_id, width, theme) not in self.render_cache:
+                pending.append((view_id, tier, route.topic_id))
+        if pending:
+            self._prefetch(pending, width, theme, viewer.rich_style, viewer.size.height)
+
+    def cancel_prefetch(self) -> None:
+        """Stop rendering topics in the background"""
+        self.workers.cancel_group(self, "prefetch")
+
+    @work(thread=True, exclusive=True, group="prefetch", exit_on_error=False)
+    def _prefetch(self, pending: List[Tuple[str, str, str]], width: int, theme: str, style: Style, rows: int) -> None:
+        """Render topics and their first screen of rows into the render cache"""
+        worker = get_current_worker()
+        for view_id, tier, topic_id in pending:
+            if worker.is_cancelled:
+                return
+            try:
+                layout = self.render_cache.render(library.get_topic_content(tier, topic_id), width)
+            except Exception:
+                # Left for opening the topic to load, and report
+                continue
+            layout.warm(0, rows, style)
+            if worker.is_cancelled:
+                return
+            # The cache is not thread safe; store the result on the event loop
+            self.app.call_from_thread(self.render_cache.put, (view_id, width, theme), layout)
+
     def on_mount(self) -> None:
         """Initialize the content area and set layout properties"""
         # Configure content area styles programmatically
         self.styles.width = "100%"
         self.styles.height = "100%"
         self.styles.padding = 0
-        
-        # Configure content text widget
-        content_widget = self.query_one("#content-text")
-        content_widget.styles.width = "100%"
-        content_widget.styles.height = "auto"
-        content_widget.styles.min_height = "100%"
-        content_widget.styles.padding = 1
-        content_widget.styles.margin = 0
-        
-        # Ensure the content starts at the top
-        self.scroll_to(y=0, animate=False)
+
+        switcher = self.query_one("#content-views", ContentSwitcher)
+        switcher.styles.width = "100%"
+        switcher.styles.height = "100%"
@@ -0,0 +1,129 @@
+"""Live system monitor panel for the Linux TUI Tutorial"""
+
+from typing import Optional
+
+from textual.app import ComposeResult
+from textual.content import Content
+from textual.widgets import Static
+
+from components.live_panel import LivePanel
+from system.metrics import MetricHistory, Series, lttb
+from system.proc_sampler import ProcSampler
+
+
+BLOCKS = " ▁▂▃▄▅▆▇█"
+
+
+def usage_bar(fraction: float, width: int) -> str:
+    """Draw a horizontal bar for a 0..1 fraction"""
+    filled = round(min(max(fraction, 0.0), 1.0) * width)
+    return "█" * filled + "░" * (width - filled)
+
+
+def sparkline(values: Series, width: int, top: float) -> str:
+    """Draw the recent history of a series, downsampled to the given width"""
+    if top <= 0:
+        top = 1.0
+    scale = len(BLOCKS) - 1
+    return "".join(
+        BLOCKS[round(min(max(value / top, 0.0), 1.0) * scale)] for value in lttb(values, width)
+    )
+
+
+def format_kb(kb: int) -> str:
+    """Format a kB figure with a binary unit"""
+    size = float(kb)
+    for unit in ("KiB", "MiB", "GiB", "TiB"):
+        if size < 1024 or unit == "TiB":
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TiB"
+
+
+class MonitorPanel(LivePanel):
+    """CPU, memory and load figures sampled from /proc, like a compact top"""
+
+    TITLE = "Monitor"
+    # Metrics kept in the history; ctxt and forks are cumulative counts
+    HISTORY = ("cpu", "memory", "load", "ctxt", "forks")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sampler: Optional[ProcSampler] = None
+        self.history = MetricHistory(self.HISTORY)
+
+    def compose(self) -> ComposeResult:
+        yield Static(Content("Sampling /proc…"), id="monitor-body")
+
+    def on_mount(self) -> None:
+        """Open the /proc sources once for the life of the panel"""
+        self.styles.padding = (0, 1)
+        try:
+            self.sampler = ProcSampler()
+        except OSError as error:
+            self.query_one("#monitor-body", Static).update(Content(f"/proc is not available: {error}"))
+
+    def on_unmount(self) -> None:
+        if self.sampler is not None:
+            self.sampler.close()
+
+    def refresh_data(self) -> None:
+        """Take a sample and redraw the figures"""
+        sampler = self.sampler
+        if sampler is None:
+            return
+        timestamp = sampler.sample()
+        total = sampler.memory_kb("MemTotal")
+        self.history.record(timestamp, (
+            sampler.cpu_usage[0],
+            1 - sampler.memory_kb("MemAvailable") / total if total else 0.0,
+            sampler.load[0],
+            sampler.counter("ctxt"),
+            sampler.counter("processes"),
+        ))
+        self.query_one("#monitor-body", Static).update(Content("\n".join(self._format(sampler))))
+
+    def _format(self, sampler: ProcSampler):
+        """Yield the panel's text lines for the latest sample"""
+        width = max(self.size.width - 2, 20)
+        bar_width = max(width - 18, 10)
+        yield f"⏱  every {self.interval:g}s  ({sampler.cpu_count} CPUs)"
+        yield ""
+        history = self.history
+        yield f"CPU   {usage_bar(sampler.cpu_usage[0], bar_width)} {sampler.cpu_usage[0]:6.1%}"
+        yield f"      {sparkline(history.series('cpu'), bar_width, 1.0)}"
+        # One block per CPU, wrapped to the panel width
+        cells = "".join(
+            BLOCKS[round(sampler.cpu_usage[row] * (len(BLOCKS) - 1))] for row in range(1, sampler.cpu_rows)
+        )
+        for start in range(0, len(cells), width):
+            yield cells[start:start + width]
+        yield ""
+
+        total = sampler.memory_kb("MemTotal")
+        used = total - sampler.memory_kb("MemAvailable")
+        yield f"Mem   {usage_bar(used / total if total else 0, bar_width)} {used / total if total else 0:6.1%}"
+        yield f"      {sparkline(history.series('memory'), bar_width, 1.0)}"
+        yield f"      {format_kb(used)} used of {format_kb(total)}, {format_kb(sampler.memory_kb('Cached'))} cached"
+        swap_total = sampler.memory_kb("SwapTotal")
+        if swap_total:
+            swap_used = swap_total - sampler.memory_kb("SwapFree")
+            yield f"Swap  {usage_bar(swap_used / swap_total, bar_width)} {swap_used / swap_total:6.1%}"
+        yield ""
+
+        load = sampler.load
+        yield f"Load  {load[0]:.2f} {load[1]:.2f} {load[2]:.2f}"
+        loads = history.series("load")
+        yield f"      {sparkline(loads, bar_width, max(sampler.cpu_count, max(loads)))}"
+        yield f"Procs {sampler.counter('procs_running')} running, {sampler.counter('procs_blocked')} blocked"
+        yield f"Rates {sampler.rate('ctxt'):,.0f} ctxt/s  {sampler.rate('intr'):,.0f} intr/s  {sampler.rate('processes'):,.1f} forks/s"
+        if len(history) > 1:
+            context_switches = history.rates("ctxt")
+            yield f"ctxt  {sparkline(context_switches, bar_width, max(context_switches))}"
+            forks = history.rates("forks")
+            yield f"forks {sparkline(forks, bar_width, max(forks))}"
+        yield ""
+
+        per_sample, share = sampler.overhead()
+        cost = f"{share:.3%} CPU" if share is not None else "measuring"
+        yield f"Sampler {per_sample * 1000:.2f} ms/sample ({cost})"
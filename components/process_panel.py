@@ -0,0 +1,110 @@
+"""Live process table panel for the Linux TUI Tutorial"""
+
+from typing import Dict, List, Tuple, Union
+
+from rich.text import Text
+from textual import work
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.widgets import DataTable, Static
+
+from components.live_panel import LivePanel
+from components.monitor_panel import format_kb
+from system.processes import ProcessTable, ScanStats
+
+
+COLUMNS = ("PID", "USER", "S", "CPU%", "RSS", "THR", "COMMAND")
+SORT_KEYS = {"cpu": "cpu", "memory": "rss_kb"}
+
+Row = Tuple[Union[str, Text], ...]
+
+
+class ProcessPanel(LivePanel):
+    """Top processes by CPU or memory, like a compact ps/top
+
+    Scans run in a worker thread against an incremental ProcessTable, and
+    only the cells that changed since the last refresh are updated.
+    """
+
+    TITLE = "Processes"
+    INTERVAL = 2.0
+    ROWS = 50
+
+    BINDINGS = [
+        Binding("c", "sort('cpu')", "Sort CPU"),
+        Binding("m", "sort('memory')", "Sort Mem"),
+    ]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.processes = ProcessTable()
+        self.sort_by = "cpu"
+        self._rows: Dict[str, Row] = {}
+        self._scanning = False
+
+    def compose(self) -> ComposeResult:
+        yield Static("Scanning /proc…", id="process-status")
+        yield DataTable(id="process-table", cursor_type="row", zebra_stripes=True)
+
+    def on_mount(self) -> None:
+        self.styles.padding = (0, 1)
+        table = self.query_one("#process-table", DataTable)
+        for column in COLUMNS:
+            table.add_column(column, key=column)
+
+    def refresh_data(self) -> None:
+        """Start a scan unless the previous one is still running"""
+        if not self._scanning:
+            self._scanning = True
+            self._scan(self.sort_by)
+
+    def action_sort(self, sort_by: str) -> None:
+        """Rank the table by CPU or memory"""
+        if sort_by != self.sort_by:
+            self.sort_by = sort_by
+            self.refresh_data()
+
+    @work(thread=True, group="processes", exit_on_error=False)
+    def _scan(self, sort_by: str) -> None:
+        """Scan /proc and format the top rows off the main thread"""
+        try:
+            stats = self.processes.scan()
+            rows = [
+                (
+                    str(process.pid),
+                    Text(process.user),
+                    process.state,
+                    f"{process.cpu * 100:.1f}",
+                    format_kb(process.rss_kb),
+                    str(process.threads),
+                    # Text, since names and command lines may contain markup such as "[/x]"
+                    Text(process.command or f"[{process.name}]"),
+                )
+                for process in self.processes.top(self.ROWS, SORT_KEYS[sort_by])
+            ]
+            self.app.call_from_thread(self._apply, rows, stats)
+        finally:
+            self._scanning = False
+
+    def _apply(self, rows: List[Row], stats: ScanStats) -> None:
+        """Bring the table in line with the new top rows, touching only what changed"""
+        table = self.query_one("#process-table", DataTable)
+        wanted = {row[0]: row for row in rows}
+        for pid in self._rows.keys() - wanted.keys():
+            table.remove_row(pid)
+            del self._rows[pid]
+        for pid, row in wanted.items():
+            old = self._rows.get(pid)
+            if old is None:
+                table.add_row(*row, key=pid)
+            else:
+                for column, value, old_value in zip(COLUMNS, row, old):
+                    if value != old_value:
+                        table.update_cell(pid, column, value)
+            self._rows[pid] = row
+        rank = {pid: index for index, pid in enumerate(wanted)}
+        table.sort("PID", key=lambda pid: rank[pid])
+        self.query_one("#process-status", Static).update(
+            f"{stats.processes:,} processes, top {len(rows)} by {self.sort_by}  "
+            f"(+{stats.new} −{stats.exited}, {stats.refreshed:,} read in {stats.elapsed * 1000:.0f} ms)"
+        )
@@ -0,0 +1,68 @@
+"""Bounded cache of rendered content for the Linux TUI Tutorial"""
+
+from typing import Callable, Hashable, Optional, Tuple
+
+from textual.cache import LRUCache
+from textual.content import Content
+
+from components.content_viewer import LineLayout
+
+
+RenderKey = Tuple[Hashable, int, str]
+
+
+class RenderCache:
+    """LRU cache of laid-out content keyed by (view id, content width, theme)
+
+    A cached layout also keeps the line strips rendered so far, so a
+    revisited view repaints without parsing or rendering again.
+    """
+
+    def __init__(self, maxsize: int = 32):
+        self._cache: LRUCache[RenderKey, LineLayout] = LRUCache(maxsize)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, view_id: Hashable, width: int, theme: str) -> Optional[LineLayout]:
+        """Return the cached layout for a view, if any"""
+        rendered = self._cache.get((view_id, width, theme))
+        if rendered is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return rendered
+
+    def get_or_render(
+        self, view_id: Hashable, width: int, theme: str, get_text: Callable[[], str]
+    ) -> LineLayout:
+        """Return the cached layout for a view, parsing its text on a miss"""
+        key = (view_id, width, theme)
+        rendered = self.get(*key)
+        if rendered is not None:
+            return rendered
+        rendered = self.render(get_text(), width)
+        self._cache[key] = rendered
+        return rendered
+
+    @staticmethod
+    def render(text: str, width: int) -> LineLayout:
+        """Parse and lay out content text
+
+        This does not touch the cache, so it is safe to call from a worker
+        thread and hand the result to put() on the event loop.
+        """
+        return LineLayout.from_content(Content.from_markup(text), width)
+
+    def put(self, key: RenderKey, rendered: LineLayout) -> None:
+        """Store a layout rendered ahead of time"""
+        self._cache[key] = rendered
+
+    def clear(self) -> None:
+        """Drop every cached render"""
+        self._cache.clear()
+
+    def __contains__(self, key: RenderKey) -> bool:
+        return key in self._cache
+
+    def __len__(self) -> int:
+        return len(self._cache)
@@ -0,0 +1,161 @@
+"""Full-text search panel for the Linux TUI Tutorial"""
+
+from typing import List, Optional, Union
+
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Vertical
+from textual.content import Content
+from textual.message import Message
+from textual.widgets import Input, OptionList
+from textual.widgets.option_list import Option
+
+from data.command_index import CommandRecord, get_command_index
+from data.navigation import MenuStructure
+from data.search_index import SearchHit, get_search_index
+from system.runner import runnable_command
+
+
+SearchResult = Union[CommandRecord, SearchHit]
+
+
+class SearchPanel(Vertical):
+    """Search box with ranked, line-level results across all topics
+
+    Documented commands whose invocation starts with the query (e.g.
+    "perf ") are listed ahead of the full-text matches, and allowlisted
+    ones can be run with ctrl+r. The first MAX_COMMAND_RESULTS commands
+    are listed, followed by a row that lists the rest when selected.
+    """
+
+    MAX_COMMAND_RESULTS = 10
+
+    BINDINGS = [
+        Binding("escape", "close", "Close Search"),
+        Binding("down", "focus_results", "Results", show=False),
+        Binding("ctrl+r", "run", "Run Command"),
+    ]
+
+    class HitSelected(Message):
+        """Posted when the user picks a search result"""
+
+        def __init__(self, hit: SearchResult):
+            super().__init__()
+            self.hit = hit
+
+    class RunRequested(Message):
+        """Posted when the user asks to run a command result"""
+
+        def __init__(self, command: str):
+            super().__init__()
+            self.command = command
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Results by option index; None for the row listing more commands
+        self._hits: List[Optional[SearchResult]] = []
+        self._all_commands = False
+        self._set_open(False)
+
+    def compose(self) -> ComposeResult:
+        yield Input(placeholder="Search topics (e.g. strace, kill -9)", id="search-input")
+        yield OptionList(id="search-results")
+
+    def on_mount(self) -> None:
+        """Configure the panel layout"""
+        self.styles.height = "auto"
+        self.styles.max_height = 16
+        self.styles.border_bottom = ("solid", "white")
+        results = self.query_one("#search-results", OptionList)
+        results.styles.height = "auto"
+        results.styles.max_height = 12
+
+    def _set_open(self, is_open: bool) -> None:
+        """Show or hide the panel, keeping it out of the focus chain while hidden"""
+        self.display = is_open
+        self.disabled = not is_open
+
+    def open(self) -> None:
+        """Show the panel and focus the search box"""
+        self._set_open(True)
+        self.query_one("#search-input", Input).focus()
+
+    def action_close(self) -> None:
+        """Hide the panel and return focus to the content area"""
+        self._set_open(False)
+        self.app.query_one("#main-content").viewer.focus()
+
+    def action_focus_results(self) -> None:
+        """Move focus from the search box to the results"""
+        results = self.query_one("#search-results", OptionList)
+        if results.option_count:
+            results.focus()
+            results.highlighted = 0
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Re-run the query as the user types"""
+        self._all_commands = False
+        self._show_results(event.value)
+
+    def _show_results(self, query: str) -> None:
+        commands: List[CommandRecord] = []
+        if query.strip():
+            commands = get_command_index().lookup(query.lstrip())
+        more = 0 if self._all_commands else max(len(commands) - self.MAX_COMMAND_RESULTS, 0)
+        hits: List[Optional[SearchResult]] = [*commands[:len(commands) - more]]
+        options = [self._format_hit(hit) for hit in hits]
+        if more:
+            hits.append(None)
+            options.append(Option(Content.styled(f"… {more} more commands (select to list them)", "italic")))
+        text_hits = get_search_index().search(query)
+        hits.extend(text_hits)
+        options.extend(self._format_hit(hit) for hit in text_hits)
+        self._hits = hits
+        results = self.query_one("#search-results", OptionList)
+        results.clear_options()
+        results.add_options(options)
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        """Open the best result when Enter is pressed in the search box"""
+        if self._hits and self._hits[0] is not None:
+            self._select(self._hits[0])
+
+    def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
+        """Open the chosen result"""
+        event.stop()
+        hit = self._hits[event.option_index]
+        if hit is None:
+            # List every matching command, keeping the cursor where the row was
+            self._all_commands = True
+            self._show_results(self.query_one("#search-input", Input).value)
+            event.option_list.highlighted = event.option_index
+            return
+        self._select(hit)
+
+    def action_run(self) -> None:
+        """Run the highlighted (or first) command result if it is allowlisted"""
+        results = self.query_one("#search-results", OptionList)
+        index = results.highlighted if results.highlighted is not None else 0
+        if index >= len(self._hits) or not isinstance(self._hits[index], CommandRecord):
+            self.notify("Only command results can be run", severity="warning")
+            return
+        command = runnable_command(self._hits[index].command)
+        if command is None:
+            self.notify(f"{self._hits[index].command} is not on the list of safe commands", severity="warning")
+            return
+        self._set_open(False)
+        self.post_message(self.RunRequested(command))
+
+    def _select(self, hit: SearchResult) -> None:
+        """Close the panel and announce the selected hit"""
+        self._set_open(False)
+        self.post_message(self.HitSelected(hit))
+
+    @staticmethod
+    def _format_hit(hit: SearchResult) -> Option:
+        """Format a command or text hit as a result row"""
+        item = MenuStructure.get_topic_item(hit.tier, hit.topic_id)
+        title = item.label if item else hit.topic_id
+        if isinstance(hit, CommandRecord):
+            return Option(Content(f"$ {hit.command}  — {hit.description}  [{title}]"))
+        return Option(Content(f"{title}:{hit.line_no}  {hit.line}"))
@@ -1,9 +1,11 @@
 """Sidebar navigation component for the Linux TUI Tutorial"""
 
+from typing import Callable, Dict, List
+
 from textual.app import ComposeResult
 from textual.containers import Container
 from textual.widgets import Button, Static
-from textual.reactive import reactive
+from textual.widget import Widget
 
 from data.navigation import NavigationState, MenuStructure
 
@@ -17,33 +19,86 @@ class MenuButton(Button):
 
 
 class Sidebar(Container):
-    """Sidebar container for navigation menu"""
+    """Sidebar container for navigation menu
+    
+    Each navigation state's menu is composed once, the first time it is
+    shown, and kept mounted. Changing state only toggles which menu is
+    displayed instead of tearing down and re-mounting its buttons.
+    """
     
-    current_state = reactive(NavigationState.MAIN_MENU)
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._menus: Dict[NavigationState, Container] = {}
+        self._unsubscribe: Callable[[], None] = lambda: None
     
     def compose(self) -> ComposeResult:
         yield Static("📚 Linux Ref. Guide", classes="sidebar-title")
         yield Container(id="menu-container")
     
-    def watch_current_state(self, state: NavigationState) -> None:
-        """Update sidebar content based on current state"""
-        self.update_menu(state)
+    def on_mount(self) -> None:
+        """Show the current menu and follow navigation state changes"""
+        navigation = self.app.navigation
+        self.update_menu(navigation.state)
+        self._unsubscribe = navigation.subscribe("state", self.update_menu)
+    
+    def on_unmount(self) -> None:
+        """Stop following navigation state changes"""
+        self._unsubscribe()
     
     def update_menu(self, state: NavigationState) -> None:
-        """Update the menu based on current navigation state"""
-        menu_container = self.query_one("#menu-container", Container)
-        menu_container.remove_children()
+        """Show the menu for a navigation state, composing it on first use"""
+        menu = self._menus.get(state)
+        if menu is None:
+            menu = Container(*self._build_menu(state), classes="menu")
+            menu.styles.height = "auto"
+            self._menus[state] = menu
+            self.query_one("#menu-container", Container).mount(menu)
+        
+        focused = self.screen.focused
+        for menu_state, state_menu in self._menus.items():
+            state_menu.display = menu_state == state
+        
+        # Keep keyboard focus in the sidebar when it was on a menu now hidden
+        if focused is not None and focused.parent is not menu and focused.parent in self._menus.values():
+            # A newly composed menu is mounted on the next refresh
+            self.call_after_refresh(self._focus_menu, menu)
+    
+    def focus_item(self, item_id: str) -> None:
+        """Focus a menu item of the displayed menu, or its first button"""
+        menu = self._menus.get(self.app.navigation.state)
+        if menu is None:
+            return
+        for button in menu.query(MenuButton):
+            if button.id == item_id:
+                button.focus()
+                return
+        self._focus_menu(menu)
+    
+    @staticmethod
+    def _focus_menu(menu: Container) -> None:
+        """Focus the first button of a menu"""
+        if menu.screen.focused is not None and menu.screen.focused.parent is menu:
+            # Focus already moved into the menu since this was scheduled
+            return
+        buttons = menu.query(MenuButton)
+        if buttons:
+            buttons.first().focus()
+    
+    @staticmethod
+    def _build_menu(state: NavigationState) -> List[Widget]:
+        """Create the widgets of the menu for a navigation state"""
+        widgets: List[Widget] = []
         
         # Add back button for submenus
         if state != NavigationState.MAIN_MENU:
-            back_btn = MenuButton("← Back", id="back")
+            back_btn = MenuButton("← Back", id=MenuStructure.get_back_id(state))
             back_btn.add_class("back-button")
-            menu_container.mount(back_btn)
+            widgets.append(back_btn)
             
             # Add submenu title
             title = Static(MenuStructure.get_menu_title(state))
             title.add_class("submenu-title")
-            menu_container.mount(title)
+            widgets.append(title)
         
         # Add menu items
         menu_items = MenuStructure.get_menu_items(state)
@@ -51,4 +106,5 @@ class Sidebar(Container):
             button = MenuButton(item.label, id=item.id)
             if item.id == "exit":
                 button.add_class("exit-button")
-            menu_container.mount(button)
+            widgets.append(button)
+        return widgets
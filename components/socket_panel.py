@@ -0,0 +1,136 @@
+"""Live socket table panel for the Linux TUI Tutorial"""
+
+from typing import List, Optional, Set, Tuple, Union
+
+from rich.text import Text
+from textual import work
+from textual.app import ComposeResult
+from textual.worker import get_current_worker
+from textual.widgets import DataTable, Input, Static
+
+from components.live_panel import LivePanel
+from system.sockets import PROTOCOLS, TCP_STATES, SocketSnapshot, SocketStats, SocketTable
+
+
+COLUMNS = ("Proto", "State", "Local", "Remote", "Process")
+STATE_CODES = {name.lower(): code for code, name in enumerate(TCP_STATES) if name}
+
+# Parsed filter: protocols, states and port, None meaning any
+SocketFilter = Tuple[Optional[Set[int]], Optional[Set[int]], Optional[int]]
+Row = Tuple[Union[str, Text], ...]
+
+
+def parse_filter(text: str) -> SocketFilter:
+    """Parse filter words: protocol names, state names and a port number"""
+    protocols: Set[int] = set()
+    states: Set[int] = set()
+    port: Optional[int] = None
+    for word in text.lower().split():
+        if word in PROTOCOLS:
+            protocols.add(PROTOCOLS.index(word))
+        elif word in STATE_CODES:
+            states.add(STATE_CODES[word])
+        elif word.lstrip(":").isdigit():
+            port = int(word.lstrip(":"))
+    return protocols or None, states or None, port
+
+
+class SocketPanel(LivePanel):
+    """Sockets from /proc/net with their owning processes, like ss -tuanp
+
+    /proc/net is re-parsed in a worker thread on each refresh. The filter
+    box (for example "tcp listen" or "estab 443") selects rows from the
+    latest snapshot's arrays, also in a worker, so changing it does not
+    reparse anything. The table shows the first ROWS matches.
+    """
+
+    TITLE = "Sockets"
+    INTERVAL = 2.0
+    ROWS = 200
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sockets: Optional[SocketTable] = None
+        self.stats = SocketStats()
+        self._refreshing = False
+        self._rows: List[Row] = []
+
+    def compose(self) -> ComposeResult:
+        yield Input(placeholder="Filter: tcp udp unix, listen estab time-wait, port", id="socket-filter")
+        yield Static("Reading /proc/net…", id="socket-status")
+        yield DataTable(id="socket-table", cursor_type="row", zebra_stripes=True)
+
+    def on_mount(self) -> None:
+        self.styles.padding = (0, 1)
+        table = self.query_one("#socket-table", DataTable)
+        for column in COLUMNS:
+            table.add_column(column, key=column)
+        try:
+            self.sockets = SocketTable()
+        except OSError as error:
+            self.query_one("#socket-status", Static).update(f"/proc/net is not available: {error}")
+
+    def refresh_data(self) -> None:
+        """Start a refresh unless the previous one is still running"""
+        if self.sockets is not None and not self._refreshing:
+            self._refreshing = True
+            self._refresh_sockets(self.sockets, parse_filter(self.query_one("#socket-filter", Input).value))
+
+    @work(thread=True, group="sockets", exit_on_error=False)
+    def _refresh_sockets(self, sockets: SocketTable, socket_filter: SocketFilter) -> None:
+        """Parse /proc/net and select the rows to show off the main thread"""
+        try:
+            stats = sockets.refresh()
+            matches, rows = self._select(sockets, sockets.snapshot, socket_filter)
+            self.app.call_from_thread(self._show, sockets.snapshot, stats, matches, rows)
+        finally:
+            self._refreshing = False
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        event.stop()
+        if self.sockets is not None:
+            self._filter(self.sockets, parse_filter(event.value))
+
+    @work(thread=True, exclusive=True, group="socket-filter", exit_on_error=False)
+    def _filter(self, sockets: SocketTable, socket_filter: SocketFilter) -> None:
+        """Re-filter the latest snapshot; a newer filter cancels this one"""
+        snapshot = sockets.snapshot
+        matches, rows = self._select(sockets, snapshot, socket_filter)
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._show, snapshot, self.stats, matches, rows)
+
+    def _select(
+        self, sockets: SocketTable, snapshot: SocketSnapshot, socket_filter: SocketFilter
+    ) -> Tuple[int, List[Row]]:
+        """Count the matching sockets and format the first ROWS of them"""
+        protocols, states, port = socket_filter
+        matching = snapshot.select(protocols, states, port)
+        rows = [
+            (
+                PROTOCOLS[snapshot.protocols[row]],
+                TCP_STATES[snapshot.states[row]],
+                # Text, since unix socket paths and process names may contain markup such as "[/x]"
+                Text(snapshot.address(row)),
+                Text(snapshot.address(row, remote=True)),
+                Text(sockets.owner(snapshot.inodes[row])),
+            )
+            for row in matching[:self.ROWS]
+        ]
+        return len(matching), rows
+
+    def _show(self, snapshot: SocketSnapshot, stats: SocketStats, matches: int, rows: List[Row]) -> None:
+        self.stats = stats
+        if rows != self._rows:
+            self._rows = rows
+            table = self.query_one("#socket-table", DataTable)
+            cursor = table.cursor_row
+            table.clear()
+            table.add_rows(rows)
+            if rows:
+                table.move_cursor(row=min(cursor, len(rows) - 1))
+        counts = "  ".join(f"{state} {count:,}" for state, count in snapshot.counts.items())
+        shown = f", first {len(rows):,} shown" if matches > len(rows) else ""
+        self.query_one("#socket-status", Static).update(
+            f"{len(snapshot):,} sockets ({counts}), {matches:,} matching{shown}\n"
+            f"parsed in {stats.parse_seconds * 1000:.0f} ms, owners in {stats.owner_seconds * 1000:.0f} ms"
+        )
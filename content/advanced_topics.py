@@ -1,8 +1,12 @@
 """Advanced level content for the Linux TUI Tutorial"""
 
+from content.registry import TopicRegistry, TopicNotFoundError
+
 
 class AdvancedTopicsContent:
     """Content for advanced Linux topics"""
+
+    topics = TopicRegistry("advanced")
     
     @staticmethod
     def get_menu_content() -> str:
@@ -47,18 +51,13 @@ Press Escape or click '← Back' to return to the main menu.
     @staticmethod
     def get_topic_content(topic_id: str) -> str:
         """Get content for a specific advanced topic"""
-        content_map = {
-            "kernel": AdvancedTopicsContent._get_kernel_content(),
-            "network": AdvancedTopicsContent._get_networking_content(),
-            "security": AdvancedTopicsContent._get_security_content(),
-            "virtual": AdvancedTopicsContent._get_virtualization_content(),
-            "ha": AdvancedTopicsContent._get_ha_content(),
-            "internals": AdvancedTopicsContent._get_internals_content(),
-            "performance": AdvancedTopicsContent._get_performance_content(),
-        }
-        return content_map.get(topic_id, f"Content for {topic_id} coming soon!")
+        try:
+            return AdvancedTopicsContent.topics.get(topic_id)
+        except TopicNotFoundError:
+            return f"Content for {topic_id} coming soon!"
     
     @staticmethod
+    @topics.register("kernel")
     def _get_kernel_content() -> str:
         """Kernel and modules content"""
         return """
@@ -129,6 +128,7 @@ Press Escape to return to Advanced Topics menu.
         """
     
     @staticmethod
+    @topics.register("network")
     def _get_networking_content() -> str:
         """Advanced networking content"""
         return """
@@ -202,6 +202,7 @@ Press Escape to return to Advanced Topics menu.
         """
     
     @staticmethod
+    @topics.register("security")
     def _get_security_content() -> str:
         """Security hardening content"""
         return """
@@ -285,6 +286,7 @@ Press Escape to return to Advanced Topics menu.
         """
     
     @staticmethod
+    @topics.register("virtual")
     def _get_virtualization_content() -> str:
         """Virtualization content"""
         return """
@@ -381,6 +383,7 @@ Press Escape to return to Advanced Topics menu.
         """
     
     @staticmethod
+    @topics.register("ha")
     def _get_ha_content() -> str:
         """High availability content"""
         return """
@@ -473,6 +476,7 @@ Press Escape to return to Advanced Topics menu.
         """
     
     @staticmethod
+    @topics.register("internals")
     def _get_internals_content() -> str:
         """System internals content"""
         return """
@@ -562,6 +566,7 @@ Press Escape to return to Advanced Topics menu.
         """
     
     @staticmethod
+    @topics.register("performance")
     def _get_performance_content() -> str:
         """Performance tuning content"""
         return """
@@ -1,8 +1,12 @@
 """Basic level content for the Linux TUI Tutorial"""
 
+from content.registry import TopicRegistry, TopicNotFoundError
+
 
 class BasicTopicsContent:
     """Content for basic Linux topics"""
+
+    topics = TopicRegistry("basic")
     
     @staticmethod
     def get_menu_content() -> str:
@@ -35,15 +39,13 @@ Press Escape or click '← Back' to return to the main menu.
     @staticmethod
     def get_topic_content(topic_id: str) -> str:
         """Get content for a specific basic topic"""
-        content_map = {
-            "files": BasicTopicsContent._get_files_content(),
-            "nav": BasicTopicsContent._get_navigation_content(),
-            "view": BasicTopicsContent._get_viewing_content(),
-            "perms": BasicTopicsContent._get_permissions_content(),
-        }
-        return content_map.get(topic_id, f"Content for {topic_id} coming soon!")
+        try:
+            return BasicTopicsContent.topics.get(topic_id)
+        except TopicNotFoundError:
+            return f"Content for {topic_id} coming soon!"
     
     @staticmethod
+    @topics.register("files")
     def _get_files_content() -> str:
         """File commands content"""
         return """
@@ -108,6 +110,7 @@ Press Escape to return to Basic Topics menu.
         """
     
     @staticmethod
+    @topics.register("nav")
     def _get_navigation_content() -> str:
         """Directory navigation content"""
         return """
@@ -189,6 +192,7 @@ Press Escape to return to Basic Topics menu.
         """
     
     @staticmethod
+    @topics.register("view")
     def _get_viewing_content() -> str:
         """File viewing content"""
         return """
@@ -261,6 +265,7 @@ Press Escape to return to Basic Topics menu.
         """
     
     @staticmethod
+    @topics.register("perms")
     def _get_permissions_content() -> str:
         """Permissions content"""
         return """
@@ -1,8 +1,12 @@
 """Intermediate level content for the Linux TUI Tutorial"""
 
+from content.registry import TopicRegistry, TopicNotFoundError
+
 
 class IntermediateTopicsContent:
     """Content for intermediate Linux topics"""
+
+    topics = TopicRegistry("intermediate")
     
     @staticmethod
     def get_menu_content() -> str:
@@ -47,18 +51,13 @@ Press Escape or click '← Back' to return to the main menu.
     @staticmethod
     def get_topic_content(topic_id: str) -> str:
         """Get content for a specific intermediate topic"""
-        content_map = {
-            "process": IntermediateTopicsContent._get_process_content(),
-            "monitor": IntermediateTopicsContent._get_monitoring_content(),
-            "storage": IntermediateTopicsContent._get_storage_content(),
-            "shell": IntermediateTopicsContent._get_shell_content(),
-            "users": IntermediateTopicsContent._get_users_content(),
-            "packages": IntermediateTopicsContent._get_packages_content(),
-            "network": IntermediateTopicsContent._get_network_content(),
-        }
-        return content_map.get(topic_id, f"Content for {topic_id} coming soon!")
+        try:
+            return IntermediateTopicsContent.topics.get(topic_id)
+        except TopicNotFoundError:
+            return f"Content for {topic_id} coming soon!"
     
     @staticmethod
+    @topics.register("process")
     def _get_process_content() -> str:
         """Process management content"""
         return """
@@ -109,6 +108,7 @@ Press Escape to return to Intermediate Topics menu.
         """
     
     @staticmethod
+    @topics.register("monitor")
     def _get_monitoring_content() -> str:
         """System monitoring content"""
         return """
@@ -165,6 +165,7 @@ Press Escape to return to Intermediate Topics menu.
         """
     
     @staticmethod
+    @topics.register("storage")
     def _get_storage_content() -> str:
         """Storage and filesystems content"""
         return """
@@ -223,6 +224,7 @@ Press Escape to return to Intermediate Topics menu.
         """
     
     @staticmethod
+    @topics.register("shell")
     def _get_shell_content() -> str:
         """Shell scripting content"""
         return """
@@ -293,6 +295,7 @@ Press Escape to return to Intermediate Topics menu.
         """
     
     @staticmethod
+    @topics.register("users")
     def _get_users_content() -> str:
         """User management content"""
         return """
@@ -371,6 +374,7 @@ Press Escape to return to Intermediate Topics menu.
         """
     
     @staticmethod
+    @topics.register("packages")
     def _get_packages_content() -> str:
         """Package management content"""
         return """
@@ -474,6 +478,7 @@ Press Escape to return to Intermediate Topics menu.
         """
     
     @staticmethod
+    @topics.register("network")
     def _get_network_content() -> str:
         """Network basics content"""
         return """
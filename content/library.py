@@ -0,0 +1,90 @@
+"""Central access point for tutorial content across all topic tiers"""
+
+import importlib
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from content.pack import ContentPack, menu_key, topic_key
+
+
+TIER_CLASSES: Dict[str, Tuple[str, str]] = {
+    "basic": ("content.basic_topics", "BasicTopicsContent"),
+    "intermediate": ("content.intermediate_topics", "IntermediateTopicsContent"),
+    "advanced": ("content.advanced_topics", "AdvancedTopicsContent"),
+}
+
+_pack: Optional[ContentPack] = None
+_pack_checked = False
+
+
+def get_content_class(tier: str):
+    """Import and return the content class for a tier"""
+    module_name, class_name = TIER_CLASSES[tier]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def get_pack() -> Optional[ContentPack]:
+    """Get the compiled content pack, or None if it is missing or stale"""
+    global _pack, _pack_checked
+    if not _pack_checked:
+        _pack_checked = True
+        _pack = ContentPack.open_default()
+    return _pack
+
+
+def get_welcome_message() -> str:
+    """Get the welcome screen content"""
+    return importlib.import_module("content.welcome").WelcomeContent.get_welcome_message()
+
+
+def get_help_content() -> str:
+    """Get the help screen content"""
+    return importlib.import_module("content.welcome").WelcomeContent.get_help_content()
+
+
+def get_menu_content(tier: str) -> str:
+    """Get the menu content for a tier"""
+    pack = get_pack()
+    if pack is not None:
+        content = pack.get(menu_key(tier))
+        if content is not None:
+            return content
+    return get_content_class(tier).get_menu_content()
+
+
+def get_topic_content(tier: str, topic_id: str) -> str:
+    """Get the content for a topic, preferring the compiled content pack"""
+    pack = get_pack()
+    if pack is not None:
+        content = pack.get(topic_key(tier, topic_id))
+        if content is not None:
+            return content
+    if tier not in TIER_CLASSES:
+        return f"Content for {topic_id} coming soon!"
+    return get_content_class(tier).get_topic_content(topic_id)
+
+
+def get_topic_ids(tier: str) -> List[str]:
+    """Get the topic ids of a tier in menu order"""
+    pack = get_pack()
+    if pack is not None:
+        prefix = topic_key(tier, "")
+        topic_ids = [key[len(prefix):] for key in pack.keys() if key.startswith(prefix)]
+        if topic_ids:
+            return topic_ids
+    return get_content_class(tier).topics.topic_ids()
+
+
+def iter_topics() -> Iterator[Tuple[str, str, str]]:
+    """Yield (tier, topic id, content) for every topic"""
+    for tier in TIER_CLASSES:
+        for topic_id in get_topic_ids(tier):
+            yield tier, topic_id, get_topic_content(tier, topic_id)
+
+
+def iter_sources() -> Iterator[Tuple[str, str]]:
+    """Yield (pack key, content) for every menu and topic in the source modules"""
+    for tier in TIER_CLASSES:
+        content_class = get_content_class(tier)
+        yield menu_key(tier), content_class.get_menu_content()
+        for topic_id in content_class.topics.topic_ids():
+            yield topic_key(tier, topic_id), content_class.topics.get(topic_id)
@@ -0,0 +1,149 @@
+"""Compiled, memory-mapped content pack for the Linux TUI Tutorial
+
+The pack is a single binary file holding every menu and topic as UTF-8
+text behind an offset index. Loading it maps the file read-only, so
+concurrent processes share the pages through the page cache and only the
+topic being shown is decoded.
+
+Build it with: python -m content.pack [output_path]
+"""
+
+import mmap
+import os
+import struct
+import sys
+from typing import Dict, Iterable, Optional, Tuple
+
+
+MAGIC = b"LTPK"
+VERSION = 1
+HEADER = struct.Struct("<4sHHI")   # magic, version, reserved, entry count
+ENTRY = struct.Struct("<HQI")      # key length, data offset, data length
+
+CONTENT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PACK_PATH = os.path.join(CONTENT_DIR, "content.pack")
+SOURCE_MODULES = ("basic_topics.py", "intermediate_topics.py", "advanced_topics.py")
+
+
+def topic_key(tier: str, topic_id: str) -> str:
+    """Pack key for a topic"""
+    return f"{tier}:{topic_id}"
+
+
+def menu_key(tier: str) -> str:
+    """Pack key for a tier menu"""
+    return f"menu:{tier}"
+
+
+class ContentPackError(Exception):
+    """Raised when a content pack file is malformed"""
+
+
+def build_pack(entries: Iterable[Tuple[str, str]], path: str) -> int:
+    """Compile (key, content) pairs into a pack file and return the entry count"""
+    encoded = [(key.encode("utf-8"), content.encode("utf-8")) for key, content in entries]
+
+    index_size = HEADER.size + sum(ENTRY.size + len(key) for key, _ in encoded)
+    offset = index_size
+    index = [HEADER.pack(MAGIC, VERSION, 0, len(encoded))]
+    for key, data in encoded:
+        index.append(ENTRY.pack(len(key), offset, len(data)))
+        index.append(key)
+        offset += len(data)
+
+    # Write to a temporary file and rename so running readers keep a
+    # consistent mapping of the previous pack.
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as pack_file:
+        pack_file.writelines(index)
+        pack_file.writelines(data for _, data in encoded)
+    os.replace(tmp_path, path)
+    return len(encoded)
+
+
+class ContentPack:
+    """Read-only view over a memory-mapped content pack"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as pack_file:
+            try:
+                self._map = mmap.mmap(pack_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as error:
+                # An empty file cannot be mapped
+                raise ContentPackError(f"{path}: {error}") from error
+        self._index = self._read_index()
+
+    def _read_index(self) -> Dict[str, Tuple[int, int]]:
+        """Parse the offset index at the start of the mapping"""
+        if len(self._map) < HEADER.size:
+            raise ContentPackError(f"{self.path}: truncated header")
+        magic, version, _, count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ContentPackError(f"{self.path}: unsupported pack format")
+
+        index = {}
+        position = HEADER.size
+        for _ in range(count):
+            if position + ENTRY.size > len(self._map):
+                raise ContentPackError(f"{self.path}: truncated index")
+            key_length, offset, length = ENTRY.unpack_from(self._map, position)
+            position += ENTRY.size
+            if position + key_length > len(self._map):
+                raise ContentPackError(f"{self.path}: truncated index")
+            try:
+                key = self._map[position:position + key_length].decode("utf-8")
+            except UnicodeDecodeError as error:
+                raise ContentPackError(f"{self.path}: malformed key") from error
+            position += key_length
+            if offset + length > len(self._map):
+                raise ContentPackError(f"{self.path}: entry '{key}' out of bounds")
+            index[key] = (offset, length)
+        return index
+
+    @classmethod
+    def open_default(cls) -> Optional["ContentPack"]:
+        """Open the default pack if it exists and is newer than the sources"""
+        try:
+            pack_mtime = os.stat(DEFAULT_PACK_PATH).st_mtime
+            for module in SOURCE_MODULES:
+                if os.stat(os.path.join(CONTENT_DIR, module)).st_mtime > pack_mtime:
+                    return None
+            return cls(DEFAULT_PACK_PATH)
+        except (OSError, ContentPackError):
+            return None
+
+    def get(self, key: str) -> Optional[str]:
+        """Decode and return the content stored under a key"""
+        entry = self._index.get(key)
+        if entry is None:
+            return None
+        offset, length = entry
+        return self._map[offset:offset + length].decode("utf-8")
+
+    def keys(self):
+        """Get the keys stored in the pack"""
+        return self._index.keys()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def close(self) -> None:
+        """Unmap the pack file"""
+        self._map.close()
+
+
+def main() -> None:
+    """Compile the content modules into a pack file"""
+    from content.library import iter_sources
+
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PACK_PATH
+    count = build_pack(iter_sources(), path)
+    print(f"Wrote {count} entries to {path}")
+
+
+if __name__ == "__main__":
+    main()
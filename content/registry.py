@@ -0,0 +1,56 @@
+"""Topic registry for the Linux TUI Tutorial content classes"""
+
+from typing import Callable, Dict, List
+
+
+class TopicNotFoundError(KeyError):
+    """Raised when a topic id has no registered content builder"""
+
+    def __init__(self, tier: str, topic_id: str):
+        super().__init__(topic_id)
+        self.tier = tier
+        self.topic_id = topic_id
+
+    def __str__(self) -> str:
+        return f"No {self.tier} topic registered for '{self.topic_id}'"
+
+
+class TopicRegistry:
+    """Maps topic ids to content builders and memoizes the built content"""
+
+    def __init__(self, tier: str):
+        self.tier = tier
+        self._builders: Dict[str, Callable[[], str]] = {}
+        self._cache: Dict[str, str] = {}
+
+    def register(self, topic_id: str) -> Callable[[Callable[[], str]], Callable[[], str]]:
+        """Decorator registering a content builder under a topic id"""
+        def decorator(builder: Callable[[], str]) -> Callable[[], str]:
+            if topic_id in self._builders:
+                raise ValueError(f"Duplicate {self.tier} topic id '{topic_id}'")
+            self._builders[topic_id] = builder
+            return builder
+        return decorator
+
+    def get(self, topic_id: str) -> str:
+        """Build (once) and return the content for a topic id"""
+        try:
+            return self._cache[topic_id]
+        except KeyError:
+            pass
+        try:
+            builder = self._builders[topic_id]
+        except KeyError:
+            raise TopicNotFoundError(self.tier, topic_id) from None
+        content = self._cache[topic_id] = builder()
+        return content
+
+    def topic_ids(self) -> List[str]:
+        """Get the registered topic ids in registration order"""
+        return list(self._builders)
+
+    def __contains__(self, topic_id: str) -> bool:
+        return topic_id in self._builders
+
+    def __len__(self) -> int:
+        return len(self._builders)
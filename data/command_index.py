@@ -0,0 +1,126 @@
+"""Structured command index parsed from topic bullet lines"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+BULLET_RE = re.compile(r"^\s*•\s+(?P<command>.+?)(?:\s+-\s+(?P<description>[A-Z(].*))?\s*$")
+PROGRAM_RE = re.compile(r"^[a-z0-9_][a-z0-9_.+/-]*$")
+HEADING_RE = re.compile(r"^\W*(?P<title>\w.*?):\s*$")
+
+
+@dataclass(frozen=True)
+class CommandRecord:
+    """A documented command invocation from a topic"""
+    command: str
+    program: str
+    flags: Tuple[str, ...]
+    description: str
+    section: str
+    tier: str
+    topic_id: str
+    line_no: int
+
+
+def parse_topic(tier: str, topic_id: str, text: str) -> List[CommandRecord]:
+    """Parse the `• command - description` lines of a topic into records
+
+    Bullets whose first word does not look like a program name (prose such
+    as "• Use arrow keys") are skipped. The section is the closest preceding
+    heading line, with its leading emoji removed.
+    """
+    records = []
+    section = ""
+    for line_no, line in enumerate(text.splitlines()):
+        bullet = BULLET_RE.match(line)
+        if bullet is None:
+            heading = HEADING_RE.match(line)
+            if heading is not None:
+                section = heading.group("title")
+            continue
+        command = bullet.group("command")
+        words = command.split()
+        program = words[0]
+        if not PROGRAM_RE.match(program):
+            continue
+        flags = tuple(word for word in words[1:] if word.startswith("-") and len(word) > 1)
+        records.append(CommandRecord(
+            command=command,
+            program=program,
+            flags=flags,
+            description=bullet.group("description") or "",
+            section=section,
+            tier=tier,
+            topic_id=topic_id,
+            line_no=line_no,
+        ))
+    return records
+
+
+class _TrieNode:
+    """Node of the command prefix trie"""
+    __slots__ = ("children", "records")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.records: List[int] = []
+
+
+class CommandIndex:
+    """Command records with a prefix trie over the full invocation text"""
+
+    def __init__(self, records: Iterable[CommandRecord] = ()):
+        self.records: List[CommandRecord] = []
+        self._root = _TrieNode()
+        for record in records:
+            self.add(record)
+
+    def add(self, record: CommandRecord) -> None:
+        """Add a record to the index"""
+        node = self._root
+        for char in record.command.lower():
+            node = node.children.setdefault(char, _TrieNode())
+        node.records.append(len(self.records))
+        self.records.append(record)
+
+    def lookup(self, prefix: str, limit: Optional[int] = None) -> List[CommandRecord]:
+        """Get the records whose command starts with a prefix, in document order"""
+        node = self._root
+        for char in prefix.lower():
+            node = node.children.get(char)
+            if node is None:
+                return []
+        matches: List[int] = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            matches.extend(node.records)
+            stack.extend(node.children.values())
+        matches.sort()
+        if limit is not None:
+            matches = matches[:limit]
+        return [self.records[index] for index in matches]
+
+    def for_topic(self, tier: str, topic_id: str) -> List[CommandRecord]:
+        """Get the records of one topic in document order"""
+        return [
+            record for record in self.records
+            if record.tier == tier and record.topic_id == topic_id
+        ]
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+
+@lru_cache(maxsize=None)
+def get_command_index() -> CommandIndex:
+    """Parse every topic once and reuse the resulting index"""
+    from content import library
+
+    index = CommandIndex()
+    for tier, topic_id, text in library.iter_topics():
+        for record in parse_topic(tier, topic_id, text):
+            index.add(record)
+    return index
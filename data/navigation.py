@@ -2,7 +2,7 @@
 
 from enum import Enum
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 
 class NavigationState(Enum):
@@ -21,6 +21,24 @@ class MenuItem:
     description: str = ""
 
 
+@dataclass(frozen=True)
+class Route:
+    """Data class for what activating a menu item does
+    
+    A route either runs an application action (`action_<action>`) or, when
+    it has a topic, shows that topic of its tier.
+    """
+    id: str
+    action: str = ""
+    tier: Optional[str] = None
+    topic_id: Optional[str] = None
+    
+    @property
+    def is_topic(self) -> bool:
+        """Whether the route opens a topic"""
+        return self.topic_id is not None
+
+
 class MenuStructure:
     """Centralized menu structure definition"""
     
@@ -58,6 +76,30 @@ class MenuStructure:
         MenuItem("Performance Tuning", "adv-performance", "Optimization techniques"),
     ]
     
+    TIER_PREFIXES = {
+        "basic": "basic",
+        "intermediate": "inter",
+        "advanced": "adv",
+    }
+
+    TIER_STATES = {
+        "basic": NavigationState.BASIC_SUBMENU,
+        "intermediate": NavigationState.INTERMEDIATE_SUBMENU,
+        "advanced": NavigationState.ADVANCED_SUBMENU,
+    }
+    
+    STATE_TIERS = {state: tier for tier, state in TIER_STATES.items()}
+    
+    # Actions of the menu items that do not open a topic
+    ITEM_ACTIONS = {
+        "basic": "select_basic",
+        "intermediate": "select_intermediate",
+        "advanced": "select_advanced",
+        "exit": "quit",
+    }
+    
+    _routes: Optional[Dict[str, Route]] = None
+    
     @classmethod
     def get_menu_items(cls, state: NavigationState) -> List[MenuItem]:
         """Get menu items for a specific navigation state"""
@@ -82,3 +124,44 @@ class MenuStructure:
             NavigationState.ADVANCED_SUBMENU: "Advanced Topics:"
         }
         return titles.get(state, "Linux Ref. Guide")
+    
+    @classmethod
+    def get_topic_item(cls, tier: str, topic_id: str) -> Optional[MenuItem]:
+        """Get the menu item that opens a topic, if the topic is on a menu"""
+        state = cls.TIER_STATES.get(tier)
+        if state is None:
+            return None
+        item_id = f"{cls.TIER_PREFIXES[tier]}-{topic_id}"
+        for item in cls.get_menu_items(state):
+            if item.id == item_id:
+                return item
+        return None
+    
+    @classmethod
+    def get_routes(cls) -> Dict[str, Route]:
+        """Get the route of every menu item, keyed by menu item id"""
+        if cls._routes is None:
+            routes = {item_id: Route(item_id, action) for item_id, action in cls.ITEM_ACTIONS.items()}
+            for tier, state in cls.TIER_STATES.items():
+                back_id = cls.get_back_id(state)
+                routes[back_id] = Route(back_id, "back_to_main")
+                prefix = f"{cls.TIER_PREFIXES[tier]}-"
+                for item in cls.get_menu_items(state):
+                    routes[item.id] = Route(item.id, "show_topic", tier, item.id[len(prefix):])
+            cls._routes = routes
+        return cls._routes
+    
+    @classmethod
+    def get_back_id(cls, state: NavigationState) -> str:
+        """Get the id of a submenu's back button, unique across the menus"""
+        return f"back-{cls.TIER_PREFIXES[cls.STATE_TIERS[state]]}"
+    
+    @classmethod
+    def get_tier_routes(cls, tier: str) -> List[Route]:
+        """Get the topic routes of a tier in menu order"""
+        return [route for route in cls.get_routes().values() if route.tier == tier]
+    
+    @classmethod
+    def get_route(cls, item_id: str) -> Optional[Route]:
+        """Get the route of a menu item"""
+        return cls.get_routes().get(item_id)
@@ -0,0 +1,170 @@
+"""Centralized navigation state for the Linux TUI Tutorial"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from data.navigation import NavigationState
+
+
+Listener = Callable[[Any], None]
+
+
+@dataclass
+class HistoryEntry:
+    """Data class for a view in the navigation history"""
+    view: str
+    state: NavigationState
+    topic: Optional[Tuple[str, str]] = None
+    # Source line at the top of the viewer when the view was left
+    line: int = 0
+    # Rendered content kept to restore the view without regenerating it;
+    # dropped for entries far from the current one
+    rendered: Any = None
+
+
+class NavigationStore:
+    """Single source of truth for where the user is in the guide
+
+    The store holds independent slices:
+
+    - `state`: the NavigationState whose menu the sidebar shows
+    - `view`: the id of the view displayed in the content area
+    - `topic`: (tier, topic id) of the displayed topic, or None
+    - `history`: the ids of the views in the back/forward history
+
+    Widgets subscribe to the slices they depend on. Writes update the values
+    at once, but listeners are notified later, in one flush: every change
+    made within a batch, or within one event handler when a scheduler is
+    given, results in at most one call per changed slice with its final
+    value.
+    """
+
+    SLICES = ("state", "view", "topic", "history")
+    MAX_HISTORY = 50
+    # Entries further than this from the current one keep only their ids
+    MAX_RENDERED = 8
+
+    def __init__(self, schedule: Optional[Callable[[Callable[[], None]], Any]] = None):
+        self.state = NavigationState.MAIN_MENU
+        self.view = "welcome"
+        self.topic: Optional[Tuple[str, str]] = None
+        self._entries: List[HistoryEntry] = [HistoryEntry(self.view, self.state)]
+        self._cursor = 0
+        self._listeners: Dict[str, List[Listener]] = {name: [] for name in self.SLICES}
+        self._schedule = schedule
+        self._batch_depth = 0
+        self._flush_scheduled = False
+        # Value of each slice changed since the last flush, before the change
+        self._changed: Dict[str, Any] = {}
+        self.flushes = 0
+
+    @property
+    def history(self) -> Tuple[str, ...]:
+        """View ids in the history, oldest first"""
+        return tuple(entry.view for entry in self._entries)
+
+    @property
+    def history_entry(self) -> HistoryEntry:
+        """The history entry of the displayed view"""
+        return self._entries[self._cursor]
+
+    @property
+    def can_go_back(self) -> bool:
+        return self._cursor > 0
+
+    @property
+    def can_go_forward(self) -> bool:
+        return self._cursor < len(self._entries) - 1
+
+    def subscribe(self, name: str, listener: Listener) -> Callable[[], None]:
+        """Call a listener with a slice's new value whenever it changes
+
+        Returns a function that removes the subscription.
+        """
+        listeners = self._listeners[name]
+        listeners.append(listener)
+        return lambda: listeners.remove(listener) if listener in listeners else None
+
+    def set_state(self, state: NavigationState) -> None:
+        """Change the navigation state"""
+        self._update("state", state)
+
+    def set_view(self, view: str, topic: Optional[Tuple[str, str]] = None) -> None:
+        """Change the displayed view and the topic it shows"""
+        if view != self.history_entry.view:
+            # A new view: forget the forward history and add an entry
+            self._mark("history", self.history)
+            del self._entries[self._cursor + 1:]
+            self._entries.append(HistoryEntry(view, self.state, topic))
+            del self._entries[:-self.MAX_HISTORY]
+            self._cursor = len(self._entries) - 1
+            self._trim_rendered()
+        self._update("view", view)
+        self._update("topic", topic)
+
+    def remember(self, line: int, rendered: Any = None) -> None:
+        """Save the scroll position and rendered content of the displayed view"""
+        entry = self.history_entry
+        if entry.view == self.view:
+            entry.line = line
+            entry.rendered = rendered
+
+    def move_history(self, steps: int) -> Optional[HistoryEntry]:
+        """Move back (negative) or forward through the history
+
+        Returns the entry to display, or None at either end. The view
+        itself is set once the entry has been displayed.
+        """
+        cursor = self._cursor + steps
+        if not 0 <= cursor < len(self._entries):
+            return None
+        self._cursor = cursor
+        self._trim_rendered()
+        return self._entries[cursor]
+
+    def _trim_rendered(self) -> None:
+        """Drop the rendered content of entries far from the current one"""
+        for index, entry in enumerate(self._entries):
+            if abs(index - self._cursor) > self.MAX_RENDERED:
+                entry.rendered = None
+
+    @contextmanager
+    def batch(self) -> Iterator["NavigationStore"]:
+        """Group changes so listeners see only the end result"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+
+    def _update(self, name: str, value: Any) -> None:
+        old = getattr(self, name)
+        if value != old:
+            setattr(self, name, value)
+            self._mark(name, old)
+
+    def _mark(self, name: str, old: Any) -> None:
+        """Record that a slice changed and schedule a flush"""
+        self._changed.setdefault(name, old)
+        if self._batch_depth:
+            return
+        if self._schedule is None:
+            self.flush()
+        elif not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._schedule(self.flush)
+
+    def flush(self) -> None:
+        """Notify listeners of the slices that changed since the last flush"""
+        self._flush_scheduled = False
+        changed, self._changed = self._changed, {}
+        if changed:
+            self.flushes += 1
+        for name in self.SLICES:
+            if name in changed and changed[name] != getattr(self, name):
+                value = getattr(self, name)
+                for listener in list(self._listeners[name]):
+                    listener(value)
@@ -0,0 +1,164 @@
+"""Full-text search index over all tutorial topics"""
+
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple
+
+
+TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase search tokens"""
+    return TOKEN_RE.findall(text.lower())
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """A ranked search result pointing at one line of a topic"""
+    tier: str
+    topic_id: str
+    line_no: int
+    line: str
+    score: int
+
+
+class SearchIndex:
+    """Inverted index mapping tokens to the lines of the topics they occur on
+
+    Lines are numbered globally across topics, so a posting list is a
+    sorted list of line numbers and each line maps back to its topic.
+    """
+
+    MAX_PREFIX_TERMS = 32
+
+    def __init__(self):
+        self._topics: List[Tuple[str, str]] = []
+        self._topic_starts: List[int] = []
+        self._line_topics: List[int] = []
+        self._lines: List[str] = []
+        self._postings: Dict[str, List[int]] = {}
+        self._topic_sets: Dict[str, Set[int]] = {}
+        self._line_sets: Dict[str, Tuple[List[int], FrozenSet[int]]] = {}
+        self._vocabulary: List[str] = []
+
+    def add_topic(self, tier: str, topic_id: str, text: str) -> None:
+        """Index every line of a topic"""
+        doc = len(self._topics)
+        self._topics.append((tier, topic_id))
+        self._topic_starts.append(len(self._lines))
+        postings = self._postings
+        topic_sets = self._topic_sets
+        for line in text.splitlines():
+            line_id = len(self._lines)
+            self._lines.append(line)
+            self._line_topics.append(doc)
+            for token in set(tokenize(line)):
+                postings.setdefault(token, []).append(line_id)
+                topic_sets.setdefault(token, set()).add(doc)
+        self._line_sets.clear()
+        self._vocabulary = []
+
+    def _expand(self, token: str, prefix: bool) -> List[str]:
+        """Get the indexed terms matching a query token"""
+        if not prefix:
+            return [token] if token in self._postings else []
+        if not self._vocabulary:
+            self._vocabulary = sorted(self._postings)
+        vocabulary = self._vocabulary
+        start = bisect_left(vocabulary, token)
+        end = bisect_left(vocabulary, token + "\uffff", start)
+        return vocabulary[start:min(end, start + self.MAX_PREFIX_TERMS)]
+
+    def _term_lines(self, terms: List[str]) -> Tuple[List[int], FrozenSet[int]]:
+        """Get the sorted lines and line set containing any of the terms"""
+        key = " ".join(terms)
+        cached = self._line_sets.get(key)
+        if cached is None:
+            if len(terms) == 1:
+                ordered = self._postings[terms[0]]
+                cached = (ordered, frozenset(ordered))
+            else:
+                merged = frozenset().union(*(self._postings[term] for term in terms))
+                cached = (sorted(merged), merged)
+            self._line_sets[key] = cached
+        return cached
+
+    def search(self, query: str, limit: int = 20) -> List[SearchHit]:
+        """Find the best matching lines for a query
+
+        Every query token must occur in a topic for it to match, and the
+        last token also matches as a prefix while the user is still typing.
+        Lines containing every token rank first, followed by the lines of
+        each token from rarest to most common. Only the rarest posting list
+        is scanned in full and the rest stop once the limit is reached.
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return []
+        prefix_last = not query[-1:].isspace()
+
+        matches = []
+        topics = None
+        for position, token in enumerate(tokens):
+            is_prefix = prefix_last and position == len(tokens) - 1 and len(token) > 1
+            terms = self._expand(token, is_prefix)
+            if not terms:
+                return []
+            token_topics = set().union(*(self._topic_sets[term] for term in terms))
+            topics = token_topics if topics is None else topics & token_topics
+            if not topics:
+                return []
+            size = sum(len(self._postings[term]) for term in terms)
+            matches.append((size, terms))
+        matches.sort(key=lambda match: match[0])
+        line_lists = [self._term_lines(terms) for _, terms in matches]
+        line_sets = [lines for _, lines in line_lists]
+
+        hits: List[SearchHit] = []
+        seen: Set[int] = set()
+        line_topics = self._line_topics
+        full_matches = (
+            line_id for line_id in line_lists[0][0]
+            if all(line_id in lines for lines in line_sets[1:])
+        )
+        partial_matches = (line_id for ordered, _ in line_lists for line_id in ordered)
+        for line_id in chain(full_matches, partial_matches):
+            if len(hits) >= limit:
+                break
+            if line_id in seen or line_topics[line_id] not in topics:
+                continue
+            seen.add(line_id)
+            score = sum(line_id in lines for lines in line_sets)
+            hits.append(self._hit(line_id, score))
+        return hits
+
+    def _hit(self, line_id: int, score: int) -> SearchHit:
+        """Build a search hit for a global line number"""
+        doc = self._line_topics[line_id]
+        tier, topic_id = self._topics[doc]
+        line_no = line_id - self._topic_starts[doc]
+        return SearchHit(tier, topic_id, line_no, self._lines[line_id].strip(), score)
+
+    @classmethod
+    def from_topics(cls, topics: Iterable[Tuple[str, str, str]]) -> "SearchIndex":
+        """Build an index from (tier, topic id, content) triples"""
+        index = cls()
+        for tier, topic_id, text in topics:
+            index.add_topic(tier, topic_id, text)
+        index._vocabulary = sorted(index._postings)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._topics)
+
+
+@lru_cache(maxsize=None)
+def get_search_index() -> SearchIndex:
+    """Build the search index over every topic once and reuse it"""
+    from content import library
+
+    return SearchIndex.from_topics(library.iter_topics())
@@ -0,0 +1,114 @@
+"""Startup profiler for the Linux TUI Tutorial
+
+Enabled with `python main.py --profile-startup`. It must be imported before
+anything else in main.py so that it can time the application's own imports.
+It only depends on the standard library to keep its own cost negligible.
+"""
+
+import builtins
+import importlib
+import os
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+FLAG = "--profile-startup"
+PROJECT_PACKAGES = ("components", "content", "data", "handlers")
+STDLIB_MODULES = frozenset(getattr(sys, "stdlib_module_names", ()))
+
+
+def process_age() -> Optional[float]:
+    """Seconds since this process started, from /proc (to a clock tick), or None if unavailable"""
+    try:
+        with open("/proc/self/stat", "rb") as stat_file:
+            stat = stat_file.read()
+        # Fields after the parenthesised command name start at field 3 (state);
+        # field 22 is the start time in clock ticks since boot
+        start_ticks = int(stat[stat.rindex(b")") + 2:].split()[19])
+        return time.clock_gettime(time.CLOCK_BOOTTIME) - start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class StartupProfiler:
+    """Records module import times and startup milestones
+
+    Milestones are measured from the start of the process, which includes
+    interpreter startup, where /proc gives the process start time;
+    elsewhere they are measured from when the profiler was created.
+    """
+
+    def __init__(self):
+        age = process_age()
+        self.from_process_start = age is not None
+        self.start_time = time.perf_counter() - (age or 0.0)
+        self.imports: Dict[str, float] = {}
+        self.milestones: List[Tuple[str, float]] = []
+        self._original_import = builtins.__import__
+        self._original_import_module = importlib.import_module
+        self._depth = 0
+
+    @classmethod
+    def from_argv(cls, argv: List[str]) -> Optional["StartupProfiler"]:
+        """Create and start a profiler if the command line asks for one"""
+        if FLAG not in argv:
+            return None
+        profiler = cls()
+        profiler.start()
+        return profiler
+
+    def start(self) -> None:
+        """Start timing imports"""
+        builtins.__import__ = self._timed_import
+        importlib.import_module = self._timed_import_module
+
+    def stop(self) -> None:
+        """Stop timing imports"""
+        builtins.__import__ = self._original_import
+        importlib.import_module = self._original_import_module
+
+    def _record(self, name: str, started: float) -> None:
+        """Record the cumulative import time of a newly loaded module"""
+        self.imports.setdefault(name, time.perf_counter() - started)
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level or name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+        started = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            self._record(name, started)
+
+    def _timed_import_module(self, name, package=None):
+        if name in sys.modules:
+            return self._original_import_module(name, package)
+        started = time.perf_counter()
+        try:
+            return self._original_import_module(name, package)
+        finally:
+            self._record(name, started)
+
+    def mark(self, milestone: str) -> None:
+        """Record a milestone relative to the start of the process (or profiler)"""
+        self.milestones.append((milestone, time.perf_counter() - self.start_time))
+
+    def report(self) -> str:
+        """Format the import times and milestones as a text report"""
+        lines = ["Startup profile", "", "Imports (cumulative, first import only):"]
+        # Project modules individually, third-party packages by top level only
+        reported: Dict[str, float] = {}
+        for name, elapsed in self.imports.items():
+            package = name.split(".")[0]
+            if package in PROJECT_PACKAGES:
+                reported[name] = elapsed
+            elif package and package not in STDLIB_MODULES and not package.startswith("_"):
+                reported[package] = max(reported.get(package, 0.0), elapsed)
+        for name, elapsed in sorted(reported.items(), key=lambda item: -item[1]):
+            lines.append(f"  {elapsed * 1000:8.1f} ms  {name}")
+        origin = "process start" if self.from_process_start else "profiler start, excluding interpreter startup"
+        lines += ["", f"Milestones (since {origin}):"]
+        for milestone, elapsed in self.milestones:
+            lines.append(f"  {elapsed * 1000:8.1f} ms  {milestone}")
+        return "\n".join(lines)
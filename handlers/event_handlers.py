@@ -1,77 +1,150 @@
 """Event handling logic for the Linux TUI Tutorial"""
 
+from typing import TYPE_CHECKING, Callable
+
 from textual.widgets import Button
 
-from data.navigation import NavigationState
+from data.navigation import NavigationState, MenuStructure, Route
 from components.main_content import MainContent
+from components.sidebar import Sidebar
+from components.live_area import LiveArea
+
+if TYPE_CHECKING:
+    # Imported on first use at runtime, to keep them out of startup
+    from components.command_runner import CommandRunnerPanel
+    from components.search_panel import SearchPanel
 
 
 class EventHandlerMixin:
-    """Mixin class containing all event handling logic"""
+    """Mixin class containing all event handling logic
+    
+    Menu changes and focus moves are queued on `self.intents` (an
+    IntentCoalescer) and applied together once pending input is handled,
+    so a burst of key presses only renders its final state.
+    """
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press events"""
-        button_id = event.button.id
-        
-        # Navigation buttons
-        if button_id == "basic":
-            self.action_select_basic()
-        elif button_id == "intermediate":
-            self.action_select_intermediate()
-        elif button_id == "advanced":
-            self.action_select_advanced()
-        elif button_id == "exit":
-            self.action_quit()
-        elif button_id == "back":
-            self.action_back_to_main()
-        
-        # Basic topic buttons
-        elif button_id.startswith("basic-"):
-            topic_id = button_id.replace("basic-", "")
-            self.show_topic("basic", topic_id)
+        route = MenuStructure.get_route(event.button.id)
+        if route is not None:
+            self.follow_route(route)
+    
+    def follow_route(self, route: Route) -> None:
+        """Run the action of a route or show its topic"""
+        if route.is_topic:
+            self.show_topic(route.tier, route.topic_id)
+        else:
+            getattr(self, f"action_{route.action}")()
+    
+    def open_route(self, route: Route) -> None:
+        """Navigate straight to a route, as if its menu had been opened first"""
+        with self.navigation.batch():
+            if route.is_topic:
+                self.navigation.set_state(MenuStructure.TIER_STATES[route.tier])
+            self.follow_route(route)
+            self.flush_navigation()
+        # Menus are mounted on the next refresh
+        sidebar = self.query_one("#sidebar", Sidebar)
+        self.call_after_refresh(sidebar.focus_item, route.id)
+    
+    def queue_navigation(self, state: NavigationState, show: Callable[[MainContent], None]) -> None:
+        """Queue a menu change, superseding any change not yet applied"""
+        def apply() -> None:
+            self.navigation.set_state(state)
+            show(self.query_one("#main-content", MainContent))
         
-        # Intermediate topic buttons
-        elif button_id.startswith("inter-"):
-            topic_id = button_id.replace("inter-", "")
-            self.show_topic("intermediate", topic_id)
+        if self.intents.submit(apply):
+            # Runs once the key events already queued have been handled
+            self.call_later(self.flush_navigation)
+    
+    def action_move_focus(self, steps: int) -> None:
+        """Queue a focus move through the focus chain"""
+        if self.intents.move_focus(steps):
+            self.call_later(self.flush_navigation)
+    
+    def flush_navigation(self) -> bool:
+        """Apply the final queued menu change and focus move
         
-        # Advanced topic buttons
-        elif button_id.startswith("adv-"):
-            topic_id = button_id.replace("adv-", "")
-            self.show_topic("advanced", topic_id)
+        Returns True if a menu change was applied, in which case focus
+        settles on the new menu only after the next refresh.
+        """
+        apply, steps = self.intents.take()
+        if apply is not None:
+            # Update the sidebar now so its focus handling is scheduled first
+            with self.navigation.batch():
+                apply()
+        if steps and apply is not None:
+            # Move within the new menu once it is displayed
+            self.call_after_refresh(self._move_focus, steps)
+        elif steps:
+            self._move_focus(steps)
+        return apply is not None
+    
+    def _move_focus(self, steps: int) -> None:
+        """Move focus several places along the focus chain in one step"""
+        chain = self.screen.focus_chain
+        if not chain:
+            return
+        if self.focused in chain:
+            index = chain.index(self.focused)
+        elif self.focused is not None:
+            # Focus is on a menu just hidden; count from the one replacing it
+            index = 0
+        else:
+            index = -1 if steps > 0 else 0
+        self.set_focus(chain[(index + steps) % len(chain)])
     
     def action_select_basic(self) -> None:
         """Navigate to Basic Topics submenu"""
-        self.current_state = NavigationState.BASIC_SUBMENU
-        content = self.query_one("#main-content", MainContent)
-        content.show_basic_menu()
+        self.queue_navigation(NavigationState.BASIC_SUBMENU, MainContent.show_basic_menu)
     
     def action_select_intermediate(self) -> None:
         """Navigate to Intermediate Topics submenu"""
-        self.current_state = NavigationState.INTERMEDIATE_SUBMENU
-        content = self.query_one("#main-content", MainContent)
-        content.show_intermediate_menu()
+        self.queue_navigation(NavigationState.INTERMEDIATE_SUBMENU, MainContent.show_intermediate_menu)
     
     def action_select_advanced(self) -> None:
         """Navigate to Advanced Topics submenu"""
-        self.current_state = NavigationState.ADVANCED_SUBMENU
-        content = self.query_one("#main-content", MainContent)
-        content.show_advanced_menu()
+        self.queue_navigation(NavigationState.ADVANCED_SUBMENU, MainContent.show_advanced_menu)
     
     def action_back_to_main(self) -> None:
         """Return to the main menu"""
-        self.current_state = NavigationState.MAIN_MENU
+        self.queue_navigation(NavigationState.MAIN_MENU, MainContent.show_welcome)
+    
+    def action_history_back(self) -> None:
+        """Go back to the previous view in the history"""
+        self._go_history(-1)
+    
+    def action_history_forward(self) -> None:
+        """Go forward to the next view in the history"""
+        self._go_history(1)
+    
+    def _go_history(self, steps: int) -> None:
+        """Restore a view from the history along with its menu"""
+        self.flush_navigation()
         content = self.query_one("#main-content", MainContent)
-        content.show_welcome()
+        with self.navigation.batch():
+            entry = content.go_history(steps)
+            if entry is None:
+                self.bell()
+            else:
+                self.navigation.set_state(entry.state)
     
     def action_select_focused(self) -> None:
         """Select the currently focused button"""
+        if self.flush_navigation():
+            self.call_after_refresh(self._press_focused)
+        else:
+            self._press_focused()
+    
+    def _press_focused(self) -> None:
+        """Press the focused button, if a button has focus"""
         focused = self.focused
         if isinstance(focused, Button):
             focused.press()
     
     def action_help(self) -> None:
         """Show help information"""
+        self.flush_navigation()
         content = self.query_one("#main-content", MainContent)
         content.show_help()
     
@@ -79,3 +152,57 @@ class EventHandlerMixin:
         """Show specific topic content"""
         content = self.query_one("#main-content", MainContent)
         content.show_topic_content(topic_level, topic_id)
+    
+    async def action_search(self) -> None:
+        """Open the full-text search panel, mounting it on first use"""
+        from components.search_panel import SearchPanel
+        
+        self.flush_navigation()
+        panels = self.query(SearchPanel)
+        if panels:
+            panel = panels.first()
+        else:
+            panel = SearchPanel(id="search-panel")
+            await self.query_one("#main-container").mount(panel, before="#content-layout")
+        panel.open()
+    
+    def action_toggle_live(self) -> None:
+        """Show or hide the live panels next to topics"""
+        enabled = self.query_one("#live-area", LiveArea).toggle()
+        self.notify("Live panels on" if enabled else "Live panels off")
+    
+    async def action_run_commands(self) -> None:
+        """Open the command runner with the commands of the current topic"""
+        panel = await self._command_runner()
+        topic = self.navigation.topic
+        if topic is None:
+            panel.open()
+        else:
+            panel.open(*topic)
+    
+    async def _command_runner(self) -> "CommandRunnerPanel":
+        """Get the command runner panel, mounting it on first use"""
+        from components.command_runner import CommandRunnerPanel
+        
+        panels = self.query(CommandRunnerPanel)
+        if panels:
+            return panels.first()
+        panel = CommandRunnerPanel(id="command-runner")
+        await self.query_one("#main-container").mount(panel, after="#content-layout")
+        return panel
+    
+    async def on_search_panel_run_requested(self, event: "SearchPanel.RunRequested") -> None:
+        """Run a command picked in the search results"""
+        panel = await self._command_runner()
+        panel.run_command(event.command)
+    
+    def on_search_panel_hit_selected(self, event: "SearchPanel.HitSelected") -> None:
+        """Open the topic of a search result and jump to the matching line"""
+        hit = event.hit
+        self.flush_navigation()
+        with self.navigation.batch():
+            self.navigation.set_state(MenuStructure.TIER_STATES[hit.tier])
+            self.show_topic(hit.tier, hit.topic_id)
+        content = self.query_one("#main-content", MainContent)
+        content.scroll_to_line(hit.line_no)
+        content.viewer.focus()
@@ -0,0 +1,51 @@
+"""Navigation intent coalescing for the Linux TUI Tutorial"""
+
+from typing import Callable, Optional, Tuple
+
+
+class IntentCoalescer:
+    """Collapses bursts of navigation intents into the final one
+
+    Menu changes replace each other, so only the last one is applied.
+    Focus moves are summed into a single move. Intents queue up until the
+    application drains its pending input and calls take().
+    """
+
+    def __init__(self):
+        self.action: Optional[Callable[[], None]] = None
+        self.focus_steps = 0
+        self.scheduled = False
+        self.submitted = 0
+        self.applied = 0
+
+    @property
+    def skipped(self) -> int:
+        """Number of intents that were superseded before being applied"""
+        return self.submitted - self.applied
+
+    def submit(self, action: Callable[[], None]) -> bool:
+        """Queue a menu change, returning True if a flush must be scheduled"""
+        self.submitted += 1
+        self.action = action
+        # Focus moves made before a menu change are moot once it is applied
+        self.focus_steps = 0
+        return self._schedule()
+
+    def move_focus(self, steps: int) -> bool:
+        """Queue a focus move, returning True if a flush must be scheduled"""
+        self.submitted += 1
+        self.focus_steps += steps
+        return self._schedule()
+
+    def _schedule(self) -> bool:
+        if self.scheduled:
+            return False
+        self.scheduled = True
+        return True
+
+    def take(self) -> Tuple[Optional[Callable[[], None]], int]:
+        """Remove and return the pending menu change and focus move"""
+        action, steps = self.action, self.focus_steps
+        self.action, self.focus_steps, self.scheduled = None, 0, False
+        self.applied += (action is not None) + (steps != 0)
+        return action, steps
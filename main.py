@@ -4,16 +4,27 @@ Linux TUI Tutorial - Main Application Entry Point
 Built with Textual for a modern, responsive TUI experience.
 """
 
+import argparse
+import sys
+from typing import Optional
+
+# Imported first so --profile-startup can time every import below
+from diagnostics.startup import StartupProfiler
+
+PROFILER = StartupProfiler.from_argv(sys.argv)
+
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal
 from textual.widgets import Header, Footer
 from textual.binding import Binding
-from textual.reactive import reactive
 
 from components.sidebar import Sidebar
 from components.main_content import MainContent
-from data.navigation import NavigationState
+from components.live_area import LiveArea
+from data.navigation import NavigationState, MenuStructure, Route
 from handlers.event_handlers import EventHandlerMixin
+from handlers.intents import IntentCoalescer
+from data.navigation_store import NavigationStore
 
 
 class LinuxTutorialApp(App, EventHandlerMixin):
@@ -31,12 +42,22 @@ class LinuxTutorialApp(App, EventHandlerMixin):
         Binding("2", "select_intermediate", "Intermediate Topics"),
         Binding("3", "select_advanced", "Advanced Topics"),
         Binding("escape", "back_to_main", "Back"),
-        Binding("up", "focus_previous", "Up", show=False),
-        Binding("down", "focus_next", "Down", show=False),
+        Binding("left_square_bracket", "history_back", "Prev"),
+        Binding("right_square_bracket", "history_forward", "Next"),
+        Binding("slash", "search", "Search"),
+        Binding("r", "run_commands", "Run"),
+        Binding("l", "toggle_live", "Live"),
+        Binding("up", "move_focus(-1)", "Up", show=False),
+        Binding("down", "move_focus(1)", "Down", show=False),
         Binding("enter", "select_focused", "Select", show=False),
     ]
 
-    current_state = reactive(NavigationState.MAIN_MENU)
+    def __init__(self, initial_route: Optional[Route] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.initial_route = initial_route
+        self.intents = IntentCoalescer()
+        # Listeners are notified once per handler, after its changes
+        self.navigation = NavigationStore(schedule=self.call_later)
 
     def compose(self) -> ComposeResult:
         """Create the application layout"""
@@ -45,6 +66,7 @@ class LinuxTutorialApp(App, EventHandlerMixin):
             with Horizontal(id="content-layout"):
                 yield Sidebar(id="sidebar")
                 yield MainContent(id="main-content")
+                yield LiveArea(id="live-area")
         yield Footer()
 
     def on_mount(self) -> None:
@@ -70,7 +92,6 @@ class LinuxTutorialApp(App, EventHandlerMixin):
         sidebar.styles.dock = "left"
         sidebar.styles.border_right = ("solid", "white")
         sidebar.styles.padding = 1
-        sidebar.current_state = self.current_state
 
         # Configure main content
         main_content = self.query_one("#main-content")
@@ -101,7 +122,6 @@ class LinuxTutorialApp(App, EventHandlerMixin):
         sidebar.styles.dock = "left"
         sidebar.styles.border_right = ("solid", "white")
         sidebar.styles.padding = 1
-        sidebar.current_state = self.current_state
 
         # Configure main content
         main_content = self.query_one("#main-content")
@@ -109,16 +129,64 @@ class LinuxTutorialApp(App, EventHandlerMixin):
         main_content.styles.height = "100%"
         main_content.styles.padding = 1
 
-    def watch_current_state(self, state: NavigationState) -> None:
-        """Update sidebar when navigation state changes"""
-        sidebar = self.query_one("#sidebar", Sidebar)
-        sidebar.current_state = state
+        self.navigation.subscribe("state", self._navigation_state_changed)
+
+        # Deep link: open the requested menu or topic before the first paint
+        if self.initial_route is not None:
+            self.open_route(self.initial_route)
+
+    def _navigation_state_changed(self, state: NavigationState) -> None:
+        """Prepare the topics of an open submenu before one is picked"""
+        main_content = self.query_one("#main-content", MainContent)
+        tier = MenuStructure.STATE_TIERS.get(state)
+        if tier is None:
+            main_content.cancel_prefetch()
+        else:
+            main_content.prefetch_tier(tier)
+
+    def on_ready(self) -> None:
+        """Record startup milestones once the first frame is displayed"""
+        if PROFILER is not None:
+            PROFILER.mark("first paint")
+            self.call_after_refresh(self._startup_profiled)
+
+    def _startup_profiled(self) -> None:
+        """Record time to interactive and exit when profiling startup"""
+        PROFILER.mark("interactive")
+        self.exit()
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Linux Ref. Guide")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="report import times, time to first paint and time to interactive, then exit",
+    )
+    parser.add_argument(
+        "--open",
+        metavar="ROUTE",
+        choices=sorted(
+            route_id for route_id, route in MenuStructure.get_routes().items()
+            if route.action not in ("quit", "back_to_main")
+        ),
+        help="start on a menu or topic, e.g. adv-performance",
+    )
+    return parser.parse_args(argv)
+
 
 def main():
     """Entry point for the application"""
-    app = LinuxTutorialApp()
+    args = parse_args()
+    if PROFILER is not None:
+        PROFILER.mark("imports done")
+    app = LinuxTutorialApp(initial_route=MenuStructure.get_route(args.open) if args.open else None)
     try:
         app.run()
+        if PROFILER is not None:
+            PROFILER.stop()
+            print(PROFILER.report())
     except KeyboardInterrupt:
         print("\n Thanks for using Linux Ref. Guide!")
     except Exception as e:
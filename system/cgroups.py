@@ -0,0 +1,174 @@
+"""Lazy cgroup v2 tree for the Linux TUI Tutorial"""
+
+import os
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+
+CGROUP_ROOT = "/sys/fs/cgroup"
+
+
+def find_cgroup2_root(mountinfo: str = "/proc/self/mountinfo") -> Optional[str]:
+    """Mount point of the cgroup v2 hierarchy, preferring /sys/fs/cgroup"""
+    mounts: List[str] = []
+    try:
+        with open(mountinfo) as lines:
+            for line in lines:
+                # ... mount-point ... - fstype source options
+                fields, _, filesystem = line.partition(" - ")
+                if filesystem.split(" ", 1)[0] == "cgroup2":
+                    mounts.append(fields.split()[4])
+    except OSError:
+        return None
+    if CGROUP_ROOT in mounts:
+        return CGROUP_ROOT
+    # Hybrid hosts mount it at /sys/fs/cgroup/unified
+    return mounts[0] if mounts else None
+
+
+@dataclass
+class CgroupUsage:
+    """Data class for one reading of a cgroup's controller files
+
+    Figures are None when the controller is not enabled for the cgroup.
+    Rates are measured between this reading and the previous one.
+    """
+    read_at: float = 0.0
+    cpu_usec: Optional[int] = None
+    memory_bytes: Optional[int] = None
+    io_read_bytes: Optional[int] = None
+    io_write_bytes: Optional[int] = None
+    pids: Optional[int] = None
+    cpu_percent: Optional[float] = None
+    io_read_rate: Optional[float] = None
+    io_write_rate: Optional[float] = None
+
+
+class CgroupNode:
+    """One cgroup directory; its children are listed only when asked for"""
+    __slots__ = ("name", "parent", "children", "listed_at", "usage", "error")
+
+    def __init__(self, name: str, parent: Optional["CgroupNode"] = None):
+        self.name = name
+        self.parent = parent
+        # None until the directory has been listed
+        self.children: Optional[Dict[str, CgroupNode]] = None
+        self.listed_at = 0.0
+        self.usage = CgroupUsage()
+        self.error: Optional[str] = None
+
+    @property
+    def path(self) -> str:
+        if self.parent is None:
+            return self.name
+        return os.path.join(self.parent.path, self.name)
+
+
+@dataclass
+class CgroupStats:
+    """Data class for what one refresh did"""
+    listed: int = 0
+    read: int = 0
+    cached: int = 0
+    elapsed: float = 0.0
+
+
+class CgroupTree:
+    """cgroup v2 hierarchy read on demand, one node at a time
+
+    Nothing is walked up front: a cgroup's subdirectories are listed when
+    its node is expanded, and cpu.stat, memory.current, io.stat and
+    pids.current are read only for the nodes passed to refresh(), which
+    the panel limits to the visible ones. Listings and readings are cached
+    for `interval` seconds, so refreshing more often (on expand, say) does
+    not read the files again; CPU and I/O rates are the change in the
+    cumulative counters between a node's last two readings.
+    """
+
+    def __init__(self, root: str = CGROUP_ROOT, interval: float = 2.0):
+        self.root = CgroupNode(root)
+        self.interval = interval
+
+    def refresh(self, nodes: Iterable[CgroupNode], expanded: Iterable[CgroupNode] = ()) -> CgroupStats:
+        """Re-list the expanded nodes and re-read the given nodes where their cache is stale"""
+        stats = CgroupStats()
+        started = time.perf_counter()
+        now = time.monotonic()
+        for node in expanded:
+            if node.children is None or now - node.listed_at >= self.interval:
+                self._list(node, now)
+                stats.listed += 1
+        for node in nodes:
+            if node.usage.read_at and now - node.usage.read_at < self.interval:
+                stats.cached += 1
+                continue
+            node.usage = self._read(node, now)
+            stats.read += 1
+        stats.elapsed = time.perf_counter() - started
+        return stats
+
+    def _list(self, node: CgroupNode, now: float) -> None:
+        """List a cgroup's subdirectories, keeping the nodes (and readings) of those still present"""
+        previous = node.children or {}
+        children: Dict[str, CgroupNode] = {}
+        try:
+            with os.scandir(node.path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        children[entry.name] = previous.get(entry.name) or CgroupNode(entry.name, node)
+            node.error = None
+        except OSError as error:
+            # Removed, or not ours to read
+            node.error = error.strerror or str(error)
+        node.children = children
+        node.listed_at = now
+
+    def _read(self, node: CgroupNode, now: float) -> CgroupUsage:
+        """Read one cgroup's controller files and compute rates against its previous reading"""
+        path = node.path
+        usage = CgroupUsage(read_at=now)
+        cpu_stat = self._read_file(os.path.join(path, "cpu.stat"))
+        if cpu_stat is not None:
+            for line in cpu_stat.splitlines():
+                name, _, value = line.partition(" ")
+                if name == "usage_usec":
+                    usage.cpu_usec = int(value)
+                    break
+        memory = self._read_file(os.path.join(path, "memory.current"))
+        if memory is not None and memory.strip().isdigit():
+            usage.memory_bytes = int(memory)
+        io_stat = self._read_file(os.path.join(path, "io.stat"))
+        if io_stat is not None:
+            # One line per device: "8:0 rbytes=... wbytes=... rios=... wios=..."
+            usage.io_read_bytes = usage.io_write_bytes = 0
+            for line in io_stat.splitlines():
+                for pair in line.split()[1:]:
+                    key, _, value = pair.partition("=")
+                    if key == "rbytes":
+                        usage.io_read_bytes += int(value)
+                    elif key == "wbytes":
+                        usage.io_write_bytes += int(value)
+        pids = self._read_file(os.path.join(path, "pids.current"))
+        if pids is not None and pids.strip().isdigit():
+            usage.pids = int(pids)
+
+        previous = node.usage
+        elapsed = now - previous.read_at
+        if previous.read_at and elapsed > 0:
+            if usage.cpu_usec is not None and previous.cpu_usec is not None:
+                # Percent of one CPU, like top
+                usage.cpu_percent = max(usage.cpu_usec - previous.cpu_usec, 0) / elapsed / 1e4
+            if usage.io_read_bytes is not None and previous.io_read_bytes is not None:
+                usage.io_read_rate = max(usage.io_read_bytes - previous.io_read_bytes, 0) / elapsed
+                usage.io_write_rate = max(usage.io_write_bytes - previous.io_write_bytes, 0) / elapsed
+        return usage
+
+    @staticmethod
+    def _read_file(path: str) -> Optional[str]:
+        """Contents of a controller file, or None if the controller is not enabled"""
+        try:
+            with open(path) as controller_file:
+                return controller_file.read()
+        except OSError:
+            return None
@@ -0,0 +1,180 @@
+"""Parallel disk usage scanning for the Linux TUI Tutorial"""
+
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+
+# Per-directory cache entry: (mtime_ns, bytes, files, subdirectory names,
+# (inode, bytes) of hard-linked files, which are counted once per scan)
+CacheEntry = Tuple[int, int, int, List[str], List[Tuple[int, int]]]
+
+
+class DirUsage:
+    """Disk usage of one directory, including everything below it
+
+    Only directories get a node; files are folded into their directory's
+    totals as they are read, so memory grows with the number of
+    directories rather than the number of inodes.
+    """
+    __slots__ = ("name", "parent", "size", "files", "dirs", "children", "remaining", "complete", "error")
+
+    def __init__(self, name: str, parent: Optional["DirUsage"] = None):
+        self.name = name
+        self.parent = parent
+        self.size = 0  # bytes allocated on disk, like du
+        self.files = 0
+        self.dirs = 0
+        self.children: Dict[str, DirUsage] = {}
+        # Subdirectories not yet completely scanned
+        self.remaining = 0
+        self.complete = False
+        self.error: Optional[str] = None
+
+    @property
+    def path(self) -> str:
+        if self.parent is None:
+            return self.name
+        return os.path.join(self.parent.path, self.name)
+
+    def add(self, size: int, files: int, dirs: int) -> None:
+        """Add totals to this directory and every directory above it"""
+        node: Optional[DirUsage] = self
+        while node is not None:
+            node.size += size
+            node.files += files
+            node.dirs += dirs
+            node = node.parent
+
+
+@dataclass
+class DiskUsageStats:
+    """Data class for what one scan did"""
+    directories: int = 0
+    cached: int = 0
+    errors: int = 0
+    elapsed: float = 0.0
+    cancelled: bool = False
+
+
+class DiskUsageScanner:
+    """Walks directory trees with os.scandir across a thread pool
+
+    Workers only read directories; the calling thread owns the DirUsage
+    tree and adds each directory's totals to its ancestors as results
+    arrive, so partial totals can be displayed while the scan runs. At most
+    a few reads per worker are in flight, and the queue of directories still
+    to read is depth-first, which keeps it short on deep trees.
+
+    Results are cached by directory mtime: a directory whose mtime has not
+    changed since the previous scan is not listed again (its subdirectories
+    are still visited, since their changes do not touch its mtime). Files
+    modified in place without being added, removed or renamed keep their
+    cached size until their directory changes. Like du -x, scans stay on the
+    root's filesystem and count a hard-linked file once, where first seen.
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = workers or min(32, (os.cpu_count() or 1) * 4)
+        self._cache: Dict[str, CacheEntry] = {}
+
+    def scan(self, root: DirUsage, cancelled: Callable[[], bool] = lambda: False) -> DiskUsageStats:
+        """Fill in a root DirUsage (named by its path); blocks until done or cancelled"""
+        started = time.perf_counter()
+        stats = DiskUsageStats()
+        device = os.stat(root.name).st_dev
+        cache: Dict[str, CacheEntry] = {}
+        linked: Set[int] = set()
+        waiting: List[DirUsage] = [root]
+        running: Dict[Future, DirUsage] = {}
+        with ThreadPoolExecutor(self.workers, thread_name_prefix="disk-usage") as pool:
+            while waiting or running:
+                if cancelled():
+                    stats.cancelled = True
+                    break
+                while waiting and len(running) < self.workers * 4:
+                    node = waiting.pop()
+                    # The root may be a symlink (to /dev/shm, say): it is followed like os.stat above
+                    running[pool.submit(self._read_dir, node.path, device, node is root)] = node
+                done, _ = wait(running, timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in done:
+                    node = running.pop(future)
+                    stats.directories += 1
+                    try:
+                        entry, from_cache = future.result()
+                    except OSError as error:
+                        node.error = error.strerror or str(error)
+                        stats.errors += 1
+                        self._complete(node)
+                        continue
+                    if entry is None:
+                        # Another filesystem mounted here
+                        node.parent.children.pop(node.name, None)
+                        node.parent.add(0, 0, -1)
+                        self._complete(node)
+                        continue
+                    stats.cached += from_cache
+                    cache[node.path] = entry
+                    _, size, files, subdirs, links = entry
+                    for inode, link_size in links:
+                        if inode not in linked:
+                            linked.add(inode)
+                            size += link_size
+                    for name in subdirs:
+                        child = DirUsage(name, node)
+                        node.children[name] = child
+                        waiting.append(child)
+                    node.remaining = len(subdirs)
+                    node.add(size, files, len(subdirs))
+                    if not subdirs:
+                        self._complete(node)
+        if stats.cancelled:
+            # Keep what was read, so the next scan after a stop starts warm
+            self._cache.update(cache)
+        else:
+            self._cache = cache
+        stats.elapsed = time.perf_counter() - started
+        return stats
+
+    def _read_dir(self, path: str, device: int, follow_symlinks: bool = False) -> Tuple[Optional[CacheEntry], bool]:
+        """List one directory (runs in a worker); None if it is on another filesystem"""
+        info = os.stat(path, follow_symlinks=follow_symlinks)
+        if info.st_dev != device:
+            return None, False
+        cached = self._cache.get(path)
+        if cached is not None and cached[0] == info.st_mtime_ns:
+            return cached, True
+        size = info.st_blocks * 512
+        files = 0
+        subdirs: List[str] = []
+        links: List[Tuple[int, int]] = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                        continue
+                    entry_info = entry.stat(follow_symlinks=False)
+                except OSError:
+                    # Removed while being listed
+                    continue
+                files += 1
+                if entry_info.st_nlink > 1:
+                    links.append((entry_info.st_ino, entry_info.st_blocks * 512))
+                else:
+                    size += entry_info.st_blocks * 512
+        return (info.st_mtime_ns, size, files, subdirs, links), False
+
+    @staticmethod
+    def _complete(node: DirUsage) -> None:
+        """Mark a directory done, and its parents once all their subdirectories are"""
+        while node is not None:
+            node.complete = True
+            node = node.parent
+            if node is None:
+                break
+            node.remaining -= 1
+            if node.remaining > 0:
+                break
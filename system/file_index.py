@@ -0,0 +1,312 @@
+"""Locate-style filename index for the Linux TUI Tutorial
+
+The index is a single file holding every path under a root, one per line
+and grouped by directory, followed by a table of the directories with
+their mtimes and the offset of their lines. Queries map the file
+read-only and scan it without decoding anything but the matches: there is
+no n-gram index, so a query costs one pass over the file, tens of
+milliseconds per half a million paths. Rebuilding against the previous
+index only lists directories whose mtime changed; the lines of the others
+are copied over unchanged, like updatedb.
+"""
+
+import fnmatch
+import mmap
+import os
+import re
+import struct
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+
+
+MAGIC = b"LTFI"
+VERSION = 1
+HEADER = struct.Struct("<4sHHQQQ")  # magic, version, root length, path count, directory count, table offset
+DIRECTORY = struct.Struct("<qQIH")  # mtime_ns, lines offset, lines length, path length
+
+# Virtual and runtime filesystems that updatedb also skips
+PRUNE_PATHS = frozenset((b"/proc", b"/sys", b"/dev", b"/run"))
+# Filesystem types whose mounts are skipped wherever they are, like updatedb's PRUNEFS
+PRUNE_FILESYSTEMS = frozenset((
+    "9p", "afs", "autofs", "binfmt_misc", "bpf", "ceph", "cgroup", "cgroup2", "cifs", "configfs", "debugfs",
+    "devpts", "devtmpfs", "fusectl", "glusterfs", "hugetlbfs", "iso9660", "lustre", "mqueue", "nfs", "nfs4",
+    "nfsd", "proc", "pstore", "ramfs", "rpc_pipefs", "securityfs", "smb3", "smbfs", "sshfs", "sysfs", "tmpfs",
+    "tracefs", "udf",
+))
+WILDCARDS = re.compile(r"\*|\?|\[[^\]]*\]")
+
+# A directory's listing: (mtime_ns, lines, subdirectory paths, reused from the previous index)
+Listing = Tuple[int, bytes, List[bytes], bool]
+
+
+def pruned_mounts(mountinfo: str = "/proc/self/mountinfo") -> FrozenSet[bytes]:
+    """Mount points of network, virtual and in-memory filesystems, which are not indexed"""
+    mounts = set()
+    try:
+        with open(mountinfo, "rb") as lines:
+            for line in lines:
+                # ... mount-point ... - fstype source options
+                fields, _, filesystem = line.partition(b" - ")
+                fstype = filesystem.split(b" ", 1)[0].decode("ascii", "replace")
+                if fstype in PRUNE_FILESYSTEMS or fstype.startswith("fuse."):
+                    # Spaces and the like are octal escapes, as in \040
+                    mounts.add(re.sub(rb"\\([0-7]{3})", lambda match: bytes((int(match[1], 8),)), fields.split()[4]))
+    except OSError:
+        pass
+    return frozenset(mounts)
+
+
+def default_index_path() -> str:
+    """Per-user location of the index"""
+    cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache, "linux-tutorial", "files.idx")
+
+
+class FileIndexError(Exception):
+    """Raised when an index file is malformed"""
+
+
+@dataclass
+class IndexStats:
+    """Data class for what one index build did"""
+    paths: int = 0
+    directories: int = 0
+    reused: int = 0
+    errors: int = 0
+    elapsed: float = 0.0
+    cancelled: bool = False
+
+
+class FileIndex:
+    """Read-only view over a memory-mapped filename index"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as index_file:
+            self.built = os.fstat(index_file.fileno()).st_mtime
+            try:
+                self._map = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as error:
+                # An empty file cannot be mapped
+                raise FileIndexError(f"{path}: {error}") from error
+        if len(self._map) < HEADER.size:
+            raise FileIndexError(f"{path}: truncated header")
+        magic, version, root_length, self.count, self.directory_count, self._table = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise FileIndexError(f"{path}: unsupported index format")
+        self._start = HEADER.size + root_length
+        if not self._start <= self._table <= len(self._map):
+            raise FileIndexError(f"{path}: directory table out of bounds")
+        self.root = self._map[HEADER.size:self._start].decode("utf-8", "surrogateescape")
+
+    def directories(self) -> Dict[bytes, Tuple[int, int, int]]:
+        """Map each indexed directory to its (mtime_ns, lines offset, lines length)"""
+        table = {}
+        position = self._table
+        for _ in range(self.directory_count):
+            if position + DIRECTORY.size > len(self._map):
+                raise FileIndexError(f"{self.path}: truncated directory table")
+            mtime, offset, length, path_length = DIRECTORY.unpack_from(self._map, position)
+            position += DIRECTORY.size
+            if position + path_length > len(self._map) or not self._start <= offset <= offset + length <= self._table:
+                raise FileIndexError(f"{self.path}: directory entry out of bounds")
+            table[self._map[position:position + path_length]] = (mtime, offset, length)
+            position += path_length
+        return table
+
+    def lines(self, offset: int, length: int) -> bytes:
+        """Get a directory's lines, to reuse in a rebuild"""
+        return self._map[offset:offset + length]
+
+    def search(self, query: str, limit: int = 200) -> List[str]:
+        """Find paths containing a substring, or matching a glob over the whole path
+
+        Directories are listed with a trailing "/". A glob that starts with
+        its longest literal part (/usr/lib/*.so) can only match lines that
+        start with it, and is searched for in one regular expression pass;
+        other globs are narrowed to lines containing their longest literal
+        part before the pattern is applied.
+        """
+        if WILDCARDS.search(query):
+            literals = WILDCARDS.split(query)
+            literal = max(literals, key=len)
+            if literals[0] and len(literals[0]) >= len(literal):
+                try:
+                    return self._search_anchored(query, limit)
+                except re.error:
+                    # An empty range, such as [z-a]; fnmatch drops those
+                    pass
+            pattern = re.compile(fnmatch.translate(query).encode("utf-8", "surrogateescape"))
+        else:
+            pattern = None
+            literal = query
+        needle = literal.encode("utf-8", "surrogateescape")
+        data, start, end = self._map, self._start, self._table
+        results: List[str] = []
+        position = start
+        while len(results) < limit:
+            hit = data.find(needle, position, end)
+            if hit < 0:
+                break
+            line_start = data.rfind(b"\n", start, hit) + 1 or start
+            line_end = data.find(b"\n", hit, end)
+            line = data[line_start:line_end]
+            # Directories match a glob with or without their trailing "/"
+            if pattern is None or pattern.match(line) or pattern.match(line.rstrip(b"/")):
+                results.append(line.decode("utf-8", "replace"))
+            position = line_end + 1
+        return results
+
+    def _search_anchored(self, query: str, limit: int) -> List[str]:
+        """Find paths matching a glob that starts with a literal, letting re find the line starts"""
+        body = _line_pattern(query).encode("utf-8", "surrogateescape") + b"/?$"
+        data, start, end = self._map, self._start, self._table
+        results: List[str] = []
+        # The first line follows the root rather than a newline
+        first = re.compile(body, re.M).match(data, start, end)
+        if first is not None:
+            results.append(first[0].decode("utf-8", "replace"))
+        for match in re.compile(b"\n" + body, re.M).finditer(data, start, end):
+            if len(results) >= limit:
+                break
+            results.append(match[0][1:].decode("utf-8", "replace"))
+        return results[:limit]
+
+    def close(self) -> None:
+        """Unmap the index file"""
+        self._map.close()
+
+
+def build_index(
+    root: str,
+    path: str,
+    previous: Optional[FileIndex] = None,
+    workers: Optional[int] = None,
+    cancelled: Callable[[], bool] = lambda: False,
+) -> IndexStats:
+    """Index every path under root into a file, reusing unchanged directories of a previous index
+
+    Directories are read on a thread pool, and the calling thread appends
+    each listing to a temporary file of its own that replaces the index when
+    done, so open FileIndex views keep a consistent mapping of the old one
+    and concurrent builds do not mix their output. A malformed previous
+    index is ignored and everything is listed again.
+    """
+    started = time.perf_counter()
+    stats = IndexStats()
+    root_bytes = os.fsencode(os.path.abspath(root))
+    # The root itself is indexed even if it is on one of these filesystems
+    pruned = (PRUNE_PATHS | pruned_mounts()) - {root_bytes}
+    known: Dict[bytes, Tuple[int, int, int]] = {}
+    if previous is not None and os.fsencode(previous.root) == root_bytes:
+        try:
+            known = previous.directories()
+        except FileIndexError:
+            previous = None
+    workers = workers or min(32, (os.cpu_count() or 1) * 4)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_fd, tmp_path = tempfile.mkstemp(prefix=".files-", suffix=".tmp", dir=os.path.dirname(path))
+    table: List[bytes] = []
+    try:
+        with os.fdopen(tmp_fd, "wb") as index_file:
+            index_file.write(HEADER.pack(MAGIC, VERSION, len(root_bytes), 0, 0, 0))
+            index_file.write(root_bytes)
+            offset = HEADER.size + len(root_bytes)
+            waiting: List[bytes] = [root_bytes]
+            running: Dict[Future, bytes] = {}
+            with ThreadPoolExecutor(workers, thread_name_prefix="file-index") as pool:
+                while waiting or running:
+                    if cancelled():
+                        stats.cancelled = True
+                        break
+                    while waiting and len(running) < workers * 4:
+                        directory = waiting.pop()
+                        running[pool.submit(_list_directory, directory, known.get(directory), previous)] = directory
+                    done, _ = wait(running, timeout=0.1, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        directory = running.pop(future)
+                        try:
+                            mtime, lines, subdirs, reused = future.result()
+                        except OSError:
+                            stats.errors += 1
+                            continue
+                        index_file.write(lines)
+                        table.append(DIRECTORY.pack(mtime, offset, len(lines), len(directory)) + directory)
+                        offset += len(lines)
+                        waiting.extend(subdir for subdir in subdirs if subdir not in pruned)
+                        stats.directories += 1
+                        stats.reused += reused
+                        stats.paths += lines.count(b"\n")
+            if not stats.cancelled:
+                index_file.writelines(table)
+                index_file.seek(0)
+                index_file.write(HEADER.pack(MAGIC, VERSION, len(root_bytes), stats.paths, len(table), offset))
+    except BaseException:
+        # Failed part-way: do not leave the partial file behind
+        os.unlink(tmp_path)
+        raise
+    if stats.cancelled:
+        os.unlink(tmp_path)
+    else:
+        os.replace(tmp_path, path)
+    stats.elapsed = time.perf_counter() - started
+    return stats
+
+
+def _line_pattern(glob: str) -> str:
+    """Translate a glob like fnmatch, but with wildcards that stop at the end of a line"""
+    parts: List[str] = []
+    position = 0
+    while position < len(glob):
+        char = glob[position]
+        position += 1
+        if char == "*":
+            parts.append("[^\n]*")
+        elif char == "?":
+            parts.append("[^\n]")
+        elif char == "[":
+            close = position + (glob[position:position + 1] == "!")
+            close = glob.find("]", close + (glob[close:close + 1] == "]"))
+            if close < 0:
+                parts.append("\\[")
+                continue
+            members = glob[position:close]
+            position = close + 1
+            negated = members.startswith("!")
+            members = "".join(member if member == "-" else re.escape(member) for member in members[negated:])
+            parts.append(f"[^\n{members}]" if negated else f"[{members}]")
+        else:
+            parts.append(re.escape(char))
+    return "".join(parts)
+
+
+def _list_directory(
+    directory: bytes,
+    known: Optional[Tuple[int, int, int]],
+    previous: Optional[FileIndex],
+) -> Listing:
+    """Get a directory's lines, from the previous index if its mtime is unchanged (runs in a worker)"""
+    mtime = os.stat(directory, follow_symlinks=False).st_mtime_ns
+    if known is not None and known[0] == mtime:
+        lines = previous.lines(known[1], known[2])
+        return mtime, lines, [line[:-1] for line in lines.split(b"\n") if line.endswith(b"/")], True
+    prefix = directory.rstrip(b"/") + b"/"
+    entries: List[bytes] = []
+    subdirs: List[bytes] = []
+    with os.scandir(directory) as listing:
+        for entry in listing:
+            path = prefix + entry.name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                is_dir = False
+            if is_dir:
+                subdirs.append(path)
+                path += b"/"
+            entries.append(path)
+    entries.sort()
+    return mtime, b"".join(entry + b"\n" for entry in entries), subdirs, False
@@ -0,0 +1,125 @@
+"""Fixed-size metric history for the live panels of the Linux TUI Tutorial"""
+
+from array import array
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional; the array module is used instead
+    numpy = None
+
+
+Series = Sequence[float]
+
+
+def _zeros(length: int) -> Series:
+    """Preallocated float buffer, a NumPy array when available"""
+    if numpy is not None:
+        return numpy.zeros(length)
+    return array("d", bytes(8 * length))
+
+
+class MetricHistory:
+    """Ring buffer of samples for a fixed set of metrics
+
+    All values live in one preallocated float buffer (slot-major, one run of
+    `capacity` per metric) plus a buffer of timestamps, so recording a sample
+    only overwrites existing slots. Reads return the retained samples oldest
+    first. With NumPy installed the buffers are NumPy arrays and reads, rates
+    and downsampling are vectorized; otherwise they use the array module.
+    """
+
+    def __init__(self, names: Iterable[str], capacity: int = 600):
+        self.names: Tuple[str, ...] = tuple(names)
+        self.capacity = capacity
+        self._slots: Dict[str, int] = {name: slot for slot, name in enumerate(self.names)}
+        self._values = _zeros(len(self.names) * capacity)
+        self._times = _zeros(capacity)
+        self._next = 0
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def record(self, timestamp: float, values: Sequence[float]) -> None:
+        """Store one sample, one value per metric in `names` order"""
+        index = self._next
+        self._times[index] = timestamp
+        if numpy is not None:
+            self._values[index::self.capacity] = values
+        else:
+            capacity = self.capacity
+            for slot, value in enumerate(values):
+                self._values[slot * capacity + index] = value
+        self._next = (index + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def times(self) -> Series:
+        """Sample timestamps, oldest first"""
+        return self._ordered(self._times, 0)
+
+    def series(self, name: str) -> Series:
+        """Values of one metric, oldest first"""
+        return self._ordered(self._values, self._slots[name] * self.capacity)
+
+    def rates(self, name: str) -> Series:
+        """Per-second rates of change of a cumulative metric, one per interval"""
+        values, times = self.series(name), self.times()
+        if numpy is not None:
+            elapsed = numpy.diff(times)
+            return numpy.divide(numpy.diff(values), elapsed, out=numpy.zeros(len(elapsed)), where=elapsed > 0)
+        return array("d", (
+            (values[index + 1] - values[index]) / (times[index + 1] - times[index])
+            if times[index + 1] > times[index] else 0.0
+            for index in range(len(values) - 1)
+        ))
+
+    def _ordered(self, buffer: Series, base: int) -> Series:
+        """Copy one run of the buffer out in chronological order"""
+        if self.count < self.capacity:
+            return buffer[base:base + self.count]
+        newer, older = buffer[base:base + self._next], buffer[base + self._next:base + self.capacity]
+        if numpy is not None:
+            return numpy.concatenate((older, newer))
+        return older + newer
+
+
+def lttb(values: Series, threshold: int, times: Optional[Series] = None) -> Series:
+    """Downsample a series to `threshold` points with Largest-Triangle-Three-Buckets
+
+    Keeps the first and last points and, from each bucket in between, the
+    point forming the largest triangle with the previously kept point and
+    the average of the next bucket, which preserves peaks and the overall
+    shape. Sample indexes are used as x when no times are given.
+    """
+    length = len(values)
+    if threshold >= length or threshold < 3:
+        return values
+    if numpy is not None:
+        values = numpy.asarray(values, dtype=float)
+        times = numpy.arange(length, dtype=float) if times is None else numpy.asarray(times, dtype=float)
+    elif times is None:
+        times = range(length)
+    kept = array("d", [values[0]])
+    size = (length - 2) / (threshold - 2)
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, end = int(bucket * size) + 1, int((bucket + 1) * size) + 1
+        next_start, next_end = end, min(int((bucket + 2) * size) + 1, length)
+        count = next_end - next_start
+        average_x = sum(times[next_start:next_end]) / count
+        average_y = sum(values[next_start:next_end]) / count
+        x0, y0 = times[previous], values[previous]
+        if numpy is not None:
+            areas = numpy.abs(
+                (x0 - average_x) * (values[start:end] - y0) - (x0 - times[start:end]) * (average_y - y0)
+            )
+            previous = start + int(numpy.argmax(areas))
+        else:
+            previous = max(
+                range(start, end),
+                key=lambda index: abs((x0 - average_x) * (values[index] - y0) - (x0 - times[index]) * (average_y - y0)),
+            )
+        kept.append(values[previous])
+    kept.append(values[length - 1])
+    return numpy.asarray(kept) if numpy is not None else kept
@@ -0,0 +1,154 @@
+"""Parallel file permission audit for the Linux TUI Tutorial"""
+
+import grp
+import os
+import pwd
+import stat
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from system.file_index import PRUNE_PATHS
+
+
+SUID = "SUID"
+SGID = "SGID"
+WORLD_WRITABLE = "world-writable"
+ORPHANED = "orphaned"
+
+
+@dataclass
+class Finding:
+    """Data class for one audit finding"""
+    issue: str
+    path: str
+    mode: str
+    uid: int
+    gid: int
+
+
+@dataclass
+class AuditStats:
+    """Data class for what one audit did"""
+    directories: int = 0
+    files: int = 0
+    findings: int = 0
+    errors: int = 0
+    elapsed: float = 0.0
+    cancelled: bool = False
+
+
+def check_entry(path: str, info: os.stat_result, uids: FrozenSet[int], gids: FrozenSet[int]) -> List[Finding]:
+    """Findings for one lstat result, like the usual find -perm/-nouser checks"""
+    mode = info.st_mode
+    if stat.S_ISLNK(mode) or (
+        not mode & (stat.S_ISUID | stat.S_ISGID | stat.S_IWOTH) and info.st_uid in uids and info.st_gid in gids
+    ):
+        return []
+    issues = []
+    if stat.S_ISREG(mode):
+        if mode & stat.S_ISUID:
+            issues.append(SUID)
+        if mode & stat.S_ISGID:
+            issues.append(SGID)
+    # Sticky world-writable directories such as /tmp are intended
+    if mode & stat.S_IWOTH and not (stat.S_ISDIR(mode) and mode & stat.S_ISVTX):
+        issues.append(WORLD_WRITABLE)
+    # Owner or group no longer exists (find -nouser -o -nogroup)
+    if info.st_uid not in uids or info.st_gid not in gids:
+        issues.append(ORPHANED)
+    return [Finding(issue, path, stat.filemode(mode), info.st_uid, info.st_gid) for issue in issues]
+
+
+class PermissionAudit:
+    """Checks every file under some roots for risky permissions and ownership
+
+    Flags SUID/SGID regular files, world-writable files and non-sticky
+    world-writable directories, and orphaned files whose owner or group no
+    longer exists. Directories are read with os.scandir on a thread pool and
+    entries are checked from their lstat results; findings are passed to a
+    callback in batches as they are found. Like find -xdev, each root is
+    audited on its own filesystem only, and /proc, /sys, /dev and /run are
+    skipped.
+    """
+
+    # Seconds between batches of findings passed to the callback
+    BATCH_INTERVAL = 0.2
+
+    def __init__(self, roots: Iterable[str], workers: Optional[int] = None):
+        self.roots = [os.path.abspath(root) for root in roots]
+        self.workers = workers or min(32, (os.cpu_count() or 1) * 4)
+
+    def run(
+        self,
+        on_findings: Callable[[List[Finding]], None],
+        cancelled: Callable[[], bool] = lambda: False,
+    ) -> AuditStats:
+        """Audit the roots; blocks until done or cancelled"""
+        started = time.perf_counter()
+        stats = AuditStats()
+        uids = frozenset(user.pw_uid for user in pwd.getpwall())
+        gids = frozenset(group.gr_gid for group in grp.getgrall())
+        prune = {os.fsdecode(path) for path in PRUNE_PATHS}
+        # Directories to read, with the device of the root they belong to
+        waiting: List[Tuple[str, int]] = []
+        for root in self.roots:
+            info = os.lstat(root)
+            findings = check_entry(root, info, uids, gids)
+            if findings:
+                on_findings(findings)
+                stats.findings += len(findings)
+            if stat.S_ISDIR(info.st_mode):
+                waiting.append((root, info.st_dev))
+        running: Dict[Future, Tuple[str, int]] = {}
+        batch: List[Finding] = []
+        flushed = time.monotonic()
+        with ThreadPoolExecutor(self.workers, thread_name_prefix="audit") as pool:
+            while waiting or running:
+                if cancelled():
+                    stats.cancelled = True
+                    break
+                while waiting and len(running) < self.workers * 4:
+                    directory, device = waiting.pop()
+                    running[pool.submit(self._audit_directory, directory, device, uids, gids)] = (directory, device)
+                done, _ = wait(running, timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in done:
+                    _, device = running.pop(future)
+                    stats.directories += 1
+                    try:
+                        findings, subdirs, files = future.result()
+                    except OSError:
+                        stats.errors += 1
+                        continue
+                    batch.extend(findings)
+                    stats.files += files
+                    waiting.extend((subdir, device) for subdir in subdirs if subdir not in prune)
+                if batch and (time.monotonic() - flushed >= self.BATCH_INTERVAL or not (waiting or running)):
+                    on_findings(batch)
+                    stats.findings += len(batch)
+                    batch = []
+                    flushed = time.monotonic()
+        stats.elapsed = time.perf_counter() - started
+        return stats
+
+    @staticmethod
+    def _audit_directory(
+        directory: str, device: int, uids: FrozenSet[int], gids: FrozenSet[int]
+    ) -> Tuple[List[Finding], List[str], int]:
+        """Check one directory's entries (runs in a worker); returns findings, subdirectories and entry count"""
+        findings: List[Finding] = []
+        subdirs: List[str] = []
+        files = 0
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    info = entry.stat(follow_symlinks=False)
+                except OSError:
+                    # Removed while being listed
+                    continue
+                files += 1
+                findings.extend(check_entry(entry.path, info, uids, gids))
+                if stat.S_ISDIR(info.st_mode) and info.st_dev == device:
+                    subdirs.append(entry.path)
+        return findings, subdirs, files
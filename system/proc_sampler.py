@@ -0,0 +1,201 @@
+"""Low-overhead /proc sampling for the Linux TUI Tutorial"""
+
+import os
+import time
+from array import array
+from typing import Dict, Optional, Tuple
+
+
+class ProcFile:
+    """A /proc file kept open and re-read in place
+
+    /proc files regenerate their contents on every read from offset 0, so
+    the descriptor is opened once and read with preadv into a reusable
+    buffer instead of being reopened for each sample. Multi-record files
+    such as /proc/net/tcp return about a page per read whatever the buffer
+    size, so a read continues until the file returns nothing more.
+    """
+
+    def __init__(self, path: str, size: int = 16 * 1024):
+        self.path = path
+        self._fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+        self._buffer = bytearray(size)
+
+    def read(self) -> memoryview:
+        """Read the whole file, growing the buffer if it was too small"""
+        length = 0
+        while True:
+            if length == len(self._buffer):
+                # A new buffer, since views returned by earlier reads may still be held
+                buffer = bytearray(len(self._buffer) * 2)
+                buffer[:length] = self._buffer
+                self._buffer = buffer
+            with memoryview(self._buffer) as view:
+                count = os.preadv(self._fd, [view[length:]], length)
+            if count == 0:
+                return memoryview(self._buffer)[:length]
+            length += count
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class ProcSampler:
+    """Samples CPU, memory and load figures from /proc into fixed arrays
+
+    Every figure lives in a preallocated `array` that each sample
+    overwrites in place; only the transient line splits of the parse are
+    allocated, and nothing accumulates between samples. CPU rows are
+    indexed 0 for the aggregate and n + 1 for cpu n; offline CPUs read 0.
+    """
+
+    CPU_FIELDS = ("user", "nice", "system", "idle", "iowait", "irq", "softirq", "steal")
+    MEMORY_FIELDS = (
+        "MemTotal", "MemFree", "MemAvailable", "Buffers", "Cached",
+        "SwapTotal", "SwapFree", "Dirty",
+    )
+    COUNTER_FIELDS = ("ctxt", "intr", "processes", "procs_running", "procs_blocked")
+    # The leading counter fields are cumulative; the rest are gauges
+    CUMULATIVE_COUNTERS = 3
+
+    def __init__(self, proc_root: str = "/proc"):
+        self._stat = ProcFile(os.path.join(proc_root, "stat"), 64 * 1024)
+        self._meminfo = ProcFile(os.path.join(proc_root, "meminfo"), 8 * 1024)
+        self._loadavg = ProcFile(os.path.join(proc_root, "loadavg"), 256)
+        self._memory_slots: Dict[bytes, int] = {
+            name.encode(): slot for slot, name in enumerate(self.MEMORY_FIELDS)
+        }
+        self._counter_slots: Dict[bytes, int] = {
+            name.encode(): slot for slot, name in enumerate(self.COUNTER_FIELDS)
+        }
+
+        self.cpu_rows = self._count_cpu_rows()
+        width = len(self.CPU_FIELDS)
+        self.cpu_times = array("Q", bytes(8 * self.cpu_rows * width))
+        self._previous_cpu_times = array("Q", bytes(8 * self.cpu_rows * width))
+        # Copied over the reused array before each parse, since offline CPUs have no row
+        self._zero_cpu_times = array("Q", bytes(8 * self.cpu_rows * width))
+        # Busy fraction (0..1) of each CPU row over the last interval
+        self.cpu_usage = array("d", bytes(8 * self.cpu_rows))
+        self.counters = array("Q", bytes(8 * len(self.COUNTER_FIELDS)))
+        self._previous_counters = array("Q", bytes(8 * len(self.COUNTER_FIELDS)))
+        # Per-second rates of the cumulative counters (ctxt, intr, processes)
+        self.counter_rates = array("d", bytes(8 * self.CUMULATIVE_COUNTERS))
+        self.memory = array("Q", bytes(8 * len(self.MEMORY_FIELDS)))  # kB
+        self.load = array("d", bytes(8 * 3))
+        self.timestamp = 0.0
+        self.interval = 0.0
+        self.samples = 0
+        # Time spent sampling, to report the sampler's own overhead
+        self.sample_seconds = 0.0
+
+    def _count_cpu_rows(self) -> int:
+        """Number of CPU rows needed: the aggregate plus the highest CPU id"""
+        highest = -1
+        for line in self._stat.read().tobytes().splitlines():
+            if line.startswith(b"cpu") and line[3:4] != b" ":
+                highest = max(highest, int(line.split(None, 1)[0][3:]))
+        return highest + 2
+
+    @property
+    def cpu_count(self) -> int:
+        return self.cpu_rows - 1
+
+    def sample(self) -> float:
+        """Read all sources once and update the arrays; returns the sample time"""
+        started = time.perf_counter()
+        now = time.monotonic()
+        self._previous_cpu_times, self.cpu_times = self.cpu_times, self._previous_cpu_times
+        self._previous_counters, self.counters = self.counters, self._previous_counters
+        self._read_stat()
+        self._read_meminfo()
+        self._read_loadavg()
+        if self.samples:
+            self.interval = now - self.timestamp
+            self._update_rates()
+        self.timestamp = now
+        self.samples += 1
+        self.sample_seconds += time.perf_counter() - started
+        return now
+
+    def _read_stat(self) -> None:
+        times = self.cpu_times
+        # The swapped-in array holds the sample before last; clear it so missing rows read 0
+        times[:] = self._zero_cpu_times
+        width = len(self.CPU_FIELDS)
+        counter_slots = self._counter_slots
+        for line in self._stat.read().tobytes().split(b"\n"):
+            if line.startswith(b"cpu"):
+                fields = line.split()
+                name = fields[0]
+                row = 0 if len(name) == 3 else int(name[3:]) + 1
+                if row >= self.cpu_rows:
+                    continue
+                base = row * width
+                for column in range(min(width, len(fields) - 1)):
+                    times[base + column] = int(fields[column + 1])
+            else:
+                key, _, rest = line.partition(b" ")
+                slot = counter_slots.get(key)
+                if slot is not None:
+                    # "intr" is followed by per-interrupt counts; keep the total
+                    self.counters[slot] = int(rest.split(None, 1)[0])
+
+    def _read_meminfo(self) -> None:
+        slots = self._memory_slots
+        memory = self.memory
+        for line in self._meminfo.read().tobytes().split(b"\n"):
+            key, _, rest = line.partition(b":")
+            slot = slots.get(key)
+            if slot is not None:
+                memory[slot] = int(rest.split(None, 1)[0])
+
+    def _read_loadavg(self) -> None:
+        fields = self._loadavg.read().tobytes().split(None, 3)
+        for index in range(3):
+            self.load[index] = float(fields[index])
+
+    def _update_rates(self) -> None:
+        width = len(self.CPU_FIELDS)
+        idle, iowait = self.CPU_FIELDS.index("idle"), self.CPU_FIELDS.index("iowait")
+        current, previous = self.cpu_times, self._previous_cpu_times
+        for row in range(self.cpu_rows):
+            base = row * width
+            total = previous_total = 0
+            for column in range(width):
+                total += current[base + column] - previous[base + column]
+                previous_total += previous[base + column]
+            idle_delta = (current[base + idle] - previous[base + idle]
+                          + current[base + iowait] - previous[base + iowait])
+            # A CPU just brought online has no previous times to compare with
+            busy = total > 0 and previous_total > 0
+            self.cpu_usage[row] = (total - idle_delta) / total if busy else 0.0
+        for slot in range(self.CUMULATIVE_COUNTERS):
+            delta = self.counters[slot] - self._previous_counters[slot]
+            self.counter_rates[slot] = delta / self.interval if self.interval > 0 else 0.0
+
+    def memory_kb(self, field: str) -> int:
+        """Get a /proc/meminfo figure in kB"""
+        return self.memory[self.MEMORY_FIELDS.index(field)]
+
+    def counter(self, field: str) -> int:
+        """Get the latest value of a /proc/stat counter"""
+        return self.counters[self.COUNTER_FIELDS.index(field)]
+
+    def rate(self, field: str) -> float:
+        """Get the per-second rate of a cumulative /proc/stat counter"""
+        return self.counter_rates[self.COUNTER_FIELDS.index(field)]
+
+    def overhead(self) -> Tuple[float, Optional[float]]:
+        """Mean seconds per sample, and the CPU share it costs at the current interval"""
+        if not self.samples:
+            return 0.0, None
+        per_sample = self.sample_seconds / self.samples
+        return per_sample, (per_sample / self.interval if self.interval else None)
+
+    def close(self) -> None:
+        """Close the kept /proc descriptors"""
+        for proc_file in (self._stat, self._meminfo, self._loadavg):
+            proc_file.close()
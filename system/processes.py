@@ -0,0 +1,189 @@
+"""Incremental /proc process table for the Linux TUI Tutorial"""
+
+import heapq
+import os
+import pwd
+import time
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Dict, List, Optional, Set
+
+
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+PAGE_KB = os.sysconf("SC_PAGE_SIZE") // 1024
+
+
+class ProcessInfo:
+    """Latest known figures of one process"""
+    __slots__ = (
+        "pid", "ppid", "name", "command", "user", "state", "threads",
+        "start_time", "cpu_ticks", "rss_kb", "cpu", "read_at",
+    )
+
+    def __init__(self, pid: int):
+        self.pid = pid
+        self.ppid = 0
+        self.name = ""
+        self.command = ""
+        self.user = ""
+        self.state = "?"
+        self.threads = 0
+        self.start_time = 0
+        self.cpu_ticks = 0
+        self.rss_kb = 0
+        # Share of one CPU used since the previous read
+        self.cpu = 0.0
+        self.read_at = 0.0
+
+
+@dataclass
+class ScanStats:
+    """Data class for what one scan did"""
+    processes: int = 0
+    new: int = 0
+    exited: int = 0
+    refreshed: int = 0
+    elapsed: float = 0.0
+
+
+class ProcessTable:
+    """Process table kept up to date by incremental scans of /proc
+
+    Each scan lists /proc to find new and exited processes, but only re-reads
+    a bounded number of /proc/<pid>/stat files: new processes, the current
+    top processes and the next slice of a round-robin over the rest. Command
+    lines and owners are read once per process. CPU usage is measured
+    between each process's own consecutive reads, so it stays accurate when
+    a process is refreshed less often than every scan.
+    """
+
+    def __init__(self, proc_root: str = "/proc", budget: int = 4000, hot: int = 200):
+        self.proc_root = proc_root
+        # Maximum stat reads per scan, and how many top processes to always refresh
+        self.budget = budget
+        self.hot = hot
+        self.processes: Dict[int, ProcessInfo] = {}
+        self._round_robin: List[int] = []
+        self._cursor = 0
+        self._users: Dict[int, str] = {}
+
+    def scan(self) -> ScanStats:
+        """Update the table; returns what changed"""
+        started = time.perf_counter()
+        scan_time = time.monotonic()
+        stats = ScanStats()
+        pids: Set[int] = set()
+        new: List[os.DirEntry] = []
+        with os.scandir(self.proc_root) as entries:
+            for entry in entries:
+                if entry.name.isdigit():
+                    pid = int(entry.name)
+                    pids.add(pid)
+                    if pid not in self.processes:
+                        new.append(entry)
+
+        for pid in self.processes.keys() - pids:
+            del self.processes[pid]
+            stats.exited += 1
+
+        reads = 0
+        for entry in new:
+            process = self._add(entry)
+            if process is not None and self._read_stat(process):
+                reads += 1
+                stats.new += 1
+
+        # Always refresh the processes most likely to be on screen
+        for process in heapq.nlargest(self.hot, self.processes.values(), key=attrgetter("cpu")):
+            if process.read_at < scan_time and self._read_stat(process):
+                reads += 1
+
+        # Then as many others as the budget allows, round-robin
+        if self._cursor >= len(self._round_robin):
+            self._round_robin = list(self.processes)
+            self._cursor = 0
+        while reads < self.budget and self._cursor < len(self._round_robin):
+            process = self.processes.get(self._round_robin[self._cursor])
+            self._cursor += 1
+            if process is not None and process.read_at < scan_time and self._read_stat(process):
+                reads += 1
+
+        stats.processes = len(self.processes)
+        stats.refreshed = reads
+        stats.elapsed = time.perf_counter() - started
+        return stats
+
+    def top(self, count: int, key: str = "cpu") -> List[ProcessInfo]:
+        """Get the processes with the highest cpu or rss_kb, using a bounded heap"""
+        return heapq.nlargest(count, self.processes.values(), key=attrgetter(key))
+
+    def _add(self, entry: os.DirEntry) -> Optional[ProcessInfo]:
+        """Register a new process with the figures that do not change"""
+        process = ProcessInfo(int(entry.name))
+        try:
+            process.user = self._user(entry.stat().st_uid)
+            process.command = self._read_command(process.pid)
+        except OSError:
+            # Exited while being read
+            return None
+        self.processes[process.pid] = process
+        return process
+
+    def _read_stat(self, process: ProcessInfo) -> bool:
+        """Re-read a process's /proc/<pid>/stat; False if it has exited"""
+        try:
+            data = self._read(os.path.join(self.proc_root, str(process.pid), "stat"))
+        except OSError:
+            self.processes.pop(process.pid, None)
+            return False
+        # The name is in parentheses and may itself contain spaces or ")"
+        close = data.rfind(b")")
+        fields = data[close + 2:].split()
+        start_time = int(fields[19])
+        now = time.monotonic()
+        cpu_ticks = int(fields[11]) + int(fields[12])
+        if process.read_at and start_time == process.start_time:
+            elapsed = now - process.read_at
+            process.cpu = (cpu_ticks - process.cpu_ticks) / CLOCK_TICKS / elapsed if elapsed > 0 else 0.0
+        else:
+            process.cpu = 0.0
+            if process.read_at:
+                # The pid was reused by a new process since the last read
+                try:
+                    process.command = self._read_command(process.pid)
+                except OSError:
+                    pass
+        process.name = data[data.find(b"(") + 1:close].decode(errors="replace")
+        process.state = fields[0].decode()
+        process.ppid = int(fields[1])
+        process.threads = int(fields[17])
+        process.start_time = start_time
+        process.cpu_ticks = cpu_ticks
+        process.rss_kb = int(fields[21]) * PAGE_KB
+        process.read_at = now
+        return True
+
+    def _read_command(self, pid: int) -> str:
+        """Read a process's command line (empty for kernel threads)"""
+        data = self._read(os.path.join(self.proc_root, str(pid), "cmdline"))
+        return data.replace(b"\0", b" ").strip().decode(errors="replace")
+
+    @staticmethod
+    def _read(path: str) -> bytes:
+        """Read a small /proc file without the overhead of a file object"""
+        fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+        try:
+            return os.read(fd, 64 * 1024)
+        finally:
+            os.close(fd)
+
+    def _user(self, uid: int) -> str:
+        """Get a user name, cached per uid"""
+        user = self._users.get(uid)
+        if user is None:
+            try:
+                user = pwd.getpwuid(uid).pw_name
+            except KeyError:
+                user = str(uid)
+            self._users[uid] = user
+        return user
@@ -0,0 +1,203 @@
+"""Allowlisted command execution with streamed output for the Linux TUI Tutorial"""
+
+import asyncio
+import codecs
+import os
+import shlex
+import signal
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, Optional, Tuple
+
+
+# Exact invocations that only read system state, need no terminal and
+# exit on their own. Commands are matched after shell-style splitting, and
+# are executed directly rather than through a shell.
+ALLOWED_COMMANDS: FrozenSet[str] = frozenset({
+    # System information
+    "uname -r", "uname -a", "uptime", "lscpu", "lsmod", "lspci", "lsusb",
+    "free -h", "free -m", "hostname -i", "getenforce", "sestatus",
+    "cat /proc/cpuinfo", "cat /proc/meminfo", "cat /proc/version",
+    "cat /proc/cmdline", "cat /proc/filesystems", "cat /proc/interrupts",
+    "cat /proc/devices", "cat /proc/mounts", "cat /proc/mdstat",
+    "cat /proc/buddyinfo", "cat /proc/zoneinfo",
+    "sysctl -a", "sysctl kernel.hostname",
+    # Logs
+    "dmesg", "dmesg -T", "journalctl -k",
+    # Processes and users
+    "ps aux", "ps -ef", "pstree", "who", "w", "last",
+    # Monitoring
+    "vmstat -s", "vmstat -m", "vmstat -SM", "vmstat 2 5",
+    "iostat -c", "iostat -d", "iostat 2 5", "iostat -x 1 5", "iostat -x 2 5",
+    "mpstat", "sar -u 2 5",
+    # Storage
+    "df -h", "lsblk", "lsblk -f", "findmnt", "blkid",
+    # Files
+    "pwd", "ls", "ls -l", "ls -la", "ls -lh", "ls -lt", "ls -lS",
+    "cat /etc/hosts", "cat /etc/resolv.conf", "cat /etc/group",
+    # Networking
+    "ss -tuln", "ss -tulpn", "netstat -tuln", "netstat -i",
+    "ip addr show", "ip route show", "ip -s link", "ifconfig",
+    "nmcli device status", "nmcli connection show",
+    # Containers and virtual machines
+    "docker ps -a", "docker images", "docker stats --no-stream",
+    "virsh list --all", "virsh net-list --all",
+})
+
+
+class CommandNotAllowedError(ValueError):
+    """Raised when a command is not on the allowlist"""
+
+    def __init__(self, command: str):
+        super().__init__(f"Command is not allowed: {command!r}")
+        self.command = command
+
+
+def split_command(command: str) -> Tuple[str, ...]:
+    """Split a command line into arguments, or return () if it cannot be parsed"""
+    try:
+        return tuple(shlex.split(command))
+    except ValueError:
+        return ()
+
+
+_ALLOWED_ARGV = frozenset(split_command(command) for command in ALLOWED_COMMANDS)
+
+# Documented commands that report until interrupted, and the bounded
+# invocation run in their place: five reports, or a single snapshot
+BOUNDED_COMMANDS: Dict[Tuple[str, ...], str] = {
+    split_command(command): bounded for command, bounded in (
+        ("vmstat 2", "vmstat 2 5"),
+        ("iostat 2", "iostat 2 5"),
+        ("iostat -x 1", "iostat -x 1 5"),
+        ("iostat -x 2", "iostat -x 2 5"),
+        ("docker stats", "docker stats --no-stream"),
+    )
+}
+
+
+def is_allowed(command: str) -> bool:
+    """Whether a command line is on the allowlist"""
+    return split_command(command) in _ALLOWED_ARGV
+
+
+def runnable_command(command: str) -> Optional[str]:
+    """The allowlisted invocation to run for a documented command, or None"""
+    command = BOUNDED_COMMANDS.get(split_command(command), command)
+    return command if is_allowed(command) else None
+
+
+@dataclass
+class RunResult:
+    """Data class for how a command run ended"""
+    command: str
+    returncode: Optional[int] = None
+    elapsed: float = 0.0
+    output_bytes: int = 0
+    timed_out: bool = False
+    truncated: bool = False
+    cancelled: bool = False
+    error: str = ""
+
+    @property
+    def status(self) -> str:
+        """Short description of the outcome"""
+        if self.error:
+            return self.error
+        if self.cancelled:
+            return "cancelled"
+        if self.timed_out:
+            return f"timed out after {self.elapsed:.0f}s"
+        if self.truncated:
+            return "stopped at the output limit"
+        return f"exit {self.returncode}"
+
+
+class CommandRunner:
+    """Runs one allowlisted command and streams its output as it arrives
+
+    stdout and stderr share one pipe so their lines keep the order a
+    terminal would show. Output is decoded incrementally and handed to
+    `on_output` chunk by chunk; nothing is buffered beyond one read. The
+    process runs in its own session so a timeout, the output cap or a
+    cancellation stops the whole process group.
+    """
+
+    READ_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        command: str,
+        on_output: Callable[[str], None],
+        timeout: float = 30.0,
+        max_output: int = 4 * 1024 * 1024,
+    ):
+        if not is_allowed(command):
+            raise CommandNotAllowedError(command)
+        self.command = command
+        self.argv = split_command(command)
+        self.on_output = on_output
+        self.timeout = timeout
+        self.max_output = max_output
+        self._process: Optional[asyncio.subprocess.Process] = None
+
+    async def run(self) -> RunResult:
+        """Run the command to completion, timeout, output cap or cancellation"""
+        result = RunResult(self.command)
+        started = time.monotonic()
+        try:
+            self._process = await asyncio.create_subprocess_exec(
+                *self.argv,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                start_new_session=True,
+            )
+        except OSError as error:
+            result.error = error.strerror or str(error)
+            return result
+        try:
+            await asyncio.wait_for(self._stream(result), self.timeout)
+        except asyncio.TimeoutError:
+            result.timed_out = True
+        except asyncio.CancelledError:
+            result.cancelled = True
+            self._kill()
+            raise
+        finally:
+            if result.timed_out or result.truncated:
+                self._kill()
+            result.elapsed = time.monotonic() - started
+        result.returncode = await self._process.wait()
+        return result
+
+    async def _stream(self, result: RunResult) -> None:
+        """Forward output until the pipe closes or the output cap is reached"""
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        stdout = self._process.stdout
+        while True:
+            data = await stdout.read(self.READ_SIZE)
+            if not data:
+                break
+            remaining = self.max_output - result.output_bytes
+            if len(data) >= remaining:
+                data = data[:remaining]
+                result.truncated = True
+            result.output_bytes += len(data)
+            text = decoder.decode(data)
+            if text:
+                self.on_output(text)
+            if result.truncated:
+                return
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            self.on_output(tail)
+
+    def _kill(self) -> None:
+        """Stop the command and anything it started"""
+        if self._process is None or self._process.returncode is not None:
+            return
+        try:
+            os.killpg(self._process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
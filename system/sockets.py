@@ -0,0 +1,287 @@
+"""Socket table from /proc/net for the Linux TUI Tutorial"""
+
+import os
+import socket
+import time
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from system.proc_sampler import ProcFile
+
+
+# Protocols in column order; the value is the /proc/net file
+PROTOCOLS = ("tcp", "tcp6", "udp", "udp6", "unix")
+TCP_STATES = (
+    "", "ESTAB", "SYN-SENT", "SYN-RECV", "FIN-WAIT-1", "FIN-WAIT-2", "TIME-WAIT",
+    "UNCONN", "CLOSE-WAIT", "LAST-ACK", "LISTEN", "CLOSING", "NEW-SYN-RECV",
+)
+LISTEN = TCP_STATES.index("LISTEN")
+# /proc/net/unix states (unconnected, connecting, connected, disconnecting) as TCP states
+UNIX_STATES = {1: 7, 2: 2, 3: 1, 4: 4}
+# Listening unix sockets are unconnected with the __SO_ACCEPTCON flag
+UNIX_LISTEN_FLAG = 0x10000
+
+
+@dataclass
+class SocketSnapshot:
+    """Column arrays of all sockets from one parse of /proc/net"""
+    protocols: array = field(default_factory=lambda: array("B"))
+    states: array = field(default_factory=lambda: array("B"))
+    local_ports: array = field(default_factory=lambda: array("H"))
+    remote_ports: array = field(default_factory=lambda: array("H"))
+    inodes: array = field(default_factory=lambda: array("Q"))
+    # Raw hex addresses (or unix paths), decoded only for displayed rows
+    local_addresses: List[bytes] = field(default_factory=list)
+    remote_addresses: List[bytes] = field(default_factory=list)
+    # Number of sockets in each state, counted once per snapshot
+    counts: Dict[str, int] = field(default_factory=dict)
+    taken_at: float = 0.0
+
+    def __len__(self) -> int:
+        return len(self.inodes)
+
+    def select(
+        self,
+        protocols: Optional[Set[int]] = None,
+        states: Optional[Set[int]] = None,
+        port: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[int]:
+        """Row numbers matching every given filter (a port matches either end)"""
+        rows: List[int] = []
+        local_ports, remote_ports = self.local_ports, self.remote_ports
+        for row, (protocol, state) in enumerate(zip(self.protocols, self.states)):
+            if protocols is not None and protocol not in protocols:
+                continue
+            if states is not None and state not in states:
+                continue
+            if port is not None and local_ports[row] != port and remote_ports[row] != port:
+                continue
+            rows.append(row)
+            if limit is not None and len(rows) >= limit:
+                break
+        return rows
+
+    def count_states(self) -> None:
+        """Fill in the number of sockets in each state"""
+        counts = [0] * len(TCP_STATES)
+        for state in self.states:
+            counts[state] += 1
+        self.counts = {TCP_STATES[state]: count for state, count in enumerate(counts) if count}
+
+    def address(self, row: int, remote: bool = False) -> str:
+        """Printable address:port of one end of a socket"""
+        raw = self.remote_addresses[row] if remote else self.local_addresses[row]
+        protocol = PROTOCOLS[self.protocols[row]]
+        if protocol == "unix":
+            return raw.decode(errors="replace") or "*"
+        port = self.remote_ports[row] if remote else self.local_ports[row]
+        host = bytes.fromhex(raw.decode())
+        if protocol.endswith("6"):
+            # Four host-order 32-bit words
+            host = b"".join(host[index:index + 4][::-1] for index in range(0, 16, 4))
+            text = f"[{socket.inet_ntop(socket.AF_INET6, host)}]"
+        else:
+            text = socket.inet_ntop(socket.AF_INET, host[::-1])
+        return f"{text}:{port or '*'}"
+
+
+@dataclass
+class SocketStats:
+    """Data class for what one refresh did"""
+    sockets: int = 0
+    owned: int = 0
+    fds_read: int = 0
+    parse_seconds: float = 0.0
+    owner_seconds: float = 0.0
+
+
+class SocketOwners:
+    """Index from socket inode to the owning process, built from /proc/<pid>/fd
+
+    Each process's fd links are read once and remembered; later refreshes
+    list a process's fd directory and only read the links of fd numbers not
+    seen before. An fd whose socket is gone from /proc/net may have been
+    reused, so it is forgotten and read again. New processes are listed
+    first; while some sockets are unresolved, the rest are listed
+    round-robin within a budget, and their fds last seen holding something
+    other than a socket are read again too, since a closed file's fd number
+    may now hold one of the new sockets. Sockets still unresolved after a
+    full pass (held by processes whose fds cannot be read, say) are not
+    looked for again.
+    """
+
+    def __init__(self, proc_root: str = "/proc", budget: int = 2000):
+        self.proc_root = proc_root
+        self.budget = budget
+        self.owners: Dict[int, int] = {}  # inode -> pid
+        self.names: Dict[int, str] = {}
+        # pid -> {fd number: socket inode}; 0 for fds that are not sockets
+        self._fds: Dict[int, Dict[str, int]] = {}
+        self._round_robin: List[int] = []
+        self._cursor = 0
+        # Sockets unresolved when the current pass began, and after a whole pass
+        self._pass_unknown: Set[int] = set()
+        self._unresolvable: Set[int] = set()
+
+    def refresh(self, inodes: Iterable[int]) -> int:
+        """Update the index for the current sockets; returns the number of fd links read"""
+        live: Set[int] = set(inodes)
+        # Sockets without an owner (TIME-WAIT, for one) have inode 0
+        live.discard(0)
+        pids = {int(name) for name in os.listdir(self.proc_root) if name.isdigit()}
+        for pid in self._fds.keys() - pids:
+            for inode in self._fds.pop(pid).values():
+                if self.owners.get(inode) == pid:
+                    del self.owners[inode]
+            self.names.pop(pid, None)
+        # Forget sockets that have closed, and the fds that held them
+        for inode in [inode for inode in self.owners if inode not in live]:
+            fds = self._fds.get(self.owners.pop(inode))
+            if fds is not None:
+                for fd in [fd for fd, fd_inode in fds.items() if fd_inode == inode]:
+                    del fds[fd]
+
+        reads = 0
+        listed = 0
+        for pid in pids - self._fds.keys():
+            reads += self._list_fds(pid)
+            listed += 1
+        self._unresolvable &= live
+        unknown = {inode for inode in live if inode not in self.owners and inode not in self._unresolvable}
+        if unknown:
+            # Unknown sockets: some process opened new ones; continue the round-robin
+            if self._cursor >= len(self._round_robin):
+                self._round_robin = sorted(self._fds)
+                self._cursor = 0
+                self._pass_unknown = unknown
+            while listed < self.budget and self._cursor < len(self._round_robin):
+                reads += self._list_fds(self._round_robin[self._cursor], recheck=True)
+                self._cursor += 1
+                listed += 1
+            if self._cursor >= len(self._round_robin):
+                # Every process was listed since these were first missing
+                self._unresolvable |= {inode for inode in self._pass_unknown if inode not in self.owners}
+        return reads
+
+    def _list_fds(self, pid: int, recheck: bool = False) -> int:
+        """List one process's fds and read the links of new fd numbers (and non-socket ones, to recheck)"""
+        fd_dir = os.path.join(self.proc_root, str(pid), "fd")
+        fds = self._fds.setdefault(pid, {})
+        try:
+            names = os.listdir(fd_dir)
+        except OSError:
+            # Exited, or not ours to inspect
+            return 0
+        if pid not in self.names:
+            try:
+                with open(os.path.join(self.proc_root, str(pid), "comm"), "rb") as comm:
+                    self.names[pid] = comm.read().strip().decode(errors="replace")
+            except OSError:
+                self.names[pid] = ""
+        reads = 0
+        for name in fds.keys() - set(names):
+            del fds[name]
+        for name in names:
+            # Skip known sockets, and known non-sockets unless rechecking
+            if name in fds and (fds[name] or not recheck):
+                continue
+            try:
+                target = os.readlink(os.path.join(fd_dir, name))
+            except OSError:
+                continue
+            reads += 1
+            inode = int(target[8:-1]) if target.startswith("socket:[") else 0
+            fds[name] = inode
+            if inode:
+                self.owners[inode] = pid
+        return reads
+
+
+class SocketTable:
+    """Parses /proc/net socket tables in bulk into column arrays
+
+    The files are kept open and re-read with preadv (see ProcFile). Each
+    refresh produces a new SocketSnapshot of parallel arrays, so filtering
+    by protocol, state or port only walks the arrays, and addresses are
+    decoded only for the rows displayed.
+    """
+
+    def __init__(self, proc_root: str = "/proc"):
+        self._files: List[Tuple[int, ProcFile]] = []
+        for protocol, name in enumerate(PROTOCOLS):
+            try:
+                self._files.append((protocol, ProcFile(os.path.join(proc_root, "net", name), 256 * 1024)))
+            except OSError:
+                # No IPv6, for example
+                continue
+        self.owners = SocketOwners(proc_root)
+        self.snapshot = SocketSnapshot()
+
+    def refresh(self) -> SocketStats:
+        """Re-read every table and update socket owners"""
+        stats = SocketStats()
+        started = time.perf_counter()
+        snapshot = SocketSnapshot(taken_at=time.monotonic())
+        for protocol, proc_file in self._files:
+            data = proc_file.read().tobytes()
+            if PROTOCOLS[protocol] == "unix":
+                self._parse_unix(data, protocol, snapshot)
+            else:
+                self._parse_inet(data, protocol, snapshot)
+        snapshot.count_states()
+        stats.parse_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        stats.fds_read = self.owners.refresh(snapshot.inodes)
+        stats.owner_seconds = time.perf_counter() - started
+        stats.sockets = len(snapshot)
+        stats.owned = sum(1 for inode in snapshot.inodes if inode in self.owners.owners)
+        self.snapshot = snapshot
+        return stats
+
+    def owner(self, inode: int) -> str:
+        """pid/name of the process owning a socket, if known"""
+        pid = self.owners.owners.get(inode)
+        if pid is None:
+            return ""
+        return f"{pid}/{self.owners.names.get(pid, '')}"
+
+    @staticmethod
+    def _parse_inet(data: bytes, protocol: int, snapshot: SocketSnapshot) -> None:
+        """Parse a tcp/udp table: sl local remote st queues tr retrnsmt uid timeout inode ..."""
+        protocols, states = snapshot.protocols, snapshot.states
+        local_ports, remote_ports, inodes = snapshot.local_ports, snapshot.remote_ports, snapshot.inodes
+        local_addresses, remote_addresses = snapshot.local_addresses, snapshot.remote_addresses
+        for line in data.split(b"\n")[1:]:
+            fields = line.split(None, 10)
+            if len(fields) < 10:
+                continue
+            local, remote = fields[1], fields[2]
+            protocols.append(protocol)
+            # UDP uses 07 (UNCONN) and 01 (connected) from the same numbering
+            states.append(int(fields[3], 16))
+            local_addresses.append(local[:-5])
+            local_ports.append(int(local[-4:], 16))
+            remote_addresses.append(remote[:-5])
+            remote_ports.append(int(remote[-4:], 16))
+            inodes.append(int(fields[9]))
+
+    @staticmethod
+    def _parse_unix(data: bytes, protocol: int, snapshot: SocketSnapshot) -> None:
+        """Parse /proc/net/unix: Num RefCount Protocol Flags Type St Inode [Path]"""
+        for line in data.split(b"\n")[1:]:
+            fields = line.split(None, 7)
+            if len(fields) < 7:
+                continue
+            if int(fields[3], 16) & UNIX_LISTEN_FLAG:
+                state = LISTEN
+            else:
+                state = UNIX_STATES.get(int(fields[5], 16), 0)
+            snapshot.protocols.append(protocol)
+            snapshot.states.append(state)
+            snapshot.local_addresses.append(fields[7] if len(fields) > 7 else b"")
+            snapshot.local_ports.append(0)
+            snapshot.remote_addresses.append(b"")
+            snapshot.remote_ports.append(0)
+            snapshot.inodes.append(int(fields[6]))